@@ -29,6 +29,16 @@ from cronboard.services.messages import CronJobDeleted
 from cronboard.services.logging.logger import delete_logs_for_identificator
 from cronboard.screens.CronDeleteConfirmation import CronDeleteConfirmation
 from cronboard.screens.CronServers import CronServers
+from cronboard.screens.CronSystemView import CronSystemView
+from cronboard.services import remote
+from cronboard.services.remote import remote_executor
+from cronboard.services.ssh_pool import (
+    SSH_KEEPALIVE_INTERVAL,
+    SSH_POOL_IDLE_TTL,
+    SSH_POOL_MAX_SESSIONS,
+    SSH_POOL_PRUNE_INTERVAL,
+    SSHSessionPool,
+)
 
 
 def is_form_element(element):
@@ -78,13 +88,32 @@ class CronBoard(App):
         yield self.content_container
 
     @on(CronJobDeleted)
-    def _on_cron_job_deleted(self, event: CronJobDeleted) -> None:
-        delete_logs_for_identificator(event.identificator, event.ssh_client)
+    async def _on_cron_job_deleted(self, event: CronJobDeleted) -> None:
+        try:
+            await remote.call(
+                event.ssh_client,
+                delete_logs_for_identificator,
+                event.identificator,
+                event.ssh_client,
+            )
+        except Exception as e:
+            self.notify(f"Could not delete the job's logs: {e}", severity="error")
 
     def on_mount(self) -> None:
         config = self.load_config()
         saved_theme = config.get("theme", "catppuccin-mocha")
         self.theme = saved_theme
+        pool_config = config.get("ssh_pool", {})
+        self.ssh_pool = SSHSessionPool(
+            idle_ttl=float(pool_config.get("idle_ttl", SSH_POOL_IDLE_TTL)),
+            max_sessions=int(pool_config.get("max_sessions", SSH_POOL_MAX_SESSIONS)),
+            keepalive=int(pool_config.get("keepalive", SSH_KEEPALIVE_INTERVAL)),
+        )
+        # Dropped sessions are re-established in place and their calls replayed.
+        remote_executor.reconnector = self.ssh_pool.reconnect
+        self.set_interval(
+            SSH_POOL_PRUNE_INTERVAL, self.ssh_pool.prune, name="ssh-pool-prune"
+        )
         self.servers = None
         self.local_table = CronTable(id="local-crontable")
         self.content_container.mount(self.local_table)
@@ -92,6 +121,11 @@ class CronBoard(App):
         self.set_focus(self.local_table)
         self.tab_disabled = False
 
+    def on_unmount(self) -> None:
+        remote_executor.reconnector = None
+        self.ssh_pool.close_all()
+        remote_executor.shutdown()
+
     def load_config(self):
         if self.config_path.exists():
             try:
@@ -104,8 +138,10 @@ class CronBoard(App):
     def watch_theme(self, theme: str):
         try:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
+            config = self.load_config()
+            config["theme"] = theme
             with self.config_path.open("w") as f:
-                f.write(tomlkit.dumps({"theme": theme}))
+                f.write(tomlkit.dumps(config))
         except Exception as e:
             print(f"Warning: Failed to save theme: {e}")
 
@@ -123,7 +159,7 @@ class CronBoard(App):
                 self.servers.display = False
         elif index == 1:
             if not self.servers:
-                self.servers = CronServers()
+                self.servers = CronServers(ssh_pool=self.ssh_pool)
                 self.content_container.mount(self.servers)
             self.local_table.display = False
             self.servers.display = True
@@ -170,21 +206,24 @@ class CronBoard(App):
                 self.servers.focus_tree()
 
     def action_create_cronjob(
-        self, cron: CronTab, remote=False, ssh_client=None, crontab_user=None
+        self,
+        cron: CronTab,
+        remote=False,
+        ssh_client=None,
+        crontab_user=None,
+        job_index=None,
     ) -> None:
         def check_save(save: bool | None) -> None:
             if save:
-                self.local_table.action_refresh()
-                if (
-                    self.servers
-                    and hasattr(self.servers, "current_cron_table")
-                    and self.servers.current_cron_table
-                ):
-                    self.servers.current_cron_table.action_refresh()
+                self.reload_after_write(remote)
 
         self.push_screen(
             CronCreator(
-                cron, remote=remote, ssh_client=ssh_client, crontab_user=crontab_user
+                cron,
+                remote=remote,
+                ssh_client=ssh_client,
+                crontab_user=crontab_user,
+                job_index=job_index,
             ),
             check_save,
         )
@@ -194,13 +233,7 @@ class CronBoard(App):
     ) -> None:
         def check_delete(deleted: bool | None) -> None:
             if deleted:
-                self.local_table.action_refresh()
-                if (
-                    self.servers
-                    and hasattr(self.servers, "current_cron_table")
-                    and self.servers.current_cron_table
-                ):
-                    self.servers.current_cron_table.action_refresh()
+                self.reload_after_write(remote)
 
         self.push_screen(
             CronDeleteConfirmation(
@@ -222,16 +255,11 @@ class CronBoard(App):
         remote=False,
         ssh_client=None,
         crontab_user=None,
+        job_index=None,
     ) -> None:
         def check_save(save: bool | None) -> None:
             if save:
-                self.local_table.action_refresh()
-                if (
-                    self.servers
-                    and hasattr(self.servers, "current_cron_table")
-                    and self.servers.current_cron_table
-                ):
-                    self.servers.current_cron_table.action_refresh()
+                self.reload_after_write(remote)
 
         self.push_screen(
             CronCreator(
@@ -242,10 +270,25 @@ class CronBoard(App):
                 remote=remote,
                 ssh_client=ssh_client,
                 crontab_user=crontab_user,
+                job_index=job_index,
             ),
             check_save,
         )
 
+    def reload_after_write(self, remote: bool) -> None:
+        """Show a saved change in the table whose crontab was written."""
+        if not remote:
+            self.local_table.action_refresh()
+        elif (
+            self.servers
+            and hasattr(self.servers, "current_cron_table")
+            and self.servers.current_cron_table
+        ):
+            self.servers.current_cron_table.reload_after_write()
+
+    def action_view_system_crontabs(self, ssh_client=None) -> None:
+        self.push_screen(CronSystemView(ssh_client=ssh_client))
+
     def get_version(self):
         try:
             return version("cronboard")
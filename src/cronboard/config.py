@@ -8,3 +8,5 @@ CONFIG_FILE = CONFIG_DIR / "servers.toml"
 KEY_FILE = CONFIG_DIR / "secret.key"
 LOG_DIR = CONFIG_DIR / "logs"
 WRAPPER_SOURCE = Path(__file__).parent / "logging" / "cron-wrapper.sh"
+RETENTION_DIST = "retention.conf"
+RETENTION_FILE = CONFIG_DIR / RETENTION_DIST
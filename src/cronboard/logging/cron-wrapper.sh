@@ -3,6 +3,70 @@
 set -o pipefail
 
 LOG_DIR="${CRONBOARD_LOG_DIR:-$HOME/.config/cronboard/logs}"
+RETENTION_FILE="${CRONBOARD_RETENTION_FILE:-$HOME/.config/cronboard/retention.conf}"
+
+# Print "max_count max_age_days compress_after_days" for a job, from its own
+# line in the retention file or else the "*" line; "-" leaves a limit unset.
+retention_policy() {
+  [ -f "$RETENTION_FILE" ] || return 0
+  awk -v job="$1" '
+    /^[[:space:]]*(#|$)/ { next }
+    $1 == job { print $2, $3, $4; found = 1; exit }
+    $1 == "*" { fallback = $2 " " $3 " " $4 }
+    END { if (!found && fallback != "") print fallback }
+  ' "$RETENTION_FILE"
+}
+
+is_count() {
+  case "$1" in
+    '' | *[!0-9]*) return 1 ;;
+  esac
+}
+
+# The timestamp the wrapper puts after the job ID in every log name.
+STAMP_GLOB='[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]_[0-9][0-9]-[0-9][0-9]-[0-9][0-9]'
+
+# The job ID with glob characters escaped, for find -name.
+escape_glob() {
+  printf '%s' "$1" | sed 's/[][*?\\]/\\&/g'
+}
+
+# Compress, expire and cap the logs of one job as its retention policy says.
+# Names are matched up to the timestamp, so the policy of "backup" leaves the
+# logs of "backup_daily" alone.
+enforce_retention() {
+  policy=$(retention_policy "$1")
+  [ -n "$policy" ] || return 0
+  name="$(escape_glob "$1")_$STAMP_GLOB"
+  # shellcheck disable=SC2086
+  set -- "$1" $policy
+  if is_count "$4" && [ "$4" -gt 0 ]; then
+    find "$LOG_DIR" -maxdepth 1 -type f -name "$name.log" \
+      -mmin +$(($4 * 1440)) -exec gzip -f {} \; 2>/dev/null
+  fi
+  if is_count "$3" && [ "$3" -gt 0 ]; then
+    find "$LOG_DIR" -maxdepth 1 -type f \( -name "$name.log" -o -name "$name.log.gz" \) \
+      -mmin +$(($3 * 1440)) -exec rm -f {} \; 2>/dev/null
+  fi
+  if is_count "$2" && [ "$2" -gt 0 ]; then
+    # The quoted ID is taken literally; only the timestamp is a glob here.
+    # shellcheck disable=SC2086
+    ls -1t "$LOG_DIR/$1"_$STAMP_GLOB.log "$LOG_DIR/$1"_$STAMP_GLOB.log.gz 2>/dev/null \
+      | tail -n +$(($2 + 1)) \
+      | while IFS= read -r old_log; do rm -f -- "$old_log"; done
+  fi
+  return 0
+}
+
+# Maintenance mode: cron-wrapper.sh --retention <job>...
+if [ "$1" = "--retention" ]; then
+  shift
+  for job in "$@"; do
+    enforce_retention "$job"
+  done
+  exit 0
+fi
+
 mkdir -p "$LOG_DIR"
 
 TIMESTAMP=$(date +"%Y-%m-%d_%H-%M-%S")
@@ -92,4 +156,6 @@ fi
 # Cleanup temp files
 rm -f "$LOG_FILE.out" "$ERR_FILE"
 
+enforce_retention "$JOB_NAME"
+
 exit $EXIT_CODE
\ No newline at end of file
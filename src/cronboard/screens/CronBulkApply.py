@@ -0,0 +1,124 @@
+from crontab import CronTab
+from rich.text import Text
+from textual import events, work
+from textual.app import ComposeResult
+from textual.containers import Horizontal, Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Button, DataTable, Label
+
+from cronboard.screens.CronCreator import CronCreator
+from cronboard.services.bulk_apply import JobDefinition, apply_to_fleet
+from cronboard.services.fleet import server_label
+from cronboard.services.ssh_pool import SSHSessionPool
+
+_RESULT_STYLES = {"pending": "dim", "failed": "red"}
+
+
+class CronJobDefinition(CronCreator):
+    """The job form of :class:`CronCreator`, returning the job instead of saving it."""
+
+    def __init__(self) -> None:
+        super().__init__(None)
+
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id != "save":
+            self.dismiss(None)
+            return
+
+        form = self.read_form()
+        if form is None:
+            return
+        identificator, expression, command = form
+
+        try:
+            CronTab().new(command=command).setall(expression)
+        except (ValueError, KeyError):
+            self._show_error("Invalid cron expression. Please try again.")
+            return
+
+        self.dismiss(
+            JobDefinition(identificator, expression, command, self.log_enabled)
+        )
+
+
+class CronBulkApply(ModalScreen[bool]):
+    """Applies one job to several servers at once and shows how each host fared."""
+
+    def __init__(
+        self,
+        servers: dict[str, dict],
+        ssh_pool: SSHSessionPool,
+        definition: JobDefinition,
+    ) -> None:
+        super().__init__()
+        self.servers = servers
+        self.ssh_pool = ssh_pool
+        self.definition = definition
+        self.failed = 0
+
+    def compose(self) -> ComposeResult:
+        yield Vertical(
+            Label("", id="bulk-title", markup=False),
+            DataTable(id="bulk-results", cursor_type="row"),
+            Horizontal(
+                Button("Close", variant="error", id="close"),
+                id="button-row",
+            ),
+            id="dialog",
+        )
+
+    def on_mount(self) -> None:
+        self.app.toggle_tab_enablement()  # Disable tab switching using the `Tab` key
+        table = self.query_one("#bulk-results", DataTable)
+        table.add_column("Host", key="host")
+        table.add_column("Result", key="result")
+        table.add_column("Latency", key="latency")
+        for server_id, server_info in self.servers.items():
+            table.add_row(
+                server_label(server_info),
+                Text("pending", style=_RESULT_STYLES["pending"]),
+                "",
+                key=server_id,
+            )
+        self._update_title(0)
+        self._apply_worker()
+
+    @work(exclusive=True, exit_on_error=False)
+    async def _apply_worker(self) -> None:
+        table = self.query_one("#bulk-results", DataTable)
+        done = 0
+        async for result in apply_to_fleet(
+            self.servers, self.ssh_pool, self.definition
+        ):
+            done += 1
+            if result.error is None:
+                outcome = Text(result.value, style="green")
+            else:
+                self.failed += 1
+                outcome = Text(
+                    f"failed: {result.error}", style=_RESULT_STYLES["failed"]
+                )
+            table.update_cell(result.server_id, "result", outcome, update_width=True)
+            table.update_cell(result.server_id, "latency", f"{result.elapsed:.2f}s")
+            self._update_title(done)
+
+    def _update_title(self, done: int) -> None:
+        title = (
+            f"Applying '{self.definition.identificator}': "
+            f"{done}/{len(self.servers)} done"
+        )
+        if self.failed:
+            title += f", {self.failed} failed"
+        self.query_one("#bulk-title", Label).update(title)
+
+    def on_key(self, event: events.Key) -> None:
+        if event.key == "tab":
+            table = self.query_one("#bulk-results", DataTable)
+            if table.has_focus:
+                self.query_one("#close", Button).focus()
+            else:
+                table.focus()
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        self.app.toggle_tab_enablement()  # Enable tab switching using the `Tab` key
+        self.dismiss(True)
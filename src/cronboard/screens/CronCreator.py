@@ -15,11 +15,16 @@ from textual_autocomplete._path_autocomplete import (
     PathDropdownItem,
 )
 from cron_descriptor import Options, ExpressionDescriptor
+from cronboard.services import remote
+from cronboard.services.crontab_sync import crontab_hashes
+from cronboard.services.job_index import build_job_index, job_key
 from cronboard.services.logging.cron_wrapper import (
     has_wrapper,
     wrap_command,
     command_without_wrapper,
 )
+from cronboard.services.remote import crontab_write_command
+from cronboard.services.schedule_cache import RUN_TIME_FORMAT, schedule_cache
 from cronboard.widgets.VimKeysRadioSet import VimKeysRadioSet
 
 CRON_ALIASES = {
@@ -220,6 +225,7 @@ class CronCreator(ModalScreen[bool]):
         remote=False,
         ssh_client=None,
         crontab_user=None,
+        job_index=None,
     ) -> None:
         super().__init__()
         self.expression = expression
@@ -230,6 +236,7 @@ class CronCreator(ModalScreen[bool]):
         self.remote = remote
         self.ssh_client = ssh_client
         self.crontab_user = crontab_user
+        self.job_index = job_index
 
     def compose(self) -> ComposeResult:
         with Grid(id="dialog"):
@@ -326,56 +333,57 @@ class CronCreator(ModalScreen[bool]):
         else:
             self.log_enabled = False
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id != "save":
-            self.dismiss(False)
-            return
-
+    def read_form(self) -> tuple[str, str, str] | None:
+        """Return ``(identificator, expression, command)``, or ``None`` on invalid input."""
         if self._has_error():
-            return
+            return None
 
         identificator_input = self.query_one("#identificator", Input)
         expression_input = self.query_one("#expression", Input)
         command_input = self.query_one("#command", Input)
-        expression = expression_input.value
-        command = command_input.value
         identificator = identificator_input.value
 
         if not identificator:
             self._show_error("ID cannot be empty.")
-            return
+            return None
 
         if " " in identificator:
             self._show_error("ID cannot contain spaces. e.g., backup_job_1")
+            return None
+
+        return identificator, expression_input.value, command_input.value
+
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id != "save":
+            self.dismiss(False)
             return
 
+        form = self.read_form()
+        if form is None:
+            return
+        identificator, expression, command = form
+
         try:
-            job = self.find_if_cronjob_exists(
-                identificator, command_without_wrapper(command)
-            )
-            if not job:
-                job = self.find_if_cronjob_exists(
-                    identificator,
-                    wrap_command(
+            job = self.find_if_cronjob_exists(identificator, command)
+            if self.log_enabled:
+                if self.remote and self.ssh_client:
+                    command = await remote.call(
+                        self.ssh_client,
+                        wrap_command,
                         command,
                         identificator,
-                        self.ssh_client if self.remote and self.ssh_client else None,
-                    ),
-                )
-            if self.log_enabled:
-                command = wrap_command(
-                    command,
-                    identificator,
-                    self.ssh_client if self.remote and self.ssh_client else None,
-                )
+                        self.ssh_client,
+                    )
+                else:
+                    command = wrap_command(command, identificator)
             if job:
                 job.set_command(command)
                 job.setall(expression)
-                self.write_cron_changes()
+                await self.write_cron_changes()
             else:
                 cron_job = self.cron.new(command=command, comment=identificator)
                 cron_job.setall(expression)
-                self.write_cron_changes()
+                await self.write_cron_changes()
 
             self.dismiss(True)
 
@@ -402,8 +410,9 @@ class CronCreator(ModalScreen[bool]):
             options.locale_code = "en"
             options.use_24hour_time_format = True
             desc = ExpressionDescriptor(expr, options).get_description()
+            next_run = schedule_cache.next_run(expr)
 
-            label_desc.update(desc)
+            label_desc.update(f"{desc} (next run: {next_run:{RUN_TIME_FORMAT}})")
             label_desc.remove_class("error")
             label_desc.add_class("success")
         except Exception:
@@ -411,25 +420,20 @@ class CronCreator(ModalScreen[bool]):
             label_desc.remove_class("success")
             label_desc.add_class("error")
 
-    def write_cron_changes(self):
+    async def write_cron_changes(self):
         """Write cron changes to appropriate destination (local or remote)"""
         if self.remote and self.ssh_client:
+            content = self.cron.render()
             try:
-                new_crontab_content = self.cron.render()
-                crontab_cmd = (
-                    f"crontab -u {self.crontab_user} -"
-                    if self.crontab_user
-                    else "crontab -"
+                result = await remote.write_stdin(
+                    self.ssh_client, crontab_write_command(self.crontab_user), content
                 )
-                stdin, _, stderr = self.ssh_client.exec_command(crontab_cmd)
-                stdin.write(new_crontab_content)
-                stdin.channel.shutdown_write()
-
-                exit_status = stdin.channel.recv_exit_status()
-                errors = stderr.read().decode().strip()
 
-                if errors or exit_status != 0:
-                    self.notify(f"Failed to write remote crontab: {errors}")
+                if result.ok:
+                    crontab_hashes.record(self.ssh_client, self.crontab_user, content)
+                else:
+                    crontab_hashes.forget(self.ssh_client, self.crontab_user)
+                    self.notify(f"Failed to write remote crontab: {result.stderr}")
 
             except Exception as e:
                 print(f"❌ Error writing remote crontab: {e}")
@@ -438,7 +442,7 @@ class CronCreator(ModalScreen[bool]):
             self.cron.write()
 
     def find_if_cronjob_exists(self, identificator: str, cmd: str):
-        for job in self.cron:
-            if job.comment == identificator and job.command == cmd:
-                return job
-        return None
+        """Resolve the job by ID and command, wrapped or not, through the job index."""
+        if self.job_index is None:
+            self.job_index = build_job_index(self.cron)
+        return self.job_index.get(job_key(identificator, cmd))
@@ -2,7 +2,10 @@ from textual.app import ComposeResult
 from crontab import CronTab
 from textual.binding import Binding
 
+from cronboard.services.crontab_sync import crontab_hashes
 from cronboard.services.messages import CronJobDeleted
+from cronboard.services import remote
+from cronboard.services.remote import crontab_write_command
 from textual.widgets import Button, Label
 from textual.containers import Grid, Horizontal, Vertical
 from textual.screen import ModalScreen
@@ -59,7 +62,7 @@ class CronDeleteConfirmation(ModalScreen[bool]):
     async def action_close_modal(self):
         await self.dismiss(False)
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id != "delete":
             self.dismiss(False)
             return
@@ -75,7 +78,7 @@ class CronDeleteConfirmation(ModalScreen[bool]):
             self.cron.remove(self.job)
 
             if self.remote and self.ssh_client:
-                self.write_remote_crontab()
+                await self.write_remote_crontab()
             else:
                 self.cron.write()
 
@@ -88,37 +91,27 @@ class CronDeleteConfirmation(ModalScreen[bool]):
                 )
         self.dismiss(True)
 
-    def write_remote_crontab(self):
+    async def write_remote_crontab(self):
         """Writes the current SSH cron table back to the remote server."""
         if not (self.remote and self.ssh_client):
             return False
 
+        content = self.cron.render() or ""
         try:
-            new_crontab_content = self.cron.render() or ""
-
-            crontab_cmd = (
-                f"crontab -u {self.crontab_user} -"
-                if self.crontab_user
-                else "crontab -"
+            result = await remote.write_stdin(
+                self.ssh_client, crontab_write_command(self.crontab_user), content
             )
-            stdin, _, stderr = self.ssh_client.exec_command(crontab_cmd)
-            stdin.write(new_crontab_content)
-            stdin.channel.shutdown_write()
-
-            exit_status = stdin.channel.recv_exit_status()
-            errors = stderr.read().decode().strip()
-
-            if errors:
-                print(f"❌ Failed to write remote crontab: {errors}")
-                return False
 
-            if exit_status != 0:
-                print(f"❌ Command failed with exit status: {exit_status}")
-                return False
-
-            print("✅ Remote crontab updated successfully")
-            return True
+            if result.stderr:
+                print(f"❌ Failed to write remote crontab: {result.stderr}")
+            elif result.exit_status != 0:
+                print(f"❌ Command failed with exit status: {result.exit_status}")
+            else:
+                crontab_hashes.record(self.ssh_client, self.crontab_user, content)
+                print("✅ Remote crontab updated successfully")
+                return True
 
         except Exception as e:
             print(f"❌ Error writing remote crontab: {e}")
-            return False
+        crontab_hashes.forget(self.ssh_client, self.crontab_user)
+        return False
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from textual.widgets import Input
 from textual.binding import Binding
 from textual.app import ComposeResult
@@ -9,11 +10,19 @@ class CronInputSearch(ModalScreen):
         Binding("escape", "cancel_search", "Cancel Search"),
     ]
 
+    def __init__(self, on_query_changed: Callable[[str], None] | None = None) -> None:
+        super().__init__()
+        self.on_query_changed = on_query_changed
+
     def compose(self) -> ComposeResult:
         yield Input(placeholder="Type to search cronjobs....", id="cron-search-input")
 
     def action_cancel_search(self) -> None:
         self.dismiss(None)
 
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if self.on_query_changed is not None:
+            self.on_query_changed(event.value)
+
     def on_input_submitted(self, event: Input.Submitted) -> None:
         self.dismiss(event.value)
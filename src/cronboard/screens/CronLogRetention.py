@@ -0,0 +1,119 @@
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Grid, Horizontal, Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Button, Input, Label
+
+from cronboard.services import remote
+from cronboard.services.logging.retention import (
+    RetentionPolicy,
+    enforce_retention,
+    load_policies,
+    set_policy,
+)
+
+_LIMIT_INPUTS = ("#max_count", "#max_age_days", "#compress_after_days")
+
+
+class CronLogRetention(ModalScreen[bool]):
+    """Edits how long the logs of one job are kept, and cleans them up on demand."""
+
+    BINDINGS = [Binding(key="escape", action="close_modal", description="Close")]
+
+    def __init__(self, identificator: str, ssh_client=None) -> None:
+        super().__init__()
+        self.identificator = identificator
+        self.ssh_client = ssh_client
+
+    def compose(self) -> ComposeResult:
+        yield Grid(
+            Vertical(
+                Label(
+                    f"Log retention for '{self.identificator}'",
+                    id="label_retention",
+                    markup=False,
+                ),
+                Label("Keep at most this many logs:", classes="form-label"),
+                Input(placeholder="e.g., 50", id="max_count", type="integer"),
+                Label("Delete logs older than (days):", classes="form-label"),
+                Input(placeholder="e.g., 30", id="max_age_days", type="integer"),
+                Label("Compress logs older than (days):", classes="form-label"),
+                Input(placeholder="e.g., 7", id="compress_after_days", type="integer"),
+                Horizontal(
+                    Button("Save", variant="primary", id="save"),
+                    Button("Save & clean up", id="cleanup"),
+                    Button("Cancel", variant="error", id="cancel"),
+                    id="button-row",
+                ),
+                Label("", id="error"),
+                id="content",
+            ),
+            id="dialog",
+        )
+
+    async def on_mount(self) -> None:
+        try:
+            policies = await remote.call(
+                self.ssh_client, load_policies, self.ssh_client
+            )
+        except Exception as e:
+            self.query_one("#error", Label).update(f"Could not read the policy: {e}")
+            return
+        policy = policies.get(self.identificator, RetentionPolicy())
+        for selector, limit in zip(_LIMIT_INPUTS, policy):
+            self.query_one(selector, Input).value = "" if limit is None else str(limit)
+
+    def read_policy(self) -> RetentionPolicy | None:
+        limits = []
+        for selector in _LIMIT_INPUTS:
+            value = self.query_one(selector, Input).value.strip()
+            if not value:
+                limits.append(None)
+            elif value.isdigit() and int(value) > 0:
+                limits.append(int(value))
+            else:
+                self.query_one("#error", Label).update(
+                    "Limits must be positive whole numbers, or empty for no limit."
+                )
+                return None
+        return RetentionPolicy(*limits)
+
+    async def action_close_modal(self) -> None:
+        await self.dismiss(False)
+
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "cancel":
+            self.dismiss(False)
+            return
+
+        policy = self.read_policy()
+        if policy is None:
+            return
+
+        ssh = self.ssh_client
+        try:
+            await remote.call(ssh, set_policy, self.identificator, policy, ssh)
+        except Exception as e:
+            self.query_one("#error", Label).update(f"Could not save the policy: {e}")
+            return
+
+        if event.button.id == "cleanup":
+            try:
+                result = await remote.call(
+                    ssh, enforce_retention, [self.identificator], ssh
+                )
+            except Exception as e:
+                self.query_one("#error", Label).update(
+                    f"Saved the policy, but could not clean up: {e}"
+                )
+                return
+            if result.ok:
+                self.notify(f"Cleaned up the logs of '{self.identificator}'")
+            else:
+                self.notify(
+                    f"Log clean-up failed: {result.stderr or result.exit_status}",
+                    severity="error",
+                )
+        else:
+            self.notify(f"Saved the log retention of '{self.identificator}'")
+        self.dismiss(True)
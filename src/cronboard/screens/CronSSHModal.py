@@ -1,10 +1,32 @@
 from textual.app import ComposeResult
-from textual.widgets import Button, Label, Input
+from textual.widgets import Button, Checkbox, Label, Input
 from textual.containers import Grid, Horizontal, Vertical
 from textual.screen import ModalScreen
 
+from cronboard.services.ssh_pool import TransportOptions, parse_size
+
 
 class CronSSHModal(ModalScreen):
+    def __init__(self, server: dict | None = None) -> None:
+        """``server`` is an existing entry to edit; its identity stays fixed."""
+        super().__init__()
+        self.server = server
+        self.transport_error: str | None = None
+        try:
+            self.transport = TransportOptions.from_config(
+                server.get("transport") if server else None
+            )
+        except ValueError as exc:
+            # A hand-edited servers.toml; start over from the defaults.
+            self.transport = TransportOptions()
+            self.transport_error = f"Saved transport options ignored: {exc}"
+
+    def on_mount(self) -> None:
+        if self.transport_error:
+            self.query_one("#content", Vertical).mount(
+                Label(self.transport_error, id="error")
+            )
+
     @staticmethod
     def _parse_host_info(host_info: str) -> tuple[str, int]:
         host_info = host_info.strip()
@@ -25,27 +47,51 @@ class CronSSHModal(ModalScreen):
 
         return host_info, 22
 
+    @staticmethod
+    def _parse_transport(
+        compression: bool, ciphers: str, window_size: str, max_packet_size: str
+    ) -> TransportOptions:
+        return TransportOptions(
+            compression=compression,
+            ciphers=tuple(c.strip() for c in ciphers.split(",") if c.strip()),
+            window_size=parse_size(window_size) if window_size else None,
+            max_packet_size=parse_size(max_packet_size) if max_packet_size else None,
+        )
+
     def compose(self) -> ComposeResult:
+        server = self.server or {}
+        editing = self.server is not None
+        host = server.get("host", "")
+        if host and int(server.get("port", 22)) != 22:
+            host = f"{host}:{server['port']}"
         yield Grid(
             Vertical(
                 Label(
-                    "Add a remote server into the tree view",
+                    f"Edit {server['name']}"
+                    if editing
+                    else "Add a remote server into the tree view",
                     id="label1",
                 ),
                 Input(
+                    value=host,
                     placeholder="Hostname (e.g. localhost or localhost:2222)",
                     id="hostname",
+                    disabled=editing,
                 ),
                 Input(
+                    value=server.get("username", ""),
                     placeholder="Username",
                     id="username",
+                    disabled=editing,
                 ),
                 Label(
                     "Use password if you are not using SSH key",
                     id="label_andor",
                 ),
                 Input(
-                    placeholder="Password",
+                    placeholder="Leave empty to keep the current password"
+                    if editing
+                    else "Password",
                     id="password",
                     password=True,
                 ),
@@ -54,11 +100,41 @@ class CronSSHModal(ModalScreen):
                     id="label_crontab_user",
                 ),
                 Input(
+                    value=server.get("crontab_user") or "",
                     placeholder="Leave empty for current user",
                     id="crontab_user",
+                    disabled=editing,
+                ),
+                Label(
+                    "Transport tuning (optional, helps slow or distant links)",
+                    id="label_transport",
+                ),
+                Checkbox(
+                    "Compress traffic",
+                    value=self.transport.compression,
+                    id="compression",
+                ),
+                Input(
+                    value=", ".join(self.transport.ciphers),
+                    placeholder="Preferred ciphers, e.g. aes128-gcm@openssh.com",
+                    id="ciphers",
+                ),
+                Input(
+                    value=str(self.transport.window_size or ""),
+                    placeholder="Window size, e.g. 8M (default 2M)",
+                    id="window_size",
+                ),
+                Input(
+                    value=str(self.transport.max_packet_size or ""),
+                    placeholder="Max packet size, e.g. 32K (default 32K)",
+                    id="max_packet_size",
                 ),
                 Horizontal(
-                    Button("Add Server", variant="primary", id="add"),
+                    Button(
+                        "Save Server" if editing else "Add Server",
+                        variant="primary",
+                        id="add",
+                    ),
                     Button("Cancel", variant="error", id="cancel"),
                     id="button-row",
                 ),
@@ -90,6 +166,12 @@ class CronSSHModal(ModalScreen):
 
             try:
                 hostname, port = self._parse_host_info(host_info)
+                transport = self._parse_transport(
+                    self.query_one("#compression", Checkbox).value,
+                    self.query_one("#ciphers", Input).value,
+                    self.query_one("#window_size", Input).value.strip(),
+                    self.query_one("#max_packet_size", Input).value.strip(),
+                )
             except ValueError as exc:
                 if not self.query("#error"):
                     message = str(exc) if str(exc) else "Invalid host format"
@@ -104,6 +186,7 @@ class CronSSHModal(ModalScreen):
                 "password": password,
                 "ssh_key": True if not password else False,
                 "crontab_user": crontab_user if crontab_user else None,
+                "transport": transport.to_config(),
             }
 
             self.dismiss(server)
@@ -1,3 +1,4 @@
+from textual import on
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Grid
 from textual.widget import Widget
@@ -6,29 +7,64 @@ from cronboard.widgets.CronTree import CronTree
 from textual.binding import Binding
 from cronboard.screens.CronSSHModal import CronSSHModal
 from cronboard.widgets.CronTable import CronTable
+from cronboard.widgets.FleetCronTable import FleetCronTable
 from cronboard.screens.CronDeleteConfirmation import CronDeleteConfirmation
+from cronboard.screens.CronBulkApply import CronBulkApply, CronJobDefinition
 import paramiko
 import tomllib
 import tomlkit
 from cronboard.services.encryption.CronEncrypt import decrypt_password, encrypt_password
+from cronboard.services import remote
+from cronboard.services.remote import remote_executor
+from cronboard.services.ssh_pool import (
+    SSH_HEALTH_INTERVAL,
+    SSH_HEALTH_TIMEOUT,
+    SSHSessionPool,
+    TransportOptions,
+    ping,
+)
+from cronboard.services.messages import FleetHostFetched, RemoteCrontabLoaded
+from cronboard.services.logging.cron_wrapper import WRAPPER_STALE, wrapper_status
 from cronboard.config import CONFIG_FILE
 
 
+_SELECTED_PREFIX = "+ "
+# Notes shown after a server's name in the tree, in this order.
+_HEALTH_MARK = "health"
+_WRAPPER_MARK = "wrapper"
+_FLEET_MARK = "fleet"
+_MARK_ORDER = (_HEALTH_MARK, _WRAPPER_MARK, _FLEET_MARK)
+# Tree node data of the "All servers" entry; server ids always contain an "@".
+ALL_SERVERS = "*"
+
+
 class CronServers(Widget):
     BINDINGS = [
         Binding("a", "add_server", "Add Server"),
         Binding("D", "delete_server", "Delete Server"),
+        Binding("E", "edit_server", "Edit Server"),
         Binding("c", "connect_server", "Connect"),
         Binding("d", "disconnect_server", "Disconnect Server"),
+        Binding("m", "toggle_select", "Select"),
+        Binding("B", "bulk_apply", "Bulk Apply"),
         Binding("J", "jump", "Switch Panel"),
     ]
 
-    def __init__(self) -> None:
+    def __init__(self, ssh_pool: SSHSessionPool | None = None) -> None:
         super().__init__()
+        self.ssh_pool = ssh_pool if ssh_pool is not None else SSHSessionPool()
         self.servers = self.load_servers()
         self.current_ssh_client = None
         self.current_cron_table = None
         self.current_server_name = None
+        self.current_server_id = None
+        self.fleet_table: FleetCronTable | None = None
+        self.fleet_node = None
+        self.selected_servers: set[str] = set()
+        self._node_marks: dict[str, dict[str, str]] = {}
+        self._base_labels: dict[str, str] = {}
+        self._health_check_running = False
+        self.wrapper_states: dict[str, str] = {}
 
     def compose(self) -> ComposeResult:
         servers_tree = CronTree("Servers", id="servers-tree")
@@ -51,43 +87,44 @@ class CronServers(Widget):
                 f"{server_info['name']}: {server_info.get('crontab_user', '')}",
                 server_id,
             )
+        self.fleet_node = servers_tree.root.add_leaf("All servers", ALL_SERVERS)
         servers_tree.refresh()
+        self.set_interval(SSH_HEALTH_INTERVAL, self.check_connection, name="ssh-health")
 
     def action_connect_server(self) -> None:
         servers_tree = self.query_one("#servers-tree", Tree)
         if servers_tree.cursor_node and servers_tree.cursor_node != servers_tree.root:
             server_id = servers_tree.cursor_node.data
+            if server_id == ALL_SERVERS:
+                self.show_fleet_table()
+                return
             server_info = self.servers.get(server_id)
             if server_info:
                 self.connect_to_server(server_info)
 
     def connect_to_server(self, server_info) -> None:
         try:
-            ssh_client = paramiko.SSHClient()
-            ssh_client.load_system_host_keys()
-            ssh_client.set_missing_host_key_policy(paramiko.WarningPolicy)
-
-            host = server_info["host"]
-            port = server_info["port"]
-            username = server_info["username"]
-            password = server_info["password"]
             crontab_user = server_info.get("crontab_user")
-
-            if server_info["ssh_key"]:
-                ssh_client.connect(hostname=host, port=port, username=username)
-            else:
-                ssh_client.connect(
-                    hostname=host, port=port, username=username, password=password
-                )
+            # Entries for other crontab users on the same host share the session.
+            ssh_client = self.ssh_pool.acquire(
+                server_info["host"],
+                server_info["port"],
+                server_info["username"],
+                password=None if server_info["ssh_key"] else server_info["password"],
+                transport=TransportOptions.from_config(server_info.get("transport")),
+            )
 
             if self.current_ssh_client:
-                try:
-                    self.current_ssh_client.close()
-                except:
-                    pass
+                self.ssh_pool.release(self.current_ssh_client)
+            if self.current_server_id:
+                self._mark_node(self.current_server_id, _HEALTH_MARK, None)
 
             self.current_ssh_client = ssh_client
             self.current_server_name = server_info["name"]
+            self.current_server_id = next(
+                (sid for sid, info in self.servers.items() if info is server_info),
+                None,
+            )
             self.show_cron_table_for_server(ssh_client, server_info, crontab_user)
 
             server_info["connected"] = True
@@ -100,6 +137,132 @@ class CronServers(Widget):
         except Exception as e:
             self.notify(f"Connection error: {e}")
 
+    @on(RemoteCrontabLoaded)
+    def _on_remote_crontab_loaded(self, event: RemoteCrontabLoaded) -> None:
+        if (
+            event.ssh_client is not self.current_ssh_client
+            or not self.current_server_id
+        ):
+            return
+        # Answered from the facts gathered by the load's host probe.
+        status = wrapper_status(event.ssh_client)
+        previous = self.wrapper_states.get(self.current_server_id)
+        self.wrapper_states[self.current_server_id] = status
+        self._mark_stale_wrapper(self.current_server_id, status == WRAPPER_STALE)
+        if status == WRAPPER_STALE and previous != WRAPPER_STALE:
+            self.notify(
+                f"The logging wrapper on {self.current_server_name} is outdated; "
+                "it is updated the next time a job with logging is saved.",
+                severity="warning",
+            )
+
+    @on(FleetHostFetched)
+    def _on_fleet_host_fetched(self, event: FleetHostFetched) -> None:
+        self._mark_node(
+            event.server_id, _FLEET_MARK, "unreachable" if event.error else None
+        )
+
+    def _mark_stale_wrapper(self, server_id: str, stale: bool) -> None:
+        self._mark_node(server_id, _WRAPPER_MARK, "stale wrapper" if stale else None)
+
+    async def check_connection(self) -> None:
+        """Show the current session's latency, reconnecting it if it dropped.
+
+        A session whose keepalive goes unanswered is closed and reconnected,
+        even if its transport still looks active. Remote calls made while
+        reconnecting wait for it and are then replayed (see
+        :class:`RemoteExecutor`).
+        """
+        client, server_id = self.current_ssh_client, self.current_server_id
+        if client is None or server_id is None or self._health_check_running:
+            return
+        self._health_check_running = True
+        try:
+            dropped = client.get_transport()
+            try:
+                latency = await remote.call(None, ping, client, SSH_HEALTH_TIMEOUT)
+            except Exception:
+                latency = None
+            if client is not self.current_ssh_client:
+                return
+            if latency is not None:
+                self._mark_node(server_id, _HEALTH_MARK, f"{latency * 1000:.0f} ms")
+                return
+
+            self._mark_node(server_id, _HEALTH_MARK, "reconnecting")
+            if dropped is not None:
+                dropped.close()
+            reconnected = await remote_executor.reconnect(client)
+            if client is not self.current_ssh_client:
+                return
+            if not reconnected or client.get_transport() is dropped:
+                self._mark_node(server_id, _HEALTH_MARK, "offline")
+                return
+            self._mark_node(server_id, _HEALTH_MARK, None)
+            self.notify(f"Reconnected to {self.current_server_name}")
+            if self.current_cron_table:
+                self.current_cron_table.action_refresh()
+        finally:
+            self._health_check_running = False
+
+    def action_toggle_select(self) -> None:
+        """Select the server under the cursor for a bulk apply, or unselect it."""
+        node = self.query_one("#servers-tree", Tree).cursor_node
+        if node is None or node.data not in self.servers:
+            return
+        if node.data in self.selected_servers:
+            self.selected_servers.discard(node.data)
+        else:
+            self.selected_servers.add(node.data)
+        self._render_node(node.data)
+
+    def action_bulk_apply(self) -> None:
+        """Add or update one job on every selected server at once."""
+        targets = {
+            server_id: self.servers[server_id]
+            for server_id in self.servers
+            if server_id in self.selected_servers
+        }
+        if not targets:
+            self.notify("Select servers with 'm' first.")
+            return
+
+        def on_applied(_result) -> None:
+            if self.current_cron_table and self.current_server_id in targets:
+                self.current_cron_table.action_refresh()
+            if self.fleet_table:
+                self.fleet_table.action_refresh()
+
+        def on_defined(definition) -> None:
+            if definition:
+                self.app.push_screen(
+                    CronBulkApply(targets, self.ssh_pool, definition), on_applied
+                )
+
+        self.app.push_screen(CronJobDefinition(), on_defined)
+
+    def _mark_node(self, server_id: str, kind: str, note: str | None) -> None:
+        marks = self._node_marks.setdefault(server_id, {})
+        if note is None:
+            marks.pop(kind, None)
+        else:
+            marks[kind] = note
+        self._render_node(server_id)
+
+    def _render_node(self, server_id: str) -> None:
+        servers_tree = self.query_one("#servers-tree", Tree)
+        marks = self._node_marks.get(server_id, {})
+        for node in servers_tree.root.children:
+            if node.data != server_id:
+                continue
+            label = self._base_labels.setdefault(server_id, str(node.label))
+            if server_id in self.selected_servers:
+                label = f"{_SELECTED_PREFIX}{label}"
+            for kind in _MARK_ORDER:
+                if kind in marks:
+                    label += f" ({marks[kind]})"
+            node.set_label(label)
+
     def show_cron_table_for_server(self, ssh_client, server_info, crontab_user) -> None:
         if self.current_cron_table:
             self.current_cron_table.ssh_client = ssh_client
@@ -121,10 +284,36 @@ class CronServers(Widget):
 
         if self.content_area and self.content_area != self.current_cron_table:
             self.content_area.remove()
+            if self.content_area is self.fleet_table:
+                self.fleet_table = None
 
         horizontal.mount(self.current_cron_table)
         self.content_area = self.current_cron_table
 
+    def show_fleet_table(self) -> None:
+        """Show the crontabs of every configured server in one table."""
+        if not self.servers:
+            self.notify("No servers configured yet.")
+            return
+        if self.fleet_table:
+            self.fleet_table.action_refresh()
+            return
+
+        self.fleet_table = FleetCronTable(
+            self.servers, self.ssh_pool, id="fleet-cron-table"
+        )
+        container = self.query_one("#servers-grid", Grid)
+        horizontal = container.query_one(Horizontal)
+
+        if self.content_area:
+            self.content_area.remove()
+            if self.content_area is self.current_cron_table:
+                # The connection stays open; connecting again shows it anew.
+                self.current_cron_table = None
+
+        horizontal.mount(self.fleet_table)
+        self.content_area = self.fleet_table
+
     def show_disconnected_message(self) -> None:
         if self.current_cron_table:
             self.current_cron_table.remove()
@@ -139,14 +328,18 @@ class CronServers(Widget):
 
         if self.content_area:
             self.content_area.remove()
+            if self.content_area is self.fleet_table:
+                self.fleet_table = None
 
         horizontal.mount(disconnected_label)
         self.content_area = disconnected_label
 
     def action_disconnect_server(self) -> None:
+        if self.current_server_id:
+            self._mark_node(self.current_server_id, _HEALTH_MARK, None)
         if self.current_ssh_client:
             try:
-                self.current_ssh_client.close()
+                self.ssh_pool.discard(self.current_ssh_client)
                 self.show_disconnected_message()
             except:
                 pass
@@ -157,6 +350,7 @@ class CronServers(Widget):
 
         connected_server_name = self.current_server_name
         self.current_server_name = None
+        self.current_server_id = None
 
         if connected_server_name:
             self.notify(f"Disconnected from server {connected_server_name}")
@@ -220,6 +414,8 @@ class CronServers(Widget):
                     if server_info.get("crontab_user")
                     else server_info["username"],
                 }
+                if server_info.get("transport"):
+                    toml_safe_servers[server_id]["transport"] = server_info["transport"]
 
             with CONFIG_FILE.open("w", encoding="utf-8") as f:
                 tomlkit.dump(toml_safe_servers, f)
@@ -236,12 +432,43 @@ class CronServers(Widget):
                 password = result.get("password") if result.get("password") else None
                 crontab_user = result.get("crontab_user")
                 self.add_server_to_tree(
-                    name, host, port, username, password, crontab_user
+                    name,
+                    host,
+                    port,
+                    username,
+                    password,
+                    crontab_user,
+                    transport=result.get("transport"),
                 )
 
         cron_ssh_modal = CronSSHModal()
         self.app.push_screen(cron_ssh_modal, on_server_added)
 
+    def action_edit_server(self) -> None:
+        """Change the password or transport options of the selected server."""
+        servers_tree = self.query_one("#servers-tree", Tree)
+        node = servers_tree.cursor_node
+        server_id = node.data if node else None
+        server_info = self.servers.get(server_id)
+        if not server_info:
+            self.notify("No server selected to edit.")
+            return
+
+        def on_server_edited(result):
+            if not result:
+                return
+            if result.get("password"):
+                server_info["password"] = result["password"]
+                server_info["ssh_key"] = False
+            server_info["transport"] = result.get("transport") or {}
+            self.save_servers()
+            if server_id == self.current_server_id:
+                self.notify(f"Reconnect to {server_info['name']} to apply the changes")
+            else:
+                self.notify(f"Saved {server_info['name']}")
+
+        self.app.push_screen(CronSSHModal(server=server_info), on_server_edited)
+
     def add_server_to_tree(
         self,
         name: str,
@@ -250,6 +477,7 @@ class CronServers(Widget):
         username: str,
         password: str | None,
         crontab_user: str | None = None,
+        transport: dict | None = None,
     ) -> None:
         servers_tree = self.query_one("#servers-tree", Tree)
         server_id = f"{username}@{host}:{crontab_user}"
@@ -263,9 +491,12 @@ class CronServers(Widget):
                 "ssh_key": True if not password else False,
                 "connected": False,
                 "crontab_user": crontab_user,
+                "transport": transport or {},
             }
             servers_tree.root.add_leaf(
-                f"{name}: {crontab_user if crontab_user else username}", server_id
+                f"{name}: {crontab_user if crontab_user else username}",
+                server_id,
+                before=self.fleet_node,
             )
             servers_tree.refresh()
             self.save_servers()
@@ -273,7 +504,9 @@ class CronServers(Widget):
     def action_delete_server(self) -> None:
         servers_tree = self.query_one("#servers-tree", Tree)
         if not (
-            servers_tree.cursor_node and servers_tree.cursor_node != servers_tree.root
+            servers_tree.cursor_node
+            and servers_tree.cursor_node != servers_tree.root
+            and servers_tree.cursor_node.data != ALL_SERVERS
         ):
             self.notify("No server selected to delete.")
             return
@@ -291,6 +524,9 @@ class CronServers(Widget):
                     self.action_disconnect_server()
 
                 del self.servers[server_id]
+                self.selected_servers.discard(server_id)
+                self._node_marks.pop(server_id, None)
+                self._base_labels.pop(server_id, None)
                 servers_tree.cursor_node.remove()
                 self.save_servers()
                 self.notify(f"Deleted server {server_info['name']}")
@@ -315,7 +551,8 @@ class CronServers(Widget):
 
     def action_jump(self) -> None:
         servers_tree = self.query_one("#servers-tree", Tree)
-        if servers_tree.has_focus and self.current_cron_table:
-            self.current_cron_table.focus()
+        table = self.current_cron_table or self.fleet_table
+        if servers_tree.has_focus and table:
+            table.focus()
         else:
             servers_tree.focus()
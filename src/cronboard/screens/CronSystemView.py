@@ -0,0 +1,42 @@
+from textual import events
+from textual.app import ComposeResult
+from textual.containers import Horizontal, Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Button
+
+from cronboard.widgets.SystemCronTable import SystemCronTable
+
+
+class CronSystemView(ModalScreen[bool]):
+    def __init__(self, ssh_client=None):
+        super().__init__()
+        self.ssh_client = ssh_client
+
+    def compose(self) -> ComposeResult:
+        yield Vertical(
+            SystemCronTable(
+                remote=self.ssh_client is not None,
+                ssh_client=self.ssh_client,
+                id="system-crontable",
+            ),
+            Horizontal(
+                Button("Close", variant="error", id="close"),
+                id="button-row",
+            ),
+            id="dialog",
+        )
+
+    def on_mount(self) -> None:
+        self.app.toggle_tab_enablement()  # Disable tab switching using the `Tab` key
+
+    def on_key(self, event: events.Key) -> None:
+        if event.key == "tab":
+            table = self.query_one(SystemCronTable)
+            if table.has_focus:
+                self.query_one("#close", Button).focus()
+            else:
+                table.focus()
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        self.app.toggle_tab_enablement()  # Enable tab switching using the `Tab` key
+        self.dismiss(True)
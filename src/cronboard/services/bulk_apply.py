@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import NamedTuple
+
+import paramiko
+
+from cronboard.services.crontab_sync import crontab_hashes
+from cronboard.services.fleet import (
+    FLEET_CONCURRENCY,
+    FleetResult,
+    for_each_server,
+    read_crontab,
+    with_session,
+)
+from cronboard.services.logging.cron_wrapper import wrap_command
+from cronboard.services.remote import crontab_write_command, write_stdin_sync
+from cronboard.services.ssh_pool import SSHSessionPool
+
+# A read, an optional wrapper upload and a write; slower than a plain fetch.
+BULK_APPLY_TIMEOUT = 60.0
+
+ADDED = "added"
+UPDATED = "updated"
+
+
+class JobDefinition(NamedTuple):
+    identificator: str
+    expression: str
+    command: str
+    log_enabled: bool
+
+
+def apply_job(
+    ssh: paramiko.SSHClient,
+    crontab_user: str | None,
+    definition: JobDefinition,
+    timeout: float | None = None,
+) -> str:
+    """Read the crontab, add or update the job by its ID and write it back.
+
+    Returns :data:`ADDED` or :data:`UPDATED`; raises when the write fails.
+    """
+    cron = read_crontab(ssh, crontab_user, timeout)
+    command = definition.command
+    if definition.log_enabled:
+        command = wrap_command(command, definition.identificator, ssh)
+
+    job = next((job for job in cron if job.comment == definition.identificator), None)
+    if job is None:
+        job = cron.new(command=command, comment=definition.identificator)
+        outcome = ADDED
+    else:
+        job.set_command(command)
+        outcome = UPDATED
+    job.setall(definition.expression)
+
+    content = cron.render()
+    result = write_stdin_sync(
+        ssh, crontab_write_command(crontab_user), content, timeout
+    )
+    if not result.ok:
+        crontab_hashes.forget(ssh, crontab_user)
+        raise RuntimeError(
+            result.stderr or f"crontab exited with status {result.exit_status}"
+        )
+    crontab_hashes.record(ssh, crontab_user, content)
+    return outcome
+
+
+def apply_to_fleet(
+    servers: dict[str, dict],
+    pool: SSHSessionPool,
+    definition: JobDefinition,
+    concurrency: int = FLEET_CONCURRENCY,
+    timeout: float = BULK_APPLY_TIMEOUT,
+) -> AsyncIterator[FleetResult]:
+    """Apply ``definition`` to every server concurrently, yielding as each ends."""
+    return for_each_server(
+        servers,
+        lambda server_info: with_session(
+            pool,
+            server_info,
+            apply_job,
+            server_info.get("crontab_user"),
+            definition,
+            timeout,
+            timeout=timeout,
+        ),
+        concurrency=concurrency,
+        timeout=timeout,
+    )
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import hashlib
+import shlex
+import threading
+import weakref
+
+import paramiko
+
+CRONTAB_VERIFY_INTERVAL = 300.0
+
+
+def content_hash(content: str) -> str:
+    """sha256 of a crontab, ignoring trailing newlines like ``$(crontab -l)`` does."""
+    normalized = content.rstrip("\n") + "\n"
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+def remote_hash_command(crontab_user: str | None = None) -> str:
+    crontab_cmd = (
+        f"crontab -u {shlex.quote(crontab_user)} -l" if crontab_user else "crontab -l"
+    )
+    return (
+        f"c=$({crontab_cmd} 2>/dev/null); printf '%s\\n' \"$c\" | "
+        "(sha256sum 2>/dev/null || shasum -a 256) | cut -c1-64"
+    )
+
+
+def fetch_remote_hash(
+    ssh: paramiko.SSHClient, crontab_user: str | None = None
+) -> str | None:
+    _, stdout, _ = ssh.exec_command(remote_hash_command(crontab_user))
+    digest = stdout.read().decode(errors="replace").strip()
+    return digest or None
+
+
+class CrontabHashes:
+    """What each remote crontab is known to contain, as a :func:`content_hash`.
+
+    Recorded whenever cronboard reads or successfully writes a crontab, so a
+    table can trust the ``CronTab`` it just rendered instead of fetching it
+    again, and later verify the remote copy by comparing hashes only.
+    """
+
+    def __init__(self) -> None:
+        self._hashes: weakref.WeakKeyDictionary[
+            paramiko.SSHClient, dict[str | None, str]
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def record(
+        self, ssh: paramiko.SSHClient, crontab_user: str | None, content: str
+    ) -> None:
+        with self._lock:
+            self._hashes.setdefault(ssh, {})[crontab_user] = content_hash(content)
+
+    def forget(self, ssh: paramiko.SSHClient, crontab_user: str | None) -> None:
+        with self._lock:
+            self._hashes.get(ssh, {}).pop(crontab_user, None)
+
+    def get(self, ssh: paramiko.SSHClient, crontab_user: str | None) -> str | None:
+        with self._lock:
+            return self._hashes.get(ssh, {}).get(crontab_user)
+
+    def matches(
+        self, ssh: paramiko.SSHClient, crontab_user: str | None, content: str
+    ) -> bool:
+        """Whether ``content`` is what the host was last known to have."""
+        return self.get(ssh, crontab_user) == content_hash(content)
+
+
+crontab_hashes = CrontabHashes()
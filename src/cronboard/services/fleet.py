@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
+
+import paramiko
+from crontab import CronTab
+
+from cronboard.services.crontab_sync import crontab_hashes
+from cronboard.services.remote_probe import probe_host
+from cronboard.services.ssh_pool import SSHSessionPool, TransportOptions
+
+FLEET_CONCURRENCY = 16
+FLEET_HOST_TIMEOUT = 20.0
+
+
+class FleetResult(NamedTuple):
+    server_id: str
+    label: str
+    # What the per-host task returned, e.g. the crontab; ``None`` when the
+    # host failed and ``error`` says why.
+    value: Any
+    error: str | None
+    elapsed: float
+
+
+def server_label(server_info: dict) -> str:
+    crontab_user = server_info.get("crontab_user") or server_info["username"]
+    return f"{server_info['name']}: {crontab_user}"
+
+
+def with_session(
+    pool: SSHSessionPool,
+    server_info: dict,
+    task: Callable[..., Any],
+    *args: Any,
+    timeout: float | None = None,
+) -> Any:
+    """Run ``task(ssh, *args)`` on a pooled session of the server, then release it."""
+    ssh = pool.acquire(
+        server_info["host"],
+        server_info["port"],
+        server_info["username"],
+        password=None if server_info.get("ssh_key") else server_info.get("password"),
+        timeout=timeout,
+        transport=TransportOptions.from_config(server_info.get("transport")),
+    )
+    try:
+        return task(ssh, *args)
+    finally:
+        pool.release(ssh)
+
+
+def read_crontab(
+    ssh: paramiko.SSHClient,
+    crontab_user: str | None = None,
+    timeout: float | None = None,
+) -> CronTab:
+    probe = probe_host(ssh, crontab_user, timeout=timeout)
+    content = probe.crontab if probe.crontab_status == 0 else ""
+    crontab_hashes.record(ssh, crontab_user, content)
+    return CronTab(tab=content)
+
+
+def fetch_server_crontab(
+    pool: SSHSessionPool, server_info: dict, timeout: float | None = None
+) -> CronTab:
+    """Connect through ``pool``, read the server's crontab and hand the session back."""
+    return with_session(
+        pool,
+        server_info,
+        read_crontab,
+        server_info.get("crontab_user"),
+        timeout,
+        timeout=timeout,
+    )
+
+
+def describe_error(error: BaseException) -> str:
+    if isinstance(error, paramiko.AuthenticationException):
+        return "authentication failed"
+    return str(error) or type(error).__name__
+
+
+async def for_each_server(
+    servers: dict[str, dict],
+    task: Callable[[dict], Any],
+    concurrency: int = FLEET_CONCURRENCY,
+    timeout: float = FLEET_HOST_TIMEOUT,
+    clock: Callable[[], float] = time.monotonic,
+) -> AsyncIterator[FleetResult]:
+    """Run the blocking ``task(server_info)`` for every server, yielding as each ends.
+
+    Tasks run on ``concurrency`` threads of their own, so a fleet operation
+    never takes the threads of the app's other remote calls. ``task`` is
+    expected to hand ``timeout`` to paramiko, which bounds the connect,
+    handshake and reads of each host; a timed out host yields a result with
+    an error and never holds back the others. ``elapsed`` counts from when
+    the host's task started, not from when it was queued.
+    """
+
+    def run(server_id: str, server_info: dict) -> FleetResult:
+        started = clock()
+        value, error = None, None
+        try:
+            value = task(server_info)
+        except TimeoutError:
+            error = f"timed out after {timeout:g}s"
+        except Exception as e:
+            error = describe_error(e)
+        return FleetResult(
+            server_id, server_label(server_info), value, error, clock() - started
+        )
+
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="cronboard-fleet"
+    )
+    futures = [
+        loop.run_in_executor(executor, run, server_id, server_info)
+        for server_id, server_info in servers.items()
+    ]
+    try:
+        for next_done in asyncio.as_completed(futures):
+            yield await next_done
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def fetch_fleet(
+    servers: dict[str, dict],
+    pool: SSHSessionPool,
+    concurrency: int = FLEET_CONCURRENCY,
+    timeout: float = FLEET_HOST_TIMEOUT,
+) -> AsyncIterator[FleetResult]:
+    """Yield the crontab of every server as soon as it answers."""
+    return for_each_server(
+        servers,
+        lambda server_info: fetch_server_crontab(pool, server_info, timeout),
+        concurrency=concurrency,
+        timeout=timeout,
+    )
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from typing import Any
+
+import paramiko
+
+HOST_FACTS_TTL = 600.0
+
+
+class HostFactCache:
+    """Facts about a remote host (home, bash path, wrapper state) per connection.
+
+    Entries are keyed by the SSH client, so they vanish with the connection,
+    and expire after ``ttl`` seconds. Code that changes a fact on the host
+    updates or invalidates it explicitly.
+    """
+
+    def __init__(
+        self, ttl: float = HOST_FACTS_TTL, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.ttl = ttl
+        self._clock = clock
+        self._facts: weakref.WeakKeyDictionary[
+            paramiko.SSHClient, dict[str, tuple[float, Any]]
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self, ssh: paramiko.SSHClient, name: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._facts.get(ssh, {}).get(name)
+        if entry is None or self._clock() - entry[0] >= self.ttl:
+            return default
+        return entry[1]
+
+    def update(self, ssh: paramiko.SSHClient, **facts: Any) -> None:
+        now = self._clock()
+        with self._lock:
+            host = self._facts.setdefault(ssh, {})
+            for name, value in facts.items():
+                host[name] = (now, value)
+
+    def invalidate(self, ssh: paramiko.SSHClient, *names: str) -> None:
+        """Forget ``names`` for ``ssh``, or every fact of it if none are given."""
+        with self._lock:
+            if not names:
+                self._facts.pop(ssh, None)
+                return
+            host = self._facts.get(ssh, {})
+            for name in names:
+                host.pop(name, None)
+
+    def cached(
+        self, ssh: paramiko.SSHClient, name: str, fetch: Callable[[], Any]
+    ) -> Any:
+        """Return the fact ``name``, fetching it on a miss.
+
+        ``None`` means the lookup failed and is not cached, so it is retried.
+        """
+        value = self.get(ssh, name)
+        if value is None:
+            value = fetch()
+            if value is not None:
+                self.update(ssh, **{name: value})
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._facts.clear()
+
+
+host_facts = HostFactCache()
@@ -0,0 +1,23 @@
+from cronboard.services.logging.cron_wrapper import command_without_wrapper
+
+
+def job_key(identificator: str | None, command: str) -> tuple[str, str]:
+    """Identity of a cron job: its ID comment and its command without the log wrapper."""
+    return (identificator or "", command_without_wrapper(command))
+
+
+def build_job_index(cron, commands: list[str] | None = None) -> dict[tuple, object]:
+    """Map :func:`job_key` to job so lookups don't scan the whole crontab.
+
+    ``commands`` may carry the already unwrapped command of each job (in crontab
+    order) to avoid parsing every command line again. The first job wins when
+    several share a key, like a linear scan would.
+    """
+    index = {}
+    if commands is None:
+        for job in cron:
+            index.setdefault(job_key(job.comment, job.command), job)
+    else:
+        for job, command in zip(cron, commands):
+            index.setdefault((job.comment or "", command), job)
+    return index
@@ -1,5 +1,6 @@
 import base64
 import binascii
+import hashlib
 import os
 import stat
 import paramiko
@@ -7,6 +8,7 @@ import shlex
 import shutil
 from typing import Optional
 from cronboard.config import WRAPPER_SOURCE, CONFIG_DIR, CONFIG_REL_PATH, WRAPPER_DIST
+from cronboard.services.host_facts import host_facts
 
 """
 Prefix for base64-encoded user command in wrapped crontab lines (avoids shell
@@ -16,8 +18,14 @@ prefix still run via the wrapper's multi-argument branch.
 
 COMMAND_PAYLOAD_PREFIX = "cronboard1:"
 
+WRAPPER_MISSING = "missing"
+WRAPPER_STALE = "stale"
+WRAPPER_CURRENT = "current"
 
-def get_remote_bash_path(ssh: paramiko.SSHClient) -> str:
+_CHECKSUM_CHUNK = 64 * 1024
+
+
+def _fetch_remote_bash_path(ssh: paramiko.SSHClient) -> Optional[str]:
     try:
         _, stdout, _ = ssh.exec_command("command -v bash")
         result = stdout.read().decode().strip()
@@ -25,10 +33,17 @@ def get_remote_bash_path(ssh: paramiko.SSHClient) -> str:
             return result
     except Exception:
         pass
-    return "/bin/bash"
+    return None
 
 
-def get_remote_home(ssh: paramiko.SSHClient) -> Optional[str]:
+def get_remote_bash_path(ssh: paramiko.SSHClient) -> str:
+    bash_path = host_facts.cached(
+        ssh, "bash_path", lambda: _fetch_remote_bash_path(ssh)
+    )
+    return bash_path or "/bin/bash"
+
+
+def _fetch_remote_home(ssh: paramiko.SSHClient) -> Optional[str]:
     try:
         _, stdout, stderr = ssh.exec_command("echo ~")
         home = stdout.read().decode().strip()
@@ -52,6 +67,10 @@ def get_remote_home(ssh: paramiko.SSHClient) -> Optional[str]:
         return None
 
 
+def get_remote_home(ssh: paramiko.SSHClient) -> Optional[str]:
+    return host_facts.cached(ssh, "home", lambda: _fetch_remote_home(ssh))
+
+
 def is_wrapper_installed_local() -> bool:
     target_file = CONFIG_DIR / WRAPPER_DIST
 
@@ -62,10 +81,10 @@ def is_wrapper_installed_local() -> bool:
     )
 
 
-def is_wrapper_installed_remote(ssh: paramiko.SSHClient) -> bool:
+def _fetch_wrapper_installed_remote(ssh: paramiko.SSHClient) -> Optional[bool]:
     home = get_remote_home(ssh)
     if not home:
-        return False
+        return None
 
     remote_file = f"{home}/{CONFIG_REL_PATH}/{WRAPPER_DIST}"
 
@@ -78,11 +97,19 @@ def is_wrapper_installed_remote(ssh: paramiko.SSHClient) -> bool:
 
     if err:
         print(f"Error: {err}")
-        return False
+        return None
 
     return result == "OK"
 
 
+def is_wrapper_installed_remote(ssh: paramiko.SSHClient) -> bool:
+    return bool(
+        host_facts.cached(
+            ssh, "wrapper_installed", lambda: _fetch_wrapper_installed_remote(ssh)
+        )
+    )
+
+
 def is_wrapper_installed(ssh: paramiko.SSHClient | None = None) -> bool:
     if ssh is None:
         return is_wrapper_installed_local()
@@ -90,10 +117,72 @@ def is_wrapper_installed(ssh: paramiko.SSHClient | None = None) -> bool:
         return is_wrapper_installed_remote(ssh)
 
 
+def file_checksum(path) -> str | None:
+    """sha256 of the file at ``path``, or ``None`` if it can't be read."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            while chunk := f.read(_CHECKSUM_CHUNK):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def wrapper_checksum() -> str:
+    """sha256 of the wrapper shipped with this version of cronboard."""
+    return file_checksum(WRAPPER_SOURCE) or ""
+
+
+def remote_checksum_command(path: str) -> str:
+    """Print the sha256 of ``path`` if it is an executable file, else nothing."""
+    quoted = shlex.quote(path)
+    return (
+        f"if [ -f {quoted} ] && [ -x {quoted} ]; then "
+        f"(sha256sum {quoted} || shasum -a 256 {quoted}) 2>/dev/null | cut -c1-64; fi"
+    )
+
+
+def _fetch_wrapper_checksum_remote(ssh: paramiko.SSHClient) -> Optional[str]:
+    home = get_remote_home(ssh)
+    if not home:
+        return None
+    try:
+        _, stdout, _ = ssh.exec_command(
+            remote_checksum_command(f"{home}/{CONFIG_REL_PATH}/{WRAPPER_DIST}")
+        )
+        return stdout.read().decode().strip()
+    except Exception as e:
+        print(f"Error: {e}")
+        return None
+
+
+def installed_wrapper_checksum(ssh: paramiko.SSHClient | None = None) -> str | None:
+    """sha256 of the installed wrapper, ``""`` if it is missing, ``None`` on errors."""
+    if ssh is None:
+        if not is_wrapper_installed_local():
+            return ""
+        return file_checksum(CONFIG_DIR / WRAPPER_DIST)
+    return host_facts.cached(
+        ssh, "wrapper_checksum", lambda: _fetch_wrapper_checksum_remote(ssh)
+    )
+
+
+def wrapper_status(ssh: paramiko.SSHClient | None = None) -> str:
+    """Whether the host runs the wrapper of this version: current, stale or missing."""
+    installed = installed_wrapper_checksum(ssh)
+    if not installed:
+        return WRAPPER_MISSING
+    return WRAPPER_CURRENT if installed == wrapper_checksum() else WRAPPER_STALE
+
+
 def install_wrapper_local():
     target_dir = CONFIG_DIR
     target_file = CONFIG_DIR / WRAPPER_DIST
 
+    if wrapper_status() == WRAPPER_CURRENT:
+        return str(target_file)
+
     target_dir.mkdir(parents=True, exist_ok=True)
 
     with open(WRAPPER_SOURCE, "rb") as src, open(target_file, "wb") as dst:
@@ -106,10 +195,15 @@ def install_wrapper_local():
 
 def install_wrapper_remote(ssh: paramiko.SSHClient):
     home = get_remote_home(ssh)
+    if not home:
+        return None
 
     remote_dir = f"{home}/{CONFIG_REL_PATH}"
     remote_file = f"{remote_dir}/{WRAPPER_DIST}"
 
+    if wrapper_status(ssh) == WRAPPER_CURRENT:
+        return remote_file
+
     sftp = ssh.open_sftp()
 
     try:
@@ -118,10 +212,12 @@ def install_wrapper_remote(ssh: paramiko.SSHClient):
         ssh.exec_command(f"chmod +x {remote_file}")
     except Exception as e:
         print(f"Error: {e}")
+        host_facts.invalidate(ssh, "wrapper_installed", "wrapper_checksum")
         return None
     finally:
         sftp.close()
 
+    host_facts.update(ssh, wrapper_installed=True, wrapper_checksum=wrapper_checksum())
     return remote_file
 
 
@@ -147,18 +243,18 @@ def _decode_wrapped_command_payload(token: str) -> str | None:
         return None
 
 
-def wrap_command(
-    command: str, identificator: str, ssh: paramiko.SSHClient | None = None
-):
-    wrapper_path = install_wrapper(ssh)
-    if wrapper_path is None:
-        # If this is None, it means failed to install wrapper in ssh server
-        return command
+def local_bash_path() -> str:
+    return shutil.which("bash") or "/bin/bash"
 
-    if ssh is not None:
-        bash_path = get_remote_bash_path(ssh)
-    else:
-        bash_path = shutil.which("bash") or "/bin/bash"
+
+def render_wrapped_command(
+    command: str, identificator: str, wrapper_path: str, bash_path: str
+) -> str:
+    """Return ``command`` as it looks once wrapped for logging.
+
+    Pure: it only uses the host facts passed in and never touches the host, so it
+    is safe to call for previews and lookups.
+    """
     try:
         parts = shlex.split(command)
     except ValueError:
@@ -179,47 +275,68 @@ def wrap_command(
     )
 
 
-def has_wrapper(command: str) -> bool:
-    try:
-        parts = shlex.split(command)
-    except ValueError:
-        return False
-
-    if len(parts) < 4:
-        return False
-
-    if not parts[0].endswith("/bash"):
-        return False
+def wrap_command(
+    command: str, identificator: str, ssh: paramiko.SSHClient | None = None
+):
+    """Install the wrapper on the target host and return the wrapped ``command``.
 
-    wrapper_path = parts[1]
+    Only meant for saving a job with logging enabled; use
+    :func:`render_wrapped_command` when the host facts are already known.
+    """
+    wrapper_path = install_wrapper(ssh)
+    if wrapper_path is None:
+        # If this is None, it means failed to install wrapper in ssh server
+        return command
 
-    return (
-        wrapper_path.endswith("cron-wrapper.sh") and bool(parts[2])  # identificator
-    )
+    if ssh is not None:
+        bash_path = get_remote_bash_path(ssh)
+    else:
+        bash_path = local_bash_path()
+    return render_wrapped_command(command, identificator, wrapper_path, bash_path)
 
 
-def command_without_wrapper(command: str):
+def _wrapper_parts(command: str) -> list[str] | None:
+    """Split ``command`` if it is a wrapped crontab line, else return ``None``."""
     try:
         parts = shlex.split(command)
     except ValueError:
-        return command
+        return None
 
+    # bash + wrapper + identificator + command
     if len(parts) < 4:
-        return command
+        return None
 
     if not parts[0].endswith("/bash"):
-        return command
+        return None
 
     wrapper_path = parts[1]
 
     if not wrapper_path.endswith("cron-wrapper.sh"):
-        return command
+        return None
 
-    # strip: bash + wrapper + identificator
-    if len(parts) < 4:
+    return parts
+
+
+def _strip_wrapper(command: str, parts: list[str] | None) -> str:
+    if parts is None:
         return command
     decoded = _decode_wrapped_command_payload(parts[3])
     if decoded is not None:
         return decoded
     # Legacy: remainder was split as argv words; best-effort rejoin.
     return " ".join(parts[3:])
+
+
+def has_wrapper(command: str) -> bool:
+    parts = _wrapper_parts(command)
+    return parts is not None and bool(parts[2])  # identificator
+
+
+def command_without_wrapper(command: str):
+    return _strip_wrapper(command, _wrapper_parts(command))
+
+
+def unwrap_command(command: str) -> tuple[str, bool]:
+    """``(command_without_wrapper(command), has_wrapper(command))`` with a single parse."""
+    parts = _wrapper_parts(command)
+    return _strip_wrapper(command, parts), parts is not None and bool(parts[2])
@@ -0,0 +1,537 @@
+from __future__ import annotations
+
+import mmap
+import os
+import sys
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from array import array
+from typing import BinaryIO
+
+import paramiko
+
+# Bytes fetched per SFTP range read; a few thousand lines of a typical log.
+LOG_READ_CHUNK = 256 * 1024
+# Lines kept loaded past the bottom of the viewport, so scrolling rarely waits.
+LOG_READ_AHEAD_LINES = 1000
+# Decoded lines a log read in ranges keeps in memory, around the viewport.
+LOG_WINDOW_LINES = 10 * LOG_READ_AHEAD_LINES
+# Lines indexed per background step of a local log, between viewport updates.
+LOG_INDEX_BATCH_LINES = 100_000
+# Unread bytes past which following a remote log jumps to its tail instead.
+LOG_FOLLOW_MAX_BACKLOG = 4 * LOG_READ_CHUNK
+
+
+def _inflate(inflater, data: bytes) -> tuple[bytes, object]:
+    """Inflate the next bytes of a gzip file; returns the inflater to go on with."""
+    inflated = []
+    while data:
+        inflated.append(inflater.decompress(data))
+        if not inflater.eof:
+            break
+        # ``gzip`` output may hold several members back to back.
+        data = inflater.unused_data
+        inflater = zlib.decompressobj(wbits=31)
+    return b"".join(inflated), inflater
+
+
+class LogSource:
+    """The lines of one log file, indexed from the start as far as it was read.
+
+    ``len(source)`` is the number of lines available so far and
+    :meth:`read_more` is the blocking call that makes more available; a
+    widget only ever asks for the lines it is about to show. ``ssh`` is the
+    client the reads go through, or ``None`` for a local file.
+
+    Sources with ``index_whole_file`` set are cheap to index and keep being
+    read past the viewport until the whole file is, so the scrollbar ends
+    up reflecting the full log.
+    """
+
+    ssh: paramiko.SSHClient | None = None
+    index_whole_file = False
+
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+        self.complete = False
+        # Length of the longest line available, to size horizontal scrolling.
+        self.max_line_length = 0
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def line(self, index: int) -> str:
+        return self._lines[index]
+
+    def lines(self, start: int, end: int) -> list[str]:
+        return self._lines[start:end]
+
+    def read_more(self, upto: int) -> int:
+        """Read until ``upto`` lines are available or the file ends."""
+        return len(self._lines)
+
+    def has_lines(self, start: int, end: int) -> bool:
+        """Whether lines ``start`` to ``end`` can be shown without :meth:`load`."""
+        return True
+
+    def load(self, start: int, end: int) -> None:
+        """Make lines ``start`` to ``end`` available again, reading them if needed."""
+
+    def follow(self) -> bool:
+        """Read whatever was appended to the file since it was last read.
+
+        Returns whether there are new lines. The cost depends only on the
+        bytes appended, not on the size of the file.
+        """
+        return False
+
+    def close(self) -> None:
+        pass
+
+
+class ListLogSource(LogSource):
+    """Lines that are already in memory, e.g. a placeholder message."""
+
+    def __init__(self, lines: list[str]) -> None:
+        super().__init__()
+        self._lines = list(lines)
+        self.complete = True
+        self.max_line_length = max(map(len, self._lines), default=0)
+
+
+class ChunkedLogSource(LogSource, ABC):
+    """A log read in byte ranges of ``chunk_size``, in order from its start.
+
+    Ranges are only read when more lines are asked for, so showing the
+    first screen of a large log costs a single range read. Logs ending in
+    ``.gz`` are inflated as they are read.
+
+    Every line read is indexed by its byte span, but only a window of
+    ``window_lines`` decoded lines is kept, so memory does not grow with
+    the log; lines that left the window are read again by :meth:`load`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        chunk_size: int = LOG_READ_CHUNK,
+        window_lines: int = LOG_WINDOW_LINES,
+    ) -> None:
+        super().__init__()
+        self.path = path
+        self.chunk_size = chunk_size
+        self.window_lines = window_lines
+        self.compressed = path.endswith(".gz")
+        self._inflater = zlib.decompressobj(wbits=31) if self.compressed else None
+        # Bytes of the file read so far, and how far that is in the log once
+        # inflated; everything before it is indexed except ``_partial``, the
+        # last line without its newline.
+        self.offset = 0
+        self._position = 0
+        self.size: int | None = None
+        self._partial = b""
+        # Start and end in the inflated log of every indexed line, without
+        # its newline.
+        self._starts = array("Q")
+        self._ends = array("Q")
+        # Lines that are not in the file, i.e. the marker of skipped bytes.
+        self._markers: dict[int, str] = {}
+        # ``_lines`` holds the decoded lines from ``_window_start`` on.
+        self._window_start = 0
+        # Whether ``_partial`` is shown as the last line; it is taken back
+        # out when the rest of that line is appended later.
+        self._partial_shown = False
+        # Whether reading starts mid-line, after skipping to the tail.
+        self._resync = False
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _file_size(self) -> int:
+        """Size of the file as stored, i.e. compressed for ``.gz`` logs."""
+
+    @abstractmethod
+    def _read_range(self, offset: int, length: int) -> bytes:
+        """Up to ``length`` bytes of the file as stored, from ``offset``."""
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def line(self, index: int) -> str:
+        window_index = index - self._window_start
+        if 0 <= window_index < len(self._lines):
+            return self._lines[window_index]
+        return ""
+
+    def lines(self, start: int, end: int) -> list[str]:
+        return [self.line(index) for index in range(start, min(end, len(self)))]
+
+    def has_lines(self, start: int, end: int) -> bool:
+        end = min(end, len(self))
+        window_end = self._window_start + len(self._lines)
+        return start >= end or (self._window_start <= start and end <= window_end)
+
+    def load(self, start: int, end: int) -> None:
+        with self._lock:
+            start = max(start, 0)
+            end = min(end, len(self), start + self.window_lines)
+            if self.has_lines(start, end):
+                return
+            try:
+                lines = self._read_lines(start, end)
+            except Exception:
+                self.close()
+                raise
+            self._lines, self._window_start = lines, start
+
+    def _read_lines(self, start: int, end: int) -> list[str]:
+        lines = []
+        run_start = start
+        # Read each run of lines between markers with one range, so the
+        # bytes skipped while following are never read.
+        for index in range(start, end + 1):
+            if index < end and index not in self._markers:
+                continue
+            if run_start < index:
+                text = self._read_text(self._starts[run_start], self._ends[index - 1])
+                base = self._starts[run_start]
+                lines.extend(
+                    text[self._starts[i] - base : self._ends[i] - base].decode(
+                        errors="replace"
+                    )
+                    for i in range(run_start, index)
+                )
+            if index < end:
+                lines.append(self._markers[index])
+            run_start = index + 1
+        return lines
+
+    def _read_text(self, begin: int, end: int) -> bytes:
+        """The inflated log from ``begin`` to ``end``, read from the file again."""
+        if self._inflater is None:
+            parts, offset = [], begin
+            while offset < end:
+                data = self._read_range(offset, min(self.chunk_size, end - offset))
+                if not data:
+                    break
+                parts.append(data)
+                offset += len(data)
+            return b"".join(parts)
+
+        # Compressed logs can't be entered midway; inflate them from the start.
+        inflater = zlib.decompressobj(wbits=31)
+        parts, offset, position = [], 0, 0
+        while position < end:
+            data = self._read_range(offset, self.chunk_size)
+            if not data:
+                break
+            offset += len(data)
+            data, inflater = _inflate(inflater, data)
+            if position + len(data) > begin:
+                parts.append(data[max(begin - position, 0) :])
+            position += len(data)
+        return b"".join(parts)[: end - begin]
+
+    def read_more(self, upto: int) -> int:
+        with self._lock:
+            while len(self) < upto and not self.complete:
+                try:
+                    self._read_chunk()
+                except Exception:
+                    # The handle may belong to a session that dropped; open
+                    # a fresh one if the read is retried after a reconnect.
+                    self.close()
+                    raise
+            return len(self)
+
+    def _read_chunk(self) -> None:
+        if self.size is None or self.offset >= self.size:
+            self.size = self._file_size()
+        length = min(self.chunk_size, self.size - self.offset)
+        data = self._read_range(self.offset, length) if length > 0 else b""
+        if not data:
+            self._end_of_file()
+            return
+        self.offset += len(data)
+        if self._inflater is not None:
+            data, self._inflater = _inflate(self._inflater, data)
+        if self._resync:
+            newline = data.find(b"\n")
+            if newline == -1:
+                self._position += len(data)
+                return
+            self._position += newline + 1
+            data, self._resync = data[newline + 1 :], False
+        if self._partial_shown:
+            self._pop_line()
+            self._partial_shown = False
+        start = self._position - len(self._partial)
+        self._position += len(data)
+        *complete_lines, self._partial = (self._partial + data).split(b"\n")
+        for line in complete_lines:
+            self._index(start, line)
+            start += len(line) + 1
+
+    def _index(self, start: int, line: bytes, marker: str | None = None) -> None:
+        """Index one line, decoding it too while the window is at the end."""
+        index = len(self)
+        self._starts.append(start)
+        self._ends.append(start + len(line))
+        self.max_line_length = max(self.max_line_length, len(line))
+        if marker is not None:
+            self._markers[index] = marker
+        if self._window_start + len(self._lines) != index:
+            return
+        self._lines.append(marker or line.decode(errors="replace"))
+        overflow = len(self._lines) - self.window_lines
+        if overflow > 0:
+            del self._lines[:overflow]
+            self._window_start += overflow
+
+    def _pop_line(self) -> None:
+        index = len(self) - 1
+        self._starts.pop()
+        self._ends.pop()
+        self._markers.pop(index, None)
+        if self._window_start + len(self._lines) == index + 1 and self._lines:
+            self._lines.pop()
+
+    def _end_of_file(self) -> None:
+        if self._partial and not self._partial_shown:
+            self._index(self._position - len(self._partial), self._partial)
+            self._partial_shown = True
+        self.complete = True
+
+    def follow(self) -> bool:
+        if self.compressed:
+            # Only finished logs are compressed; nothing is appended to them.
+            return False
+        with self._lock:
+            try:
+                size = self._file_size()
+            except Exception:
+                self.close()
+                raise
+            if size == self.size and self.complete:
+                return False
+            if size < self.offset:
+                # Truncated or replaced; like ``tail -F``, start over.
+                self._reset()
+            elif size - self.offset > LOG_FOLLOW_MAX_BACKLOG:
+                self._skip_to(size - LOG_READ_CHUNK)
+            self.size = size
+            self.complete = False
+        before = len(self)
+        self.read_more(sys.maxsize)
+        return len(self) != before or self._partial_shown
+
+    def _reset(self) -> None:
+        self._lines.clear()
+        self._starts, self._ends = array("Q"), array("Q")
+        self._markers.clear()
+        self._window_start = 0
+        self.offset = self._position = 0
+        self._partial = b""
+        self._partial_shown = self._resync = False
+
+    def _skip_to(self, offset: int) -> None:
+        if self._partial_shown:
+            self._pop_line()
+        skipped = offset - self.offset + len(self._partial)
+        self._index(offset, b"", f"... {skipped} bytes skipped ...")
+        self.offset = self._position = offset
+        self._partial = b""
+        self._partial_shown, self._resync = False, True
+
+
+class RemoteLogSource(ChunkedLogSource):
+    """A remote log read over SFTP, one ``readv`` per byte range."""
+
+    def __init__(
+        self,
+        ssh: paramiko.SSHClient,
+        path: str,
+        chunk_size: int = LOG_READ_CHUNK,
+        window_lines: int = LOG_WINDOW_LINES,
+    ) -> None:
+        super().__init__(path, chunk_size, window_lines)
+        self.ssh = ssh
+        self._sftp: paramiko.SFTPClient | None = None
+        self._handle: paramiko.SFTPFile | None = None
+
+    def _open(self) -> paramiko.SFTPFile:
+        if self._handle is None:
+            self._sftp = self.ssh.open_sftp()
+            self._handle = self._sftp.open(self.path, "rb")
+        return self._handle
+
+    def _file_size(self) -> int:
+        return self._open().stat().st_size
+
+    def _read_range(self, offset: int, length: int) -> bytes:
+        return b"".join(self._open().readv([(offset, length)]))
+
+    def close(self) -> None:
+        # Closing the SFTP channel also releases the file handle on the server.
+        sftp, self._sftp, self._handle = self._sftp, None, None
+        if sftp is not None:
+            sftp.close()
+
+
+class GzipLogSource(ChunkedLogSource):
+    """A local log compressed by the retention policy, inflated range by range."""
+
+    def __init__(
+        self,
+        path: str,
+        chunk_size: int = LOG_READ_CHUNK,
+        window_lines: int = LOG_WINDOW_LINES,
+    ) -> None:
+        super().__init__(path, chunk_size, window_lines)
+        self._file: BinaryIO | None = None
+
+    def _open(self) -> BinaryIO:
+        if self._file is None:
+            self._file = open(self.path, "rb")
+        return self._file
+
+    def _file_size(self) -> int:
+        return os.fstat(self._open().fileno()).st_size
+
+    def _read_range(self, offset: int, length: int) -> bytes:
+        f = self._open()
+        f.seek(offset)
+        return f.read(length)
+
+    def close(self) -> None:
+        f, self._file = self._file, None
+        if f is not None:
+            f.close()
+
+
+class MmapLogSource(LogSource):
+    """A local log that is memory-mapped and indexed by line start offsets.
+
+    Only the offsets are kept in memory; a line is decoded when it is asked
+    for, so opening a multi-GB log costs neither time nor memory up front.
+    """
+
+    index_whole_file = True
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = path
+        self._map = self._map_file()
+        # Start of every indexed line, followed by where indexing resumes.
+        self._offsets = array("Q", [0])
+        # Whether the last indexed line has no newline yet.
+        self._open_line = False
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _map_file(self) -> mmap.mmap:
+        with open(self.path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def line(self, index: int) -> str:
+        try:
+            start, end = self._offsets[index], self._offsets[index + 1]
+            return self._map[start:end].decode(errors="replace")
+        except (IndexError, ValueError):
+            # Started over by :meth:`follow` or closed while rendering.
+            return ""
+
+    def lines(self, start: int, end: int) -> list[str]:
+        return [self.line(index) for index in range(start, min(end, len(self)))]
+
+    def read_more(self, upto: int) -> int:
+        with self._lock:
+            try:
+                self._index(max(upto, len(self) + LOG_INDEX_BATCH_LINES))
+            finally:
+                if self._closed:
+                    self._map.close()
+            return len(self)
+
+    def _index(self, upto: int) -> None:
+        data, offsets = self._map, self._offsets
+        position, size = offsets[-1], len(data)
+        longest = self.max_line_length
+        while len(offsets) - 1 < upto and not self._closed:
+            newline = data.find(b"\n", position)
+            end = size if newline == -1 else newline + 1
+            if end > position:
+                offsets.append(end)
+                longest = max(longest, end - position)
+                self._open_line = newline == -1
+            if newline == -1:
+                self.complete = True
+                break
+            position = end
+        self.max_line_length = longest
+
+    def follow(self) -> bool:
+        with self._lock:
+            if self._closed:
+                return False
+            size = os.path.getsize(self.path)
+            if size == len(self._map):
+                return False
+            if size < self._offsets[-1]:
+                # Truncated or replaced; like ``tail -F``, start over.
+                self._offsets = array("Q", [0])
+                self._open_line, before = False, -1
+            else:
+                if self._open_line:
+                    # Indexed again below, so a line that only grew counts too.
+                    self._offsets.pop()
+                    self._open_line = False
+                before = len(self)
+            if size:
+                # The old map is not closed here: rendering reads lines
+                # without the lock and may still hold on to it.
+                self._map = self._map_file()
+                self.complete = False
+                self._index(sys.maxsize)
+            return len(self) != before
+
+    def close(self) -> None:
+        self._closed = True
+        # Mid-index, the reading thread closes the map once it stops.
+        if self._lock.acquire(blocking=False):
+            try:
+                self._map.close()
+            finally:
+                self._lock.release()
+
+
+def open_log_source(
+    log_path: str, ssh: paramiko.SSHClient | None = None
+) -> LogSource | None:
+    """Open ``log_path`` for viewing; ``None`` if it is missing or empty.
+
+    Remote logs come back with their first range already read.
+    """
+    if ssh is None:
+        try:
+            if os.path.getsize(log_path) == 0:
+                return None
+            if log_path.endswith(".gz"):
+                return GzipLogSource(log_path)
+            return MmapLogSource(log_path)
+        except OSError:
+            return None
+
+    source = RemoteLogSource(ssh, log_path)
+    try:
+        source.read_more(1)
+    except OSError as e:
+        print(f"Error: {e}")
+        return None
+    if not len(source):
+        source.close()
+        return None
+    return source
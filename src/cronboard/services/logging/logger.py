@@ -1,67 +1,136 @@
+import glob
 import paramiko
+import re
 import shlex
+from typing import NamedTuple
 from pathlib import Path
 import posixpath
 from cronboard.services.logging.cron_wrapper import get_remote_home
 from cronboard.config import LOG_DIR, LOG_REL_PATH
 
 
-def get_log_files(identificator: str, ssh: paramiko.SSHClient | None = None):
-    if ssh is None:
-        log_dir = LOG_DIR
-        if not log_dir.exists():
-            return {}
-        return {
-            p.stem: str(p)
-            for p in sorted(
-                log_dir.glob(f"{identificator}_*.log"), key=lambda p: p.stem
-            )
-        }
-    else:
-        home = get_remote_home(ssh)
-        if not home:
-            return {}
-        log_dir = posixpath.join(home, LOG_REL_PATH)
+class LogEntry(NamedTuple):
+    path: str
+    size: int
+    mtime: float
 
-        cmd = f"ls {log_dir} 2>/dev/null"
-        _, stdout, stderr = ssh.exec_command(cmd)
-        files = stdout.read().decode().splitlines()
-        errors = stderr.read().decode().strip()
 
-        if errors:
-            print(f"Error: {errors}")
-            return {}
+# Logs compressed by the retention policy keep their name with ``.gz`` added.
+LOG_SUFFIXES = (".log", ".log.gz")
 
-        result = {}
-        for file in sorted(files):
-            if file.startswith(f"{identificator}_") and file.endswith(".log"):
-                stem = file[:-4]  # remove ".log"
-                full_path = posixpath.join(log_dir, file)
-                result[stem] = full_path
 
-        return result
+# The ``%Y-%m-%d_%H-%M-%S`` stamp the wrapper puts between the job id and the
+# suffix; matching it keeps ``backup`` from taking the logs of ``backup_daily``.
+_STAMP_GLOB = (
+    "[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]_[0-9][0-9]-[0-9][0-9]-[0-9][0-9]"
+)
+_STAMP = r"[0-9]{4}-[0-9]{2}-[0-9]{2}_[0-9]{2}-[0-9]{2}-[0-9]{2}"
+
+
+def _log_name_pattern(identificator: str) -> str:
+    """``<identificator>_<stamp>`` for ``find -name``, with glob characters escaped."""
+    return re.sub(r"([*?\[\\])", r"\\\1", identificator) + "_" + _STAMP_GLOB
+
+
+def _log_key(name: str, identificator: str) -> str | None:
+    """``name`` without its suffix if it is a log of ``identificator``."""
+    suffixes = "|".join(re.escape(suffix) for suffix in LOG_SUFFIXES)
+    match = re.fullmatch(rf"({re.escape(identificator)}_{_STAMP})(?:{suffixes})", name)
+    return match.group(1) if match else None
+
 
+def _list_remote_entries(
+    ssh: paramiko.SSHClient, log_dir: str, identificator: str
+) -> dict[str, LogEntry] | None:
+    """Let ``find`` pick the job's logs on the host; ``None`` if it can't."""
+    pattern = _log_name_pattern(identificator)
+    names = " -o ".join(
+        f"-name {shlex.quote(pattern + suffix)}" for suffix in LOG_SUFFIXES
+    )
+    cmd = (
+        f"find {shlex.quote(log_dir)} -maxdepth 1 -type f \\( {names} \\) "
+        "-printf '%s %T@ %f\\n'"
+    )
+    _, stdout, stderr = ssh.exec_command(cmd)
+    output = stdout.read().decode(errors="replace")
+    errors = stderr.read().decode(errors="replace").strip()
+    if errors:
+        # E.g. a BusyBox or BSD find without -printf, or no log directory.
+        return None
 
-def read_log_file(log_path: str, ssh: paramiko.SSHClient | None = None):
+    result = {}
+    for line in output.splitlines():
+        try:
+            size, mtime, name = line.split(" ", 2)
+            entry = LogEntry(posixpath.join(log_dir, name), int(size), float(mtime))
+        except ValueError:
+            continue
+        key = _log_key(name, identificator)
+        if key is not None:
+            result[key] = entry
+    return result
+
+
+def _list_remote_entries_sftp(
+    ssh: paramiko.SSHClient, log_dir: str, identificator: str
+) -> dict[str, LogEntry]:
+    try:
+        with ssh.open_sftp() as sftp:
+            attrs = sftp.listdir_attr(log_dir)
+    except OSError:
+        return {}
+    result = {}
+    for attr in attrs:
+        key = _log_key(attr.filename, identificator)
+        if key is not None:
+            result[key] = LogEntry(
+                posixpath.join(log_dir, attr.filename),
+                attr.st_size or 0,
+                float(attr.st_mtime or 0),
+            )
+    return result
+
+
+def get_log_entries(
+    identificator: str, ssh: paramiko.SSHClient | None = None
+) -> dict[str, LogEntry]:
+    """The logs of ``identificator`` by name, with their size and mtime.
+
+    Names leave out the ``.log`` or ``.log.gz`` suffix. On a remote host the
+    directory is filtered there, so only the job's own logs are transferred,
+    whatever else the directory holds.
+    """
     if ssh is None:
-        log_file = Path(log_path)
-        if not log_file.exists():
-            return []
-        with open(log_file, "r") as f:
-            return f.readlines()
-    else:
-        safe_path = shlex.quote(log_path)
+        log_dir = LOG_DIR
+        if not log_dir.exists():
+            return {}
+        result = {}
+        for p in log_dir.glob(f"{glob.escape(identificator)}_{_STAMP_GLOB}.log*"):
+            key = _log_key(p.name, identificator)
+            if key is None:
+                continue
+            try:
+                stat = p.stat()
+            except OSError:
+                continue
+            result[key] = LogEntry(str(p), stat.st_size, stat.st_mtime)
+        return dict(sorted(result.items()))
+
+    home = get_remote_home(ssh)
+    if not home:
+        return {}
+    log_dir = posixpath.join(home, LOG_REL_PATH)
 
-        _, stdout, stderr = ssh.exec_command(f"test -f {safe_path} && cat {safe_path}")
-        output = stdout.read().decode()
-        error = stderr.read().decode()
+    entries = _list_remote_entries(ssh, log_dir, identificator)
+    if entries is None:
+        entries = _list_remote_entries_sftp(ssh, log_dir, identificator)
+    return dict(sorted(entries.items()))
 
-        if not output or error:
-            if error:
-                print(f"Error: {error}")
-            return []
 
-        return output.splitlines(keepends=True)
+def get_log_files(identificator: str, ssh: paramiko.SSHClient | None = None):
+    return {
+        name: entry.path for name, entry in get_log_entries(identificator, ssh).items()
+    }
 
 
 def delete_logs_for_identificator(
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import posixpath
+import shlex
+import subprocess
+from typing import NamedTuple
+
+import paramiko
+
+from cronboard.config import CONFIG_REL_PATH, RETENTION_DIST, RETENTION_FILE
+from cronboard.services.logging.cron_wrapper import (
+    get_remote_bash_path,
+    get_remote_home,
+    install_wrapper,
+    local_bash_path,
+)
+from cronboard.services.remote import RemoteResult, run_sync
+
+# Policy line applied to every job without a line of its own.
+DEFAULT_JOB = "*"
+
+_HEADER = """\
+# Log retention for cronboard jobs, read by cron-wrapper.sh after every run.
+# <job id>  <max count>  <max age in days>  <gzip after days>
+# "-" leaves a limit unset; a "*" line applies to jobs without their own line.
+"""
+
+
+class RetentionPolicy(NamedTuple):
+    max_count: int | None = None
+    max_age_days: int | None = None
+    compress_after_days: int | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return self == RetentionPolicy()
+
+
+def _parse_limit(value: str) -> int | None:
+    if value == "-":
+        return None
+    limit = int(value)
+    if limit <= 0:
+        raise ValueError(f"limit must be positive: {value}")
+    return limit
+
+
+def parse_policies(text: str) -> dict[str, RetentionPolicy]:
+    """Read a retention file; lines that can't be parsed are skipped."""
+    policies = {}
+    for line in text.splitlines():
+        fields = line.split()
+        if len(fields) != 4 or fields[0].startswith("#"):
+            continue
+        try:
+            policies[fields[0]] = RetentionPolicy(*map(_parse_limit, fields[1:]))
+        except ValueError:
+            continue
+    return policies
+
+
+def render_policies(policies: dict[str, RetentionPolicy]) -> str:
+    lines = [
+        " ".join([job, *("-" if limit is None else str(limit) for limit in policy)])
+        for job, policy in sorted(policies.items())
+        if not policy.is_empty
+    ]
+    return _HEADER + "".join(f"{line}\n" for line in lines)
+
+
+def policy_for(
+    policies: dict[str, RetentionPolicy], identificator: str
+) -> RetentionPolicy:
+    """The policy the wrapper applies to ``identificator``."""
+    return policies.get(identificator) or policies.get(DEFAULT_JOB, RetentionPolicy())
+
+
+def _remote_retention_file(ssh: paramiko.SSHClient) -> str | None:
+    home = get_remote_home(ssh)
+    if not home:
+        return None
+    return posixpath.join(home, CONFIG_REL_PATH, RETENTION_DIST)
+
+
+def load_policies(ssh: paramiko.SSHClient | None = None) -> dict[str, RetentionPolicy]:
+    if ssh is None:
+        try:
+            return parse_policies(RETENTION_FILE.read_text(encoding="utf-8"))
+        except OSError:
+            return {}
+
+    path = _remote_retention_file(ssh)
+    if path is None:
+        return {}
+    try:
+        with ssh.open_sftp() as sftp, sftp.open(path, "rb") as f:
+            return parse_policies(f.read().decode(errors="replace"))
+    except OSError:
+        return {}
+
+
+def save_policies(
+    policies: dict[str, RetentionPolicy], ssh: paramiko.SSHClient | None = None
+) -> None:
+    content = render_policies(policies)
+    if ssh is None:
+        RETENTION_FILE.parent.mkdir(parents=True, exist_ok=True)
+        RETENTION_FILE.write_text(content, encoding="utf-8")
+        return
+
+    path = _remote_retention_file(ssh)
+    if path is None:
+        raise OSError("could not find the remote home directory")
+    run_sync(ssh, f"mkdir -p {shlex.quote(posixpath.dirname(path))}")
+    with ssh.open_sftp() as sftp, sftp.open(path, "w") as f:
+        f.write(content)
+
+
+def set_policy(
+    identificator: str,
+    policy: RetentionPolicy,
+    ssh: paramiko.SSHClient | None = None,
+) -> dict[str, RetentionPolicy]:
+    """Store ``policy`` for one job; an empty policy removes its line."""
+    policies = load_policies(ssh)
+    if policy.is_empty:
+        policies.pop(identificator, None)
+    else:
+        policies[identificator] = policy
+    save_policies(policies, ssh)
+    return policies
+
+
+def enforce_retention(
+    identificators: list[str], ssh: paramiko.SSHClient | None = None
+) -> RemoteResult:
+    """Apply the retention policies to the logs of ``identificators`` now.
+
+    Runs the wrapper in its maintenance mode, so logs are cleaned up exactly
+    as they are after a job run.
+    """
+    wrapper_path = install_wrapper(ssh)
+    if wrapper_path is None:
+        return RemoteResult(1, "", "could not install the log wrapper")
+
+    if ssh is None:
+        completed = subprocess.run(
+            [local_bash_path(), wrapper_path, "--retention", *identificators],
+            capture_output=True,
+            text=True,
+        )
+        return RemoteResult(
+            completed.returncode, completed.stdout, completed.stderr.strip()
+        )
+
+    command = " ".join(
+        shlex.quote(arg)
+        for arg in (
+            get_remote_bash_path(ssh),
+            wrapper_path,
+            "--retention",
+            *identificators,
+        )
+    )
+    return run_sync(ssh, command)
@@ -17,3 +17,20 @@ class CronJobDeleted(Message):
         self.identificator = identificator
         self.ssh_client = ssh_client
         super().__init__()
+
+
+class RemoteCrontabLoaded(Message):
+    """Dispatched after a remote crontab (and its host probe) finished loading."""
+
+    def __init__(self, ssh_client: Any) -> None:
+        self.ssh_client = ssh_client
+        super().__init__()
+
+
+class FleetHostFetched(Message):
+    """Dispatched by the fleet view each time one server answered or failed."""
+
+    def __init__(self, server_id: str, error: str | None) -> None:
+        self.server_id = server_id
+        self.error = error
+        super().__init__()
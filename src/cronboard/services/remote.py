@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import shlex
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple, TypeVar
+
+import paramiko
+
+REMOTE_MAX_WORKERS = 16
+# OpenSSH allows 10 sessions per connection by default (MaxSessions).
+REMOTE_MAX_PER_HOST = 4
+# Pause before each reconnect attempt after a session dropped.
+RECONNECT_BACKOFF = (0.0, 1.0, 2.0, 4.0, 8.0)
+
+T = TypeVar("T")
+
+
+class RemoteResult(NamedTuple):
+    exit_status: int
+    stdout: str
+    stderr: str
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_status == 0 and not self.stderr
+
+
+def crontab_write_command(crontab_user: str | None = None) -> str:
+    return f"crontab -u {shlex.quote(crontab_user)} -" if crontab_user else "crontab -"
+
+
+def run_sync(ssh: paramiko.SSHClient, command: str) -> RemoteResult:
+    _, stdout, stderr = ssh.exec_command(command)
+    output = stdout.read().decode(errors="replace")
+    errors = stderr.read().decode(errors="replace").strip()
+    return RemoteResult(stdout.channel.recv_exit_status(), output, errors)
+
+
+def write_stdin_sync(
+    ssh: paramiko.SSHClient, command: str, data: str, timeout: float | None = None
+) -> RemoteResult:
+    """Run ``command`` with ``data`` on its stdin, e.g. ``crontab -``.
+
+    ``timeout`` makes a stalled channel raise instead of blocking forever.
+    """
+    if timeout is None:
+        stdin, stdout, stderr = ssh.exec_command(command)
+    else:
+        stdin, stdout, stderr = ssh.exec_command(command, timeout=timeout)
+    stdin.write(data)
+    stdin.channel.shutdown_write()
+    exit_status = stdin.channel.recv_exit_status()
+    errors = stderr.read().decode(errors="replace").strip()
+    output = stdout.read().decode(errors="replace") if stdout is not None else ""
+    return RemoteResult(exit_status, output, errors)
+
+
+def is_connected(ssh: Any) -> bool:
+    try:
+        transport = ssh.get_transport()
+    except AttributeError:
+        # Not a paramiko client; nothing we could reconnect.
+        return True
+    return transport is not None and bool(transport.is_active())
+
+
+class RemoteExecutor:
+    """Runs blocking paramiko calls on a bounded thread pool for asyncio code.
+
+    Calls on different hosts run concurrently, while each connection is
+    limited to ``max_per_host`` calls at a time so a single host can neither
+    exhaust its SSH session limit nor occupy the whole pool.
+
+    When a call fails because its session dropped and a ``reconnector`` is
+    set, the session is re-established with backoff and the call is replayed
+    once; calls made meanwhile wait for the reconnect instead of failing.
+    Only idempotent operations (reads, whole-crontab writes) go through here.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = REMOTE_MAX_WORKERS,
+        max_per_host: int = REMOTE_MAX_PER_HOST,
+        reconnector: Callable[[Any], None] | None = None,
+        backoff: tuple[float, ...] = RECONNECT_BACKOFF,
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host
+        self.reconnector = reconnector
+        self.backoff = backoff
+        self._pool: ThreadPoolExecutor | None = None
+        self._host_limits: weakref.WeakKeyDictionary[Any, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._reconnects: weakref.WeakKeyDictionary[Any, asyncio.Lock] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="cronboard-remote"
+            )
+        return self._pool
+
+    def _host_limit(self, ssh: Any) -> asyncio.Semaphore:
+        limit = self._host_limits.get(ssh)
+        if limit is None:
+            limit = self._host_limits[ssh] = asyncio.Semaphore(self.max_per_host)
+        return limit
+
+    async def call(
+        self, ssh: Any, fn: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """Await ``fn(*args, **kwargs)``, a blocking call that talks to ``ssh``.
+
+        ``ssh`` may be ``None`` for calls that open their own connection; those
+        only share the pool and skip the per-host limit.
+        """
+        loop = asyncio.get_running_loop()
+        if ssh is None:
+            return await loop.run_in_executor(
+                self._executor(), functools.partial(fn, *args, **kwargs)
+            )
+
+        reconnect = self._reconnects.get(ssh)
+        if reconnect is not None and reconnect.locked():
+            async with reconnect:
+                pass
+        async with self._host_limit(ssh):
+            try:
+                return await loop.run_in_executor(
+                    self._executor(), functools.partial(fn, *args, **kwargs)
+                )
+            except Exception:
+                if self.reconnector is None or is_connected(ssh):
+                    raise
+        if not await self.reconnect(ssh):
+            raise paramiko.SSHException("SSH session dropped and reconnecting failed")
+        async with self._host_limit(ssh):
+            return await loop.run_in_executor(
+                self._executor(), functools.partial(fn, *args, **kwargs)
+            )
+
+    async def reconnect(self, ssh: Any) -> bool:
+        """Re-establish the session of ``ssh``, retrying with backoff.
+
+        Concurrent callers share one reconnect; returns whether it succeeded.
+        """
+        if self.reconnector is None:
+            return False
+        lock = self._reconnects.get(ssh)
+        if lock is None:
+            lock = self._reconnects[ssh] = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        async with lock:
+            if is_connected(ssh):
+                return True
+            for delay in self.backoff:
+                await asyncio.sleep(delay)
+                try:
+                    await loop.run_in_executor(self._executor(), self.reconnector, ssh)
+                    return True
+                except Exception:
+                    continue
+        return False
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+remote_executor = RemoteExecutor()
+
+
+async def call(ssh: Any, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    return await remote_executor.call(ssh, fn, *args, **kwargs)
+
+
+async def write_stdin(ssh: paramiko.SSHClient, command: str, data: str) -> RemoteResult:
+    return await call(ssh, write_stdin_sync, ssh, command, data)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import shlex
+from typing import NamedTuple
+
+import paramiko
+
+from cronboard.config import CONFIG_REL_PATH, WRAPPER_DIST
+from cronboard.services.host_facts import host_facts
+
+# Section headers of the probe output; the crontab comes last so its content
+# can be taken verbatim, whatever lines it contains.
+_HOME = "@cronboard-home"
+_BASH = "@cronboard-bash"
+_WRAPPER = "@cronboard-wrapper"
+_CRONTAB = "@cronboard-crontab"
+
+
+class HostProbe(NamedTuple):
+    home: str | None
+    bash_path: str
+    wrapper_installed: bool
+    # sha256 of the installed wrapper, empty when it is missing.
+    wrapper_checksum: str
+    # Exit status of ``crontab -l``: 0 when the user has a crontab, 1 when not.
+    crontab_status: int
+    crontab: str
+
+
+def build_probe_script(crontab_user: str | None = None) -> str:
+    crontab_cmd = (
+        f"crontab -u {shlex.quote(crontab_user)} -l" if crontab_user else "crontab -l"
+    )
+    return f"""h=$(echo ~)
+printf '%s\\n' {_HOME} "$h"
+printf '%s\\n' {_BASH}
+command -v bash || echo /bin/bash
+w="$h"/{shlex.quote(f"{CONFIG_REL_PATH}/{WRAPPER_DIST}")}
+printf '%s\\n' {_WRAPPER}
+if [ -f "$w" ] && [ -x "$w" ]; then
+  echo OK
+  (sha256sum "$w" || shasum -a 256 "$w") 2>/dev/null | cut -c1-64
+else
+  echo MISSING
+fi
+c=$({crontab_cmd} 2>/dev/null)
+printf '%s %s\\n' {_CRONTAB} "$?"
+printf '%s' "$c"
+"""
+
+
+def parse_probe_output(output: str) -> HostProbe:
+    head, marker, crontab = output.partition(f"\n{_CRONTAB} ")
+    if not marker:
+        raise ValueError("Incomplete host probe output")
+    status, _, crontab = crontab.partition("\n")
+
+    sections: dict[str, list[str]] = {}
+    current: list[str] | None = None
+    for line in head.splitlines():
+        if line in (_HOME, _BASH, _WRAPPER):
+            current = sections.setdefault(line, [])
+        elif current is not None:
+            current.append(line)
+
+    wrapper = sections.get(_WRAPPER, [])
+    wrapper_installed = bool(wrapper) and wrapper[0] == "OK"
+    home = next((line for line in sections.get(_HOME, []) if line), None)
+    bash_path = next((line for line in sections.get(_BASH, []) if line), "/bin/bash")
+    return HostProbe(
+        home=home,
+        bash_path=bash_path,
+        wrapper_installed=wrapper_installed,
+        wrapper_checksum=wrapper[1] if wrapper_installed and len(wrapper) > 1 else "",
+        crontab_status=int(status.strip() or 1),
+        crontab=f"{crontab}\n" if crontab else "",
+    )
+
+
+def probe_host(
+    ssh: paramiko.SSHClient,
+    crontab_user: str | None = None,
+    timeout: float | None = None,
+) -> HostProbe:
+    """Collect home, bash path, wrapper state and checksum, and crontab.
+
+    Runs a single remote command instead of one per fact, and refreshes the
+    host facts of the connection so later lookups don't need a round trip.
+    ``timeout`` makes a stalled read raise instead of blocking forever.
+    """
+    script = build_probe_script(crontab_user)
+    if timeout is None:
+        _, stdout, _ = ssh.exec_command(script)
+    else:
+        _, stdout, _ = ssh.exec_command(script, timeout=timeout)
+    probe = parse_probe_output(stdout.read().decode(errors="replace"))
+    if probe.home:
+        host_facts.update(
+            ssh,
+            home=probe.home,
+            bash_path=probe.bash_path,
+            wrapper_installed=probe.wrapper_installed,
+            wrapper_checksum=probe.wrapper_checksum,
+        )
+    return probe
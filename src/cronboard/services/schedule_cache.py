@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+from croniter import croniter
+
+RUN_TIME_FORMAT = "%d.%m.%Y at %H:%M"
+SCHEDULE_CACHE_SIZE = 1024
+
+
+class ScheduleCache:
+    """Process-wide LRU of compiled cron schedules keyed by expression.
+
+    Parsing an expression is the expensive part of computing run times, and many
+    jobs share the same few expressions, so each distinct expression is compiled
+    once and reused. Lookups are thread-safe so background loaders can share it.
+    """
+
+    def __init__(self, maxsize: int = SCHEDULE_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._schedules: OrderedDict[str, croniter] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._schedules)
+
+    def _get(self, expression: str) -> croniter:
+        schedule = self._schedules.get(expression)
+        if schedule is not None:
+            self._schedules.move_to_end(expression)
+            self.hits += 1
+            return schedule
+
+        self.misses += 1
+        # Raises a ValueError subclass for invalid expressions; those are not cached.
+        schedule = croniter(expression, ret_type=datetime)
+        self._schedules[expression] = schedule
+        if len(self._schedules) > self.maxsize:
+            self._schedules.popitem(last=False)
+        return schedule
+
+    def validate(self, expression: str) -> None:
+        """Raise ``ValueError`` if ``expression`` is not a valid cron schedule."""
+        with self._lock:
+            self._get(expression)
+
+    def next_run(self, expression: str, now: datetime | None = None) -> datetime:
+        now = now or datetime.now()
+        with self._lock:
+            return self._get(expression).get_next(start_time=now, update_current=False)
+
+    def prev_run(self, expression: str, now: datetime | None = None) -> datetime:
+        now = now or datetime.now()
+        with self._lock:
+            return self._get(expression).get_prev(start_time=now, update_current=False)
+
+    def runs_around(
+        self, expression: str, now: datetime | None = None
+    ) -> tuple[datetime, datetime]:
+        """Return ``(previous, next)`` run times of ``expression`` around ``now``."""
+        now = now or datetime.now()
+        with self._lock:
+            schedule = self._get(expression)
+            return (
+                schedule.get_prev(start_time=now, update_current=False),
+                schedule.get_next(start_time=now, update_current=False),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._schedules.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+schedule_cache = ScheduleCache()
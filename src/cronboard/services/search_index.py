@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+SEARCH_COLUMNS = (0, 1, 2)
+TRIGRAM_THRESHOLD = 1000
+
+# Joins the searchable fields of a row; it never appears in a typed query, so a
+# substring test on the joined haystack can't match across two fields.
+_FIELD_SEPARATOR = "\x00"
+
+
+class RowSearchIndex:
+    """Case-insensitive substring search over the ID, expression and command of rows.
+
+    Fields are lowercased once when the index is built. Extending the previous
+    query only re-checks the previous matches, and tables with at least
+    ``trigram_threshold`` rows narrow fresh queries through a trigram index.
+    """
+
+    def __init__(
+        self,
+        rows: list[tuple],
+        columns: tuple[int, ...] = SEARCH_COLUMNS,
+        trigram_threshold: int = TRIGRAM_THRESHOLD,
+    ) -> None:
+        self._fields = [tuple(str(row[c]).lower() for c in columns) for row in rows]
+        self._haystacks = [_FIELD_SEPARATOR.join(fields) for fields in self._fields]
+        self._use_trigrams = len(rows) >= trigram_threshold
+        self._trigrams: dict[str, set[int]] | None = None
+        self._last_query = ""
+        self._last_matches: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._haystacks)
+
+    def fields(self, row: int) -> tuple[str, ...]:
+        """Lowercased searchable fields of ``row``."""
+        return self._fields[row]
+
+    def _build_trigrams(self) -> dict[str, set[int]]:
+        trigrams: dict[str, set[int]] = {}
+        for row, fields in enumerate(self._fields):
+            for field in fields:
+                for i in range(len(field) - 2):
+                    trigrams.setdefault(field[i : i + 3], set()).add(row)
+        return trigrams
+
+    def _trigram_candidates(self, query: str) -> list[int]:
+        if self._trigrams is None:
+            self._trigrams = self._build_trigrams()
+        postings = []
+        for i in range(len(query) - 2):
+            rows = self._trigrams.get(query[i : i + 3])
+            if not rows:
+                return []
+            postings.append(rows)
+        postings.sort(key=len)
+        return sorted(set.intersection(*postings))
+
+    def search(self, query: str) -> list[int]:
+        """Return the indices of the rows matching ``query``, in row order."""
+        query = query.lower()
+        if not query:
+            self._last_query = ""
+            self._last_matches = []
+            return []
+
+        if self._last_query and self._last_query in query:
+            candidates = self._last_matches
+        elif self._use_trigrams and len(query) >= 3:
+            candidates = self._trigram_candidates(query)
+        else:
+            candidates = range(len(self._haystacks))
+
+        haystacks = self._haystacks
+        matches = [row for row in candidates if query in haystacks[row]]
+        self._last_query = query
+        self._last_matches = matches
+        return matches
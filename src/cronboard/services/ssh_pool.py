@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+import functools
+import re
+import socket
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import paramiko
+from paramiko.common import MAX_WINDOW_SIZE, MIN_PACKET_SIZE
+
+from cronboard.services.host_facts import host_facts
+
+SSH_POOL_IDLE_TTL = 300.0
+SSH_POOL_MAX_SESSIONS = 8
+SSH_POOL_PRUNE_INTERVAL = 30.0
+SSH_KEEPALIVE_INTERVAL = 30
+SSH_RECONNECT_TIMEOUT = 10.0
+SSH_HEALTH_INTERVAL = 15.0
+SSH_HEALTH_TIMEOUT = 10.0
+
+# ``SSHClient.connect`` options bounded by the ``timeout`` of a new session.
+_CONNECT_TIMEOUTS = ("timeout", "banner_timeout", "auth_timeout", "channel_timeout")
+
+_SIZE = re.compile(r"^\s*(\d+)\s*([KMG]?)i?B?\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def parse_size(value: str | int) -> int:
+    """Byte count from ``32768``, ``"32K"``, ``"8M"`` or ``"1G"``."""
+    if isinstance(value, int):
+        return value
+    match = _SIZE.match(value)
+    if not match:
+        raise ValueError(f"Invalid size: {value}")
+    return int(match.group(1)) * _SIZE_UNITS[match.group(2).upper()]
+
+
+@functools.cache
+def supported_ciphers() -> tuple[str, ...]:
+    """The ciphers paramiko can negotiate, in its order of preference."""
+    # A transport that is never started, only asked for its security options.
+    sock, peer = socket.socketpair()
+    try:
+        transport = paramiko.Transport(sock)
+        try:
+            return transport.get_security_options().ciphers
+        finally:
+            transport.close()
+    finally:
+        sock.close()
+        peer.close()
+
+
+@dataclass(frozen=True)
+class TransportOptions:
+    """Per-server SSH transport tuning, stored under ``transport`` in servers.toml.
+
+    Compression and large windows help bulk transfers such as log reads over
+    slow, high-latency links; ``ciphers`` are tried first, in order, before
+    paramiko's defaults.
+    """
+
+    compression: bool = False
+    ciphers: tuple[str, ...] = field(default_factory=tuple)
+    window_size: int | None = None
+    max_packet_size: int | None = None
+
+    def __post_init__(self) -> None:
+        unknown = [c for c in self.ciphers if c not in supported_ciphers()]
+        if unknown:
+            raise ValueError(f"Unsupported cipher: {', '.join(unknown)}")
+        for name in ("window_size", "max_packet_size"):
+            size = getattr(self, name)
+            if size is not None and not MIN_PACKET_SIZE <= size <= MAX_WINDOW_SIZE:
+                raise ValueError(f"{name.replace('_', ' ').capitalize()} out of range")
+
+    @classmethod
+    def from_config(cls, config: dict | None) -> TransportOptions:
+        config = config or {}
+        window_size = config.get("window_size")
+        max_packet_size = config.get("max_packet_size")
+        return cls(
+            compression=bool(config.get("compression", False)),
+            ciphers=tuple(config.get("ciphers", ())),
+            window_size=parse_size(window_size) if window_size else None,
+            max_packet_size=parse_size(max_packet_size) if max_packet_size else None,
+        )
+
+    def to_config(self) -> dict:
+        """The options that differ from the defaults, as written to servers.toml."""
+        config = {}
+        if self.compression:
+            config["compression"] = True
+        if self.ciphers:
+            config["ciphers"] = list(self.ciphers)
+        if self.window_size is not None:
+            config["window_size"] = self.window_size
+        if self.max_packet_size is not None:
+            config["max_packet_size"] = self.max_packet_size
+        return config
+
+    def transport_factory(self) -> Callable[..., paramiko.Transport] | None:
+        """Builds the transports for ``SSHClient.connect``, or ``None`` for defaults."""
+        if not (self.ciphers or self.window_size or self.max_packet_size):
+            return None
+
+        def make_transport(sock, **kwargs) -> paramiko.Transport:
+            sizes = {}
+            if self.window_size is not None:
+                sizes["default_window_size"] = self.window_size
+            if self.max_packet_size is not None:
+                sizes["default_max_packet_size"] = self.max_packet_size
+            transport = paramiko.Transport(sock, **sizes, **kwargs)
+            if self.ciphers:
+                security = transport.get_security_options()
+                security.ciphers = self.ciphers + tuple(
+                    c for c in security.ciphers if c not in self.ciphers
+                )
+            return transport
+
+        return make_transport
+
+
+DEFAULT_TRANSPORT = TransportOptions()
+
+SessionKey = tuple[str, int, str, TransportOptions]
+
+
+@dataclass
+class _Session:
+    client: paramiko.SSHClient
+    users: int = 0
+    released_at: float = 0.0
+    # Kept to re-establish the session in place after the link dropped.
+    password: str | None = None
+
+
+def session_key(
+    host: str, port, username: str, transport: TransportOptions = DEFAULT_TRANSPORT
+) -> SessionKey:
+    # Entries with different transport options never share a session.
+    return (host, int(port), username, transport)
+
+
+def ping(
+    client: paramiko.SSHClient, timeout: float | None = SSH_HEALTH_TIMEOUT
+) -> float:
+    """Round trip time in seconds of a keepalive request on ``client``'s transport.
+
+    Raises :class:`paramiko.SSHException` when the session is down. A link
+    that leaves the request unanswered for ``timeout`` seconds is half-open;
+    its transport is closed, which also ends the wait for the answer.
+    """
+    transport = client.get_transport()
+    if transport is None or not transport.is_active():
+        raise paramiko.SSHException("SSH session is closed")
+    watchdog = None
+    if timeout is not None:
+        watchdog = threading.Timer(timeout, transport.close)
+        watchdog.daemon = True
+        watchdog.start()
+    started = time.monotonic()
+    try:
+        # Servers answer unknown global requests with a failure, which is enough.
+        transport.global_request("keepalive@openssh.com", wait=True)
+    finally:
+        if watchdog is not None:
+            watchdog.cancel()
+    if not transport.is_active():
+        raise paramiko.SSHException("SSH session dropped")
+    return time.monotonic() - started
+
+
+class SSHSessionPool:
+    """Authenticated SSH sessions shared by ``(host, port, username, transport)``.
+
+    Server entries that only differ by crontab user share one session, and
+    switching away from a server keeps its session open so switching back
+    skips the TCP, key exchange and auth handshake. Sessions nobody holds are
+    closed once idle for ``idle_ttl`` seconds, or earlier (least recently
+    released first) when more than ``max_sessions`` are open. Transports send
+    a keepalive every ``keepalive`` seconds so idle links are not dropped by
+    firewalls and dead ones are noticed.
+    """
+
+    def __init__(
+        self,
+        idle_ttl: float = SSH_POOL_IDLE_TTL,
+        max_sessions: int = SSH_POOL_MAX_SESSIONS,
+        client_factory: Callable[[], paramiko.SSHClient] = paramiko.SSHClient,
+        clock: Callable[[], float] = time.monotonic,
+        keepalive: int = SSH_KEEPALIVE_INTERVAL,
+    ) -> None:
+        self.idle_ttl = idle_ttl
+        self.max_sessions = max_sessions
+        self.keepalive = keepalive
+        self._client_factory = client_factory
+        self._clock = clock
+        self._sessions: OrderedDict[SessionKey, _Session] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, key: SessionKey) -> bool:
+        return key in self._sessions
+
+    def _connect(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str | None,
+        timeout: float | None = None,
+        transport: TransportOptions = DEFAULT_TRANSPORT,
+    ) -> paramiko.SSHClient:
+        client = self._client_factory()
+        self._open(client, host, port, username, password, timeout, transport)
+        return client
+
+    def _open(
+        self,
+        client: paramiko.SSHClient,
+        host: str,
+        port: int,
+        username: str,
+        password: str | None,
+        timeout: float | None = None,
+        transport: TransportOptions = DEFAULT_TRANSPORT,
+    ) -> None:
+        client.load_system_host_keys()
+        client.set_missing_host_key_policy(paramiko.WarningPolicy)
+        options = {"hostname": host, "port": port, "username": username}
+        if password:
+            options["password"] = password
+        if timeout is not None:
+            # Every step of the handshake gets the bound, not just the TCP
+            # connect, so a host that stalls mid-handshake fails in time.
+            options.update(dict.fromkeys(_CONNECT_TIMEOUTS, timeout))
+        if transport.compression:
+            options["compress"] = True
+        transport_factory = transport.transport_factory()
+        if transport_factory is not None:
+            options["transport_factory"] = transport_factory
+        try:
+            client.connect(**options)
+        except Exception:
+            client.close()
+            raise
+        connected = client.get_transport()
+        if connected is not None and self.keepalive:
+            connected.set_keepalive(self.keepalive)
+
+    @staticmethod
+    def _is_alive(client: paramiko.SSHClient) -> bool:
+        transport = client.get_transport()
+        return transport is not None and transport.is_active()
+
+    def acquire(
+        self,
+        host: str,
+        port,
+        username: str,
+        password: str | None = None,
+        timeout: float | None = None,
+        transport: TransportOptions = DEFAULT_TRANSPORT,
+    ) -> paramiko.SSHClient:
+        """Return a connected client for the host, reusing an open session.
+
+        ``timeout`` bounds each step of connecting a new session and
+        ``transport`` tunes it. Every ``acquire`` must be paired with a
+        :meth:`release` (or :meth:`discard`) of the returned client.
+        """
+        key = session_key(host, port, username, transport)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None and not self._is_alive(session.client):
+                del self._sessions[key]
+                host_facts.invalidate(session.client)
+                session.client.close()
+                session = None
+            if session is not None:
+                session.users += 1
+                self._sessions.move_to_end(key)
+                return session.client
+
+        # Connect outside the lock so other hosts are not blocked meanwhile.
+        client = self._connect(host, int(port), username, password, timeout, transport)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                # Another caller connected to the same host first; keep theirs.
+                session.users += 1
+                surplus, client = client, session.client
+            else:
+                surplus = None
+                self._sessions[key] = _Session(client, users=1, password=password)
+            expired = self._collect_expired()
+        if surplus is not None:
+            surplus.close()
+        self._close(expired)
+        return client
+
+    def reconnect(
+        self, client: paramiko.SSHClient, timeout: float | None = SSH_RECONNECT_TIMEOUT
+    ) -> None:
+        """Re-establish the dropped transport of a pooled ``client`` in place.
+
+        The client object stays the same, so everything holding it (tables,
+        host facts, crontab hashes) keeps working after the reconnect.
+        """
+        with self._lock:
+            found = next(
+                (
+                    (key, session)
+                    for key, session in self._sessions.items()
+                    if session.client is client
+                ),
+                None,
+            )
+        if found is None:
+            raise paramiko.SSHException("SSH session is no longer open")
+        (host, port, username, transport), session = found
+        client.close()
+        self._open(client, host, port, username, session.password, timeout, transport)
+
+    def release(self, client: paramiko.SSHClient) -> None:
+        """Hand ``client`` back; it stays open until idle for ``idle_ttl``."""
+        with self._lock:
+            for session in self._sessions.values():
+                if session.client is client:
+                    session.users = max(session.users - 1, 0)
+                    if session.users == 0:
+                        session.released_at = self._clock()
+                    break
+            expired = self._collect_expired()
+        self._close(expired)
+
+    def discard(self, client: paramiko.SSHClient) -> None:
+        """Close ``client`` now and forget its session, even if still held."""
+        with self._lock:
+            for key, session in list(self._sessions.items()):
+                if session.client is client:
+                    del self._sessions[key]
+        host_facts.invalidate(client)
+        client.close()
+
+    def prune(self) -> None:
+        """Close the idle sessions that outlived the TTL or exceed the cap."""
+        with self._lock:
+            expired = self._collect_expired()
+        self._close(expired)
+
+    def close_all(self) -> None:
+        with self._lock:
+            clients = [session.client for session in self._sessions.values()]
+            self._sessions.clear()
+        self._close(clients)
+
+    def _collect_expired(self) -> list[paramiko.SSHClient]:
+        now = self._clock()
+        idle = [
+            (key, session)
+            for key, session in self._sessions.items()
+            if session.users == 0
+        ]
+        idle.sort(key=lambda item: item[1].released_at)
+        over_cap = max(len(self._sessions) - self.max_sessions, 0)
+        expired = []
+        for index, (key, session) in enumerate(idle):
+            if index < over_cap or now - session.released_at >= self.idle_ttl:
+                del self._sessions[key]
+                expired.append(session.client)
+        return expired
+
+    @staticmethod
+    def _close(clients: list[paramiko.SSHClient]) -> None:
+        for client in clients:
+            host_facts.invalidate(client)
+            try:
+                client.close()
+            except Exception:
+                pass
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import base64
+import os
+import posixpath
+import re
+import shlex
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+import paramiko
+from crontab import CronTab
+
+SYSTEM_CRONTAB = "/etc/crontab"
+CRON_D_DIR = "/etc/cron.d"
+# Debian/Ubuntu and RHEL/Fedora spool layouts; a missing directory is skipped.
+USER_SPOOL_DIRS = ("/var/spool/cron/crontabs", "/var/spool/cron")
+AGGREGATE_WORKERS = 8
+
+# cron ignores files in cron.d whose names contain dots (package backups like
+# ``foo.dpkg-old``) or other characters outside this set.
+_CRON_D_NAME = re.compile(r"^[A-Za-z0-9_-]+$")
+_LOCAL_HOST = ""
+
+
+class CrontabSource(NamedTuple):
+    label: str
+    path: str
+    # System crontabs carry a user column between the schedule and the command.
+    system: bool
+
+
+class SystemCrontabs(NamedTuple):
+    tabs: list[tuple[CrontabSource, CronTab]]
+    # ``(path, reason)`` of sources that exist but could not be read.
+    skipped: list[tuple[str, str]]
+
+
+def source_for_path(path: str) -> CrontabSource:
+    directory, name = posixpath.split(path)
+    if path == SYSTEM_CRONTAB:
+        return CrontabSource(path, path, True)
+    if directory == CRON_D_DIR:
+        return CrontabSource(f"cron.d/{name}", path, True)
+    return CrontabSource(f"user:{name}", path, False)
+
+
+def local_sources() -> list[CrontabSource]:
+    """Every crontab file on this machine, in the order cron reads them."""
+    paths = []
+    if os.path.isfile(SYSTEM_CRONTAB):
+        paths.append(SYSTEM_CRONTAB)
+    for directory in (CRON_D_DIR, *USER_SPOOL_DIRS):
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.is_file():
+                continue
+            if directory == CRON_D_DIR and not _CRON_D_NAME.match(entry.name):
+                continue
+            paths.append(entry.path)
+    return [source_for_path(path) for path in paths]
+
+
+def parse_crontab(source: CrontabSource, content: str) -> CronTab:
+    # ``user=False`` makes python-crontab read the user column of system files.
+    return CronTab(tab=content, user=False if source.system else None)
+
+
+class CrontabFileCache:
+    """Parsed crontab files keyed by ``(host, path)`` and validated by mtime.
+
+    A file is only read and parsed again when its modification time or size
+    changed since the last load. Safe to use from several loader threads.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str], tuple[str, CronTab]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, host: str, path: str, stamp: str) -> CronTab | None:
+        with self._lock:
+            entry = self._entries.get((host, path))
+        if entry is None or entry[0] != stamp:
+            return None
+        return entry[1]
+
+    def put(self, host: str, path: str, stamp: str, tab: CronTab) -> None:
+        with self._lock:
+            self._entries[(host, path)] = (stamp, tab)
+
+    def stamps(self, host: str) -> dict[str, str]:
+        with self._lock:
+            return {
+                path: stamp
+                for (entry_host, path), (stamp, _) in self._entries.items()
+                if entry_host == host
+            }
+
+    def retain(self, host: str, paths: set[str]) -> None:
+        """Drop the entries of ``host`` whose file no longer exists."""
+        with self._lock:
+            for key in [
+                key for key in self._entries if key[0] == host and key[1] not in paths
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+crontab_file_cache = CrontabFileCache()
+
+
+def _load_local(
+    source: CrontabSource, cache: CrontabFileCache
+) -> tuple[CrontabSource, CronTab | None, str | None]:
+    try:
+        stat = os.stat(source.path)
+        stamp = f"{int(stat.st_mtime)}.{stat.st_size}"
+        tab = cache.get(_LOCAL_HOST, source.path, stamp)
+        if tab is None:
+            with open(source.path, encoding="utf-8", errors="replace") as f:
+                tab = parse_crontab(source, f.read())
+            cache.put(_LOCAL_HOST, source.path, stamp, tab)
+        return source, tab, None
+    except OSError as e:
+        return source, None, e.strerror or str(e)
+
+
+def read_local_crontabs(
+    cache: CrontabFileCache = crontab_file_cache,
+    max_workers: int = AGGREGATE_WORKERS,
+) -> SystemCrontabs:
+    """Read /etc/crontab, /etc/cron.d and the user spools in parallel."""
+    sources = local_sources()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(lambda source: _load_local(source, cache), sources))
+    cache.retain(_LOCAL_HOST, {source.path for source in sources})
+
+    tabs, skipped = [], []
+    for source, tab, error in results:
+        if tab is None:
+            skipped.append((source.path, error))
+        else:
+            tabs.append((source, tab))
+    return SystemCrontabs(tabs, skipped)
+
+
+def remote_host_key(ssh: paramiko.SSHClient) -> str:
+    try:
+        host, port = ssh.get_transport().getpeername()[:2]
+        return f"{host}:{port}"
+    except Exception:
+        return f"ssh-{id(ssh)}"
+
+
+def build_remote_script(stamps: dict[str, str]) -> str:
+    """Shell script listing every crontab with its stamp in one round trip.
+
+    Files whose ``mtime.size`` stamp matches ``stamps`` are reported as
+    unchanged (``=``) without their content; others are sent base64 encoded
+    (``+``) and unreadable ones are reported as ``!``.
+    """
+    unchanged = " | ".join(
+        shlex.quote(f"{path} {stamp}") for path, stamp in sorted(stamps.items())
+    )
+    spools = " ".join(f"{shlex.quote(d)}/*" for d in USER_SPOOL_DIRS)
+    return f"""emit() {{
+  f=$1
+  [ -f "$f" ] || return
+  if [ ! -r "$f" ]; then printf '!%s\\n' "$f"; return; fi
+  m=$(stat -c %Y.%s "$f" 2>/dev/null) || return
+  case "$f $m" in
+    {unchanged or "''"}) printf '=%s %s\\n' "$m" "$f" ;;
+    *) printf '+%s %s\\n' "$m" "$f"; base64 < "$f" | tr -d '\\n'; echo ;;
+  esac
+}}
+emit {shlex.quote(SYSTEM_CRONTAB)}
+for f in {shlex.quote(CRON_D_DIR)}/*; do
+  case "${{f##*/}}" in
+    *[!A-Za-z0-9_-]*) ;;
+    *) emit "$f" ;;
+  esac
+done
+for f in {spools}; do
+  case "${{f##*/}}" in .*) ;; *) emit "$f" ;; esac
+done
+"""
+
+
+def parse_remote_listing(
+    output: str, host: str, cache: CrontabFileCache
+) -> SystemCrontabs:
+    tabs, skipped, seen = [], [], set()
+    lines = iter(output.splitlines())
+    for line in lines:
+        if not line:
+            continue
+        marker, rest = line[0], line[1:]
+        if marker == "!":
+            skipped.append((rest, "Permission denied"))
+            continue
+        if marker not in "+=" or " " not in rest:
+            continue
+        stamp, path = rest.split(" ", 1)
+        source = source_for_path(path)
+        seen.add(path)
+        if marker == "+":
+            content = base64.b64decode(next(lines, "")).decode(errors="replace")
+            tab = parse_crontab(source, content)
+            cache.put(host, path, stamp, tab)
+        else:
+            tab = cache.get(host, path, stamp)
+            if tab is None:
+                # Evicted between building the script and reading its output.
+                skipped.append((path, "Changed while loading, refresh to retry"))
+                continue
+        tabs.append((source, tab))
+    cache.retain(host, seen)
+    return SystemCrontabs(tabs, skipped)
+
+
+def read_remote_crontabs(
+    ssh: paramiko.SSHClient, cache: CrontabFileCache = crontab_file_cache
+) -> SystemCrontabs:
+    """Read every crontab of the remote host with a single command."""
+    host = remote_host_key(ssh)
+    _, stdout, _ = ssh.exec_command(build_remote_script(cache.stamps(host)))
+    output = stdout.read().decode(errors="replace")
+    return parse_remote_listing(output, host, cache)
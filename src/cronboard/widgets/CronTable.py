@@ -1,16 +1,29 @@
 from crontab import CronTab
+from textual import work
 from textual.widgets import DataTable
 from textual.binding import Binding
-from textual.coordinate import Coordinate
-from datetime import datetime
+from textual.worker import Worker, WorkerState
 from rich.text import Text
 from cronboard.screens.CronInputSearch import CronInputSearch
-from cronboard.services.logging.cron_wrapper import (
-    has_wrapper,
-    wrap_command,
-    command_without_wrapper,
+from cronboard.screens.CronLogRetention import CronLogRetention
+from cronboard.services import remote
+from cronboard.services.crontab_sync import (
+    CRONTAB_VERIFY_INTERVAL,
+    crontab_hashes,
+    fetch_remote_hash,
 )
+from cronboard.services.job_index import build_job_index, job_key
+from cronboard.services.logging.cron_wrapper import unwrap_command
+from cronboard.services.messages import RemoteCrontabLoaded
+from cronboard.services.remote import crontab_write_command
+from cronboard.services.remote_probe import probe_host
+from cronboard.services.search_index import RowSearchIndex
 from cronboard.widgets.LogView import LogViewModal
+from cronboard.widgets.ScheduleColumns import ScheduleColumns, schedule_cells
+
+_LOAD_GROUP = "crontab-load"
+_LAST_RUN_COLUMN = 4
+_NEXT_RUN_COLUMN = 5
 
 
 class CronTable(DataTable):
@@ -29,49 +42,46 @@ class CronTable(DataTable):
         Binding("p", "pause_cronjob", "Pause Toggle"),
         Binding("e", "edit_cronjob", "Edit"),
         Binding("L", "view_logs", "View Logs"),
+        Binding("R", "log_retention", "Log Retention"),
+        Binding("S", "view_system_crontabs", "System Crontabs"),
+        Binding("V", "verify_remote", "Verify Remote"),
     ]
+    COLUMNS = (
+        "ID",
+        "Expression",
+        "Command",
+        "Log Enabled",
+        "Last Run",
+        "Next Run",
+        "Status",
+    )
 
     def __init__(self, remote=False, ssh_client=None, crontab_user=None, **kwargs):
         super().__init__(**kwargs)
         self.remote = remote
         self.ssh_client = ssh_client
         self.crontab_user = crontab_user
+        self.cron: CronTab | None = None
+        self.ssh_cron: CronTab | None = None
+        self._load_worker: Worker | None = None
         self._rows_data: list[tuple] = []
+        self._row_keys: list[str] = []
+        self._job_index: dict[tuple, object] = {}
+        self._row_search_index: RowSearchIndex | None = None
+        self._highlighted_cells: set[tuple[str, int]] = set()
+        self._schedule_columns = ScheduleColumns(self)
         self._search_matches: list[int] = []
         self._search_index: int = -1
         self._search_query: str = ""
 
     def on_mount(self) -> None:
-        self.cron: CronTab = CronTab(user=True)
-        self.add_columns(
-            "ID",
-            "Expression",
-            "Command",
-            "Log Enabled",
-            "Last Run",
-            "Next Run",
-            "Status",
-        )
-
-        if self.remote and self.ssh_client:
-            crontab_cmd = (
-                f"crontab -u {self.crontab_user} -l"
-                if self.crontab_user
-                else "crontab -l"
-            )
-            _, stdout, _ = self.ssh_client.exec_command(crontab_cmd)
-            exit_status = stdout.channel.recv_exit_status()
-
-            if exit_status == 1:
-                self.crontab_content = ""
-            else:
-                self.crontab_content = stdout.read().decode() if stdout else ""
-
-            self.ssh_cron: CronTab | None = CronTab(tab=self.crontab_content)
-        else:
-            self.ssh_cron = None
-
-        self.load_crontabs()
+        self._column_keys = self.add_columns(*self.COLUMNS)
+        self._schedule_columns.column_keys = {
+            "last": self._column_keys[_LAST_RUN_COLUMN],
+            "next": self._column_keys[_NEXT_RUN_COLUMN],
+        }
+        self.action_refresh()
+        self.set_interval(CRONTAB_VERIFY_INTERVAL, self._verify_periodically)
 
     def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
         """Check if an action may run."""
@@ -89,8 +99,13 @@ class CronTable(DataTable):
             "cursor_down",
             "cursor_left",
             "cursor_right",
+            "log_retention",
         ):
             return not is_empty
+        if action == "create_cronjob_keybind":
+            return self._active_cron() is not None
+        if action == "verify_remote":
+            return bool(self.remote and self.ssh_client)
         return True
 
     def on_key(self, event):
@@ -98,80 +113,129 @@ class CronTable(DataTable):
         if event.key == "space":
             self.notify(f"empty: {is_empty}")
 
-    def parse_cron(self, cron):
+    def _active_cron(self) -> CronTab | None:
+        return self.ssh_cron if self.remote and self.ssh_client else self.cron
+
+    @staticmethod
+    def build_rows(cron) -> list[tuple]:
+        """Compute the display rows for ``cron``; safe to call off the UI thread.
+
+        Last Run, Next Run and Status are lazy cells, only computed once their
+        row is drawn (see :class:`ScheduleColumns`).
+        """
+        rows = []
         for job in cron:
             expr = job.slices.render()
-            cmd = command_without_wrapper(job.command)
-            log_enabled = has_wrapper(job.command)
+            cmd, log_enabled = unwrap_command(job.command)
             identificator = job.comment if job.comment else "No ID"
-            try:
-                active_status = "Active" if job.is_enabled() else "Paused"
-                schedule = job.schedule(date_from=datetime.now())
-                next_dt = (
-                    schedule.get_next().strftime("%d.%m.%Y at %H:%M")
-                    if active_status == "Active"
-                    else "Paused"
-                )
-                last_dt = schedule.get_prev().strftime("%d.%m.%Y at %H:%M")
-
-            except ValueError as e:
-                next_dt = f"ERR: {e}"
-                last_dt = f"ERR: {e}"
-                active_status = "Inactive"
-
-            if active_status == "Active":
-                status_text = Text(active_status, style="#B8E7B8")
-            elif active_status == "Paused":
-                status_text = Text(active_status, style="#FF6F61")
-            else:
-                status_text = Text(active_status, style="#F6BF00")
-
-            self.add_row(
-                identificator,
-                expr,
-                cmd,
-                str(log_enabled),
-                str(last_dt),
-                str(next_dt),
-                status_text,
-            )
-            self._rows_data.append(
+            rows.append(
                 (
                     identificator,
                     expr,
                     cmd,
                     str(log_enabled),
-                    str(last_dt),
-                    str(next_dt),
-                    status_text,
+                    *schedule_cells(job.slices.clean_render(), bool(job.is_enabled())),
                 )
             )
+        return rows
+
+    @staticmethod
+    def row_keys(rows: list[tuple]) -> list[str]:
+        """Stable row identities: job ID plus unwrapped command, numbered on clashes."""
+        seen: dict[tuple, int] = {}
+        keys = []
+        for row in rows:
+            identity = (str(row[0]), str(row[2]))
+            occurrence = seen.get(identity, 0)
+            seen[identity] = occurrence + 1
+            keys.append(f"{identity[0]}\x00{identity[1]}\x00{occurrence}")
+        return keys
 
-    def load_crontabs(self):
+    def parse_cron(self, cron):
+        self._reconcile_rows(self.build_rows(cron))
+
+    def _rebuild_rows(self, rows: list[tuple], keys: list[str]) -> None:
+        cursor_key = (
+            self._row_keys[self.cursor_row]
+            if 0 <= self.cursor_row < len(self._row_keys)
+            else None
+        )
         self.clear()
-        self._rows_data = []
+        self._schedule_columns.clear()
+        for key, row in zip(keys, rows):
+            self.add_row(*row, key=key)
+        if cursor_key in keys:
+            self.move_cursor(row=keys.index(cursor_key))
+
+    def _reconcile_rows(self, rows: list[tuple]) -> None:
+        """Apply ``rows`` touching only the rows that were added, removed or changed.
+
+        Rows are matched by :meth:`row_keys`. New jobs are appended at the end of
+        the table; if the surviving rows changed order the table is rebuilt.
+        """
+        keys = self.row_keys(rows)
+        for key, row in zip(keys, rows):
+            self._schedule_columns.bind(key, row)
+        previous = dict(zip(self._row_keys, self._rows_data))
+        current = set(keys)
+        surviving = [key for key in self._row_keys if key in current]
+        added = keys[len(surviving) :]
+
+        if keys[: len(surviving)] != surviving or any(k in previous for k in added):
+            self._rebuild_rows(rows, keys)
+        else:
+            for key in self._row_keys:
+                if key not in current:
+                    self.remove_row(key)
+                    self._schedule_columns.invalidate(key)
+            for key, row in zip(keys, rows):
+                old_row = previous.get(key)
+                if old_row is None:
+                    self.add_row(*row, key=key)
+                    continue
+                if old_row[_LAST_RUN_COLUMN:] != row[_LAST_RUN_COLUMN:]:
+                    self._schedule_columns.invalidate(key)
+                for column_key, old_value, value in zip(
+                    self._column_keys, old_row, row
+                ):
+                    if old_value != value:
+                        self.update_cell(key, column_key, value, update_width=True)
+
+        self._row_keys = keys
+        self._rows_data = list(rows)
+        self._row_search_index = None
+
+    def load_crontabs(self, rows: list[tuple] | None = None):
+        self._restore_cells()
         self._search_matches = []
         self._search_index = -1
         self._search_query = ""
 
-        if self.remote and self.ssh_client:
-            self.parse_cron(self.ssh_cron)
+        if rows is not None:
+            self._reconcile_rows(rows)
+        elif self._active_cron() is not None:
+            self.parse_cron(self._active_cron())
 
-        else:
-            self.parse_cron(self.cron)
+        cron = self._active_cron()
+        self._job_index = (
+            build_job_index(cron, [row[2] for row in self._rows_data])
+            if cron is not None
+            else {}
+        )
 
     def action_create_cronjob_keybind(self) -> None:
         """Handle create cronjob action by calling the main app's method."""
-        used_cron = self.ssh_cron if self.remote and self.ssh_client else self.cron
+        used_cron = self._active_cron()
         self.app.action_create_cronjob(
             used_cron,
             remote=self.remote,
             ssh_client=self.ssh_client,
             crontab_user=self.crontab_user,
+            job_index=self._job_index,
         )
 
     def action_edit_cronjob_keybind(self, identificator, expression, command) -> None:
-        used_cron = self.ssh_cron if self.remote and self.ssh_client else self.cron
+        used_cron = self._active_cron()
         self.app.action_edit_cronjob(
             used_cron,
             identificator=identificator,
@@ -180,10 +244,11 @@ class CronTable(DataTable):
             remote=self.remote,
             ssh_client=self.ssh_client,
             crontab_user=self.crontab_user,
+            job_index=self._job_index,
         )
 
     def action_delete_cronjob_keybind(self, job) -> None:
-        used_cron = self.ssh_cron if self.remote and self.ssh_client else self.cron
+        used_cron = self._active_cron()
         self.app.action_delete_cronjob(
             job,
             cron=used_cron,
@@ -193,34 +258,129 @@ class CronTable(DataTable):
         )
 
     def action_refresh(self) -> None:
-        """Refresh the cronjob list."""
-        if self.remote and self.ssh_client:
-            crontab_cmd = (
-                f"crontab -u {self.crontab_user} -l"
-                if self.crontab_user
-                else "crontab -l"
+        """Refresh the cronjob list.
+
+        The crontab is fetched and parsed in a background worker; starting a new
+        refresh cancels any load that is still in flight.
+        """
+        self.loading = True
+        self._load_worker = self._load_crontab_worker(
+            self.remote, self.ssh_client, self.crontab_user
+        )
+
+    @work(thread=True, exclusive=True, group=_LOAD_GROUP, exit_on_error=False)
+    def _load_crontab_worker(
+        self, remote, ssh_client, crontab_user
+    ) -> tuple[CronTab | None, list[tuple]]:
+        return self.load_rows(remote, ssh_client, crontab_user)
+
+    def load_rows(
+        self, remote, ssh_client, crontab_user
+    ) -> tuple[CronTab | None, list[tuple]]:
+        """Fetch the crontab and build its rows; runs in the load worker thread."""
+        if remote and ssh_client:
+            cron = self.fetch_remote_crontab(ssh_client, crontab_user)
+        else:
+            cron = CronTab(user=True)
+        return cron, self.build_rows(cron)
+
+    @staticmethod
+    def fetch_remote_crontab(ssh_client, crontab_user=None) -> CronTab:
+        # The probe also records the host facts needed later by logging and
+        # wrapping, so loading a server costs a single round trip.
+        probe = probe_host(ssh_client, crontab_user)
+        crontab_content = probe.crontab if probe.crontab_status == 0 else ""
+        crontab_hashes.record(ssh_client, crontab_user, crontab_content)
+        return CronTab(tab=crontab_content)
+
+    def reload_after_write(self) -> None:
+        """Show the crontab after a change was saved.
+
+        When the remote write succeeded the rendered ``CronTab`` is exactly
+        what the host has, so it is shown as is instead of fetched again.
+        """
+        cron = self._active_cron()
+        if (
+            self.remote
+            and self.ssh_client
+            and cron is not None
+            and crontab_hashes.matches(
+                self.ssh_client, self.crontab_user, cron.render()
             )
-            _, stdout, _ = self.ssh_client.exec_command(crontab_cmd)
-            exit_status = stdout.channel.recv_exit_status()
+        ):
+            self.load_crontabs()
+        else:
+            self.action_refresh()
 
-            if exit_status == 1:
-                self.crontab_content = ""
-            else:
-                self.crontab_content = stdout.read().decode() if stdout else ""
+    async def action_verify_remote(self, quiet: bool = False) -> None:
+        """Compare the remote crontab's hash with the last one read or written."""
+        if not (self.remote and self.ssh_client):
+            return
+        ssh_client, crontab_user = self.ssh_client, self.crontab_user
+        try:
+            digest = await remote.call(
+                ssh_client, fetch_remote_hash, ssh_client, crontab_user
+            )
+        except Exception as e:
+            if not quiet:
+                self.notify(f"Failed to verify remote crontab: {e}", severity="error")
+            return
+        if ssh_client is not self.ssh_client or self._load_worker is not None:
+            return
+        if digest is not None and digest == crontab_hashes.get(
+            ssh_client, crontab_user
+        ):
+            if not quiet:
+                self.notify("Remote crontab is up to date")
+            return
+        self.notify(
+            "The remote crontab changed outside cronboard, reloading it.",
+            severity="warning",
+        )
+        self.action_refresh()
 
-            self.ssh_cron = CronTab(tab=self.crontab_content)
+    async def _verify_periodically(self) -> None:
+        if self.check_action("verify_remote", ()):
+            await self.action_verify_remote(quiet=True)
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        worker = event.worker
+        if worker.group != _LOAD_GROUP or worker is not self._load_worker:
+            return
+
+        if event.state == WorkerState.SUCCESS:
+            cron, rows = worker.result
+            if self.remote and self.ssh_client:
+                self.ssh_cron = cron
+            else:
+                self.cron = cron
+            self.load_crontabs(rows)
+            if self.remote and self.ssh_client:
+                self.post_message(RemoteCrontabLoaded(self.ssh_client))
+        elif event.state == WorkerState.ERROR:
+            self.notify(f"Failed to load crontab: {worker.error}", severity="error")
         else:
-            self.cron = CronTab(user=True)
-        self.load_crontabs()
+            return
+
+        self._load_worker = None
+        self.loading = False
         self.refresh_bindings()
 
     def action_cron_search(self) -> None:
+        previous_query = self._search_query
 
         def check_search(search_query: str | None) -> None:
             if search_query is not None:
                 self.apply_search(search_query)
+            else:
+                self.apply_search(previous_query, notify=False)
 
-        self.app.push_screen(CronInputSearch(), check_search)
+        self.app.push_screen(
+            CronInputSearch(
+                on_query_changed=lambda query: self.apply_search(query, notify=False)
+            ),
+            check_search,
+        )
 
     def action_clear_search(self) -> None:
         self._search_query = ""
@@ -228,63 +388,76 @@ class CronTable(DataTable):
         self._search_index = -1
         self._restore_cells()
 
-    def apply_search(self, query: str) -> None:
+    def _row_search(self) -> RowSearchIndex:
+        if self._row_search_index is None:
+            self._row_search_index = RowSearchIndex(self._rows_data)
+        return self._row_search_index
+
+    def apply_search(self, query: str, notify: bool = True) -> None:
         self._search_query = query.lower() if query else ""
         self._search_matches = []
 
         if not self._search_query:
+            self._search_index = -1
             self._restore_cells()
             return
 
-        for i, row_data in enumerate(self._rows_data):
-            identificator, expr, cmd = (
-                str(row_data[0]),
-                str(row_data[1]),
-                str(row_data[2]),
-            )
-            if (
-                self._search_query in identificator.lower()
-                or self._search_query in expr.lower()
-                or self._search_query in cmd.lower()
-            ):
-                self._search_matches.append(i)
+        self._search_matches = self._row_search().search(self._search_query)
 
         if self._search_matches:
             self._search_index = 0
             self._highlight_matches()
             self.move_cursor(row=self._search_matches[0])
-            self.notify(
-                f"{len(self._search_matches)} match(es) for '{self._search_query}'"
-            )
+            if notify:
+                self.notify(
+                    f"{len(self._search_matches)} match(es) for '{self._search_query}'"
+                )
         else:
             self._search_index = -1
-            self.notify(f"No matches for '{self._search_query}'")
+            self._restore_cells()
+            if notify:
+                self.notify(f"No matches for '{self._search_query}'")
 
-    def _highlight_text(self, text: str, query: str) -> Text:
+    def _highlight_text(
+        self, text: str, query: str, lowered: str | None = None
+    ) -> Text:
         result = Text(text)
         q_lower = query.lower()
-        idx = text.lower().find(q_lower)
+        t_lower = lowered if lowered is not None else text.lower()
+        idx = t_lower.find(q_lower)
         while idx >= 0:
             result.stylize("bold yellow", idx, idx + len(query))
-            idx = text.lower().find(q_lower, idx + 1)
+            idx = t_lower.find(q_lower, idx + 1)
         return result
 
     def _highlight_matches(self) -> None:
-        self._restore_cells()
+        """Highlight the current matches, restoring only cells no longer matching."""
+        search = self._row_search()
+        highlighted: dict[tuple[str, int], Text] = {}
         for i in self._search_matches:
             row_data = self._rows_data[i]
+            fields = search.fields(i)
             for col_idx in range(3):
-                text = str(row_data[col_idx])
-                if self._search_query.lower() in text.lower():
-                    self.update_cell_at(
-                        Coordinate(i, col_idx),
-                        self._highlight_text(text, self._search_query),
+                if self._search_query in fields[col_idx]:
+                    highlighted[(self._row_keys[i], col_idx)] = self._highlight_text(
+                        str(row_data[col_idx]), self._search_query, fields[col_idx]
                     )
 
+        for row_key, col_idx in self._highlighted_cells - highlighted.keys():
+            self._restore_cell(row_key, col_idx)
+        for (row_key, col_idx), text in highlighted.items():
+            self.update_cell(row_key, self._column_keys[col_idx], text)
+        self._highlighted_cells = set(highlighted)
+
+    def _restore_cell(self, row_key: str, col_idx: int) -> None:
+        row_data = self._rows_data[self.get_row_index(row_key)]
+        self.update_cell(row_key, self._column_keys[col_idx], row_data[col_idx])
+
     def _restore_cells(self) -> None:
-        for i, row_data in enumerate(self._rows_data):
-            for col_idx in range(3):
-                self.update_cell_at(Coordinate(i, col_idx), row_data[col_idx])
+        """Undo search highlighting; only the cells currently highlighted are touched."""
+        for row_key, col_idx in self._highlighted_cells:
+            self._restore_cell(row_key, col_idx)
+        self._highlighted_cells = set()
 
     def action_search_next(self) -> None:
         if not self._search_matches:
@@ -298,78 +471,54 @@ class CronTable(DataTable):
         self._search_index = (self._search_index - 1) % len(self._search_matches)
         self.move_cursor(row=self._search_matches[self._search_index])
 
-    def action_pause_cronjob(self) -> None:
+    def _cursor_row_data(self) -> tuple:
+        """The plain values of the row under the cursor.
 
-        row = self.get_row_at(self.cursor_row)
+        The cells themselves may hold search highlighted ``Text``, so actions
+        read the row from ``_rows_data`` instead.
+        """
+        return self._rows_data[self.cursor_row]
+
+    async def action_pause_cronjob(self) -> None:
+
+        row = self._cursor_row_data()
         identificator = row[0]
         cmd = row[2]
 
-        cron_to_use = self.ssh_cron if (self.remote and self.ssh_client) else self.cron
+        cron_to_use = self._active_cron()
 
         job_to_toggle = self.find_if_cronjob_exists(identificator, cmd)
 
-        if job_to_toggle is None:
-            job_to_toggle = self.find_if_cronjob_exists(
-                identificator,
-                wrap_command(
-                    cmd,
-                    identificator,
-                    self.ssh_client if self.remote and self.ssh_client else None,
-                ),
-            )
-
-        if job_to_toggle is None:
-            job_to_toggle = self.find_if_cronjob_exists(
-                identificator, command_without_wrapper(cmd)
-            )
-
         if job_to_toggle:
             job_to_toggle.enable(
                 False
             ) if job_to_toggle.is_enabled() else job_to_toggle.enable(True)
 
             if self.remote and self.ssh_client:
-                self.write_remote_crontab()
+                if not await self.write_remote_crontab():
+                    # Show what the host really has rather than the failed toggle.
+                    self.action_refresh()
+                    return
             else:
                 cron_to_use.write()
             self.load_crontabs()
 
     def action_edit_cronjob(self) -> None:
 
-        row = self.get_row_at(self.cursor_row)
+        row = self._cursor_row_data()
         identificator = row[0]
         expr = row[1]
         cmd = row[2]
 
-        job_to_edit = self.find_if_cronjob_exists(
-            identificator,
-            wrap_command(
-                cmd,
-                identificator,
-                self.ssh_client if self.remote and self.ssh_client else None,
-            ),
-        )
-        if job_to_edit:
-            self.action_edit_cronjob_keybind(
-                identificator,
-                expr,
-                wrap_command(
-                    cmd,
-                    identificator,
-                    self.ssh_client if self.remote and self.ssh_client else None,
-                ),
-            )
-            return
-
-        if not job_to_edit:
-            job_to_edit = self.find_if_cronjob_exists(identificator, cmd)
+        job_to_edit = self.find_if_cronjob_exists(identificator, cmd)
         if job_to_edit:
-            self.action_edit_cronjob_keybind(identificator, expr, cmd)
+            # Hand over the stored command so the editor sees whether it is wrapped.
+            self.action_edit_cronjob_keybind(identificator, expr, job_to_edit.command)
 
     def action_delete_cronjob(self) -> None:
         """Delete the selected cronjob."""
 
-        row = self.get_row_at(self.cursor_row)
+        row = self._cursor_row_data()
         identificator = row[0]
         cmd = row[2]
 
@@ -379,67 +528,49 @@ class CronTable(DataTable):
             self.action_delete_cronjob_keybind(job_to_delete)
 
     def find_if_cronjob_exists(self, identificator: str, cmd: str):
-        cron_to_use = self.ssh_cron if (self.remote and self.ssh_client) else self.cron
-
-        cmd_variants = {
-            cmd,
-            wrap_command(
-                cmd,
-                identificator,
-                self.ssh_client if self.remote and self.ssh_client else None,
-            ),
-            command_without_wrapper(cmd),
-        }
-
-        for job in cron_to_use:
-            if job.comment == identificator and job.command in cmd_variants:
-                return job
-        return None
+        """Look the job up in the index, matching wrapped and unwrapped commands."""
+        return self._job_index.get(job_key(identificator, cmd))
 
     def action_disconnect_ssh(self) -> None:
         """Disconnect SSH connection and return to local cron tab."""
         if self.remote and self.ssh_client:
             self.app.action_disconnect_ssh()
 
-    def write_remote_crontab(self):
+    async def write_remote_crontab(self):
         """Writes the current SSH cron table back to the remote server."""
         if not (self.remote and self.ssh_client and self.ssh_cron):
             return False
 
+        content = self.ssh_cron.render()
         try:
-            new_crontab_content = self.ssh_cron.render()
-
-            crontab_cmd = (
-                f"crontab -u {self.crontab_user} -"
-                if self.crontab_user
-                else "crontab -"
+            result = await remote.write_stdin(
+                self.ssh_client, crontab_write_command(self.crontab_user), content
             )
-            stdin, _, stderr = self.ssh_client.exec_command(crontab_cmd)
-            stdin.write(new_crontab_content)
-            stdin.channel.shutdown_write()
-
-            exit_status = stdin.channel.recv_exit_status()
-            errors = stderr.read().decode().strip()
 
-            if errors:
-                print(f"❌ Failed to write remote crontab: {errors}")
-                return False
-
-            if exit_status != 0:
-                print(f"❌ Command failed with exit status: {exit_status}")
-                return False
-
-            print("✅ Remote crontab updated successfully")
-            return True
+            if result.stderr:
+                print(f"❌ Failed to write remote crontab: {result.stderr}")
+            elif result.exit_status != 0:
+                print(f"❌ Command failed with exit status: {result.exit_status}")
+            else:
+                crontab_hashes.record(self.ssh_client, self.crontab_user, content)
+                print("✅ Remote crontab updated successfully")
+                return True
 
         except Exception as e:
             print(f"❌ Error writing remote crontab: {e}")
-            return False
+        crontab_hashes.forget(self.ssh_client, self.crontab_user)
+        return False
+
+    def action_view_system_crontabs(self) -> None:
+        """Show /etc/crontab, /etc/cron.d and every user crontab of this host."""
+        self.app.action_view_system_crontabs(
+            ssh_client=self.ssh_client if self.remote and self.ssh_client else None
+        )
 
     def action_view_logs(self) -> None:
         """View logs for the selected cronjob."""
 
-        row = self.get_row_at(self.cursor_row)
+        row = self._cursor_row_data()
         identificator = row[0]
 
         self.app.push_screen(
@@ -448,3 +579,14 @@ class CronTable(DataTable):
                 ssh_client=self.ssh_client if self.remote and self.ssh_client else None,
             ),
         )
+
+    def action_log_retention(self) -> None:
+        """Edit how long the logs of the selected cronjob are kept."""
+
+        row = self._cursor_row_data()
+        self.app.push_screen(
+            CronLogRetention(
+                identificator=row[0],
+                ssh_client=self.ssh_client if self.remote and self.ssh_client else None,
+            ),
+        )
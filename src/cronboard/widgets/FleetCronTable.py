@@ -0,0 +1,101 @@
+from textual import work
+from textual.worker import Worker, WorkerState
+
+from cronboard.services.fleet import FleetResult, fetch_fleet
+from cronboard.services.messages import FleetHostFetched
+from cronboard.services.ssh_pool import SSHSessionPool
+from cronboard.widgets.CronTable import CronTable
+
+_FLEET_GROUP = "fleet-load"
+_READ_ONLY_ACTIONS = (
+    "create_cronjob_keybind",
+    "edit_cronjob",
+    "delete_cronjob",
+    "pause_cronjob",
+    "view_logs",
+    "view_system_crontabs",
+    "log_retention",
+    "verify_remote",
+)
+
+
+class FleetCronTable(CronTable):
+    """Read-only crontabs of every configured server merged into one table.
+
+    All servers are fetched concurrently and each host's rows are added as
+    soon as it answers; the border title keeps count of answers and failures.
+    """
+
+    COLUMNS = (*CronTable.COLUMNS, "Host")
+
+    def __init__(self, servers: dict[str, dict], ssh_pool: SSHSessionPool, **kwargs):
+        super().__init__(**kwargs)
+        self.servers = servers
+        self.ssh_pool = ssh_pool
+        # Rows per server in the order the servers first answered, so a refresh
+        # updates each host's rows in place.
+        self._host_rows: dict[str, list[tuple]] = {}
+        self.failures: dict[str, str] = {}
+
+    def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
+        if action in _READ_ONLY_ACTIONS:
+            return False
+        return super().check_action(action, parameters)
+
+    @staticmethod
+    def row_keys(rows: list[tuple]) -> list[str]:
+        # The same job on two hosts must not share a row key.
+        return [
+            f"{row[-1]}\x00{key}" for row, key in zip(rows, CronTable.row_keys(rows))
+        ]
+
+    @staticmethod
+    def build_host_rows(result: FleetResult) -> list[tuple]:
+        return [(*row, result.label) for row in CronTable.build_rows(result.value)]
+
+    def action_refresh(self) -> None:
+        """Fetch every server again; rows stay until their host answers."""
+        for server_id in list(self._host_rows):
+            if server_id not in self.servers:
+                del self._host_rows[server_id]
+        self.failures = {}
+        self._update_progress(0)
+        self._fetch_fleet_worker()
+
+    @work(exclusive=True, group=_FLEET_GROUP, exit_on_error=False)
+    async def _fetch_fleet_worker(self) -> None:
+        answered = 0
+        async for result in fetch_fleet(self.servers, self.ssh_pool):
+            answered += 1
+            self.apply_result(result)
+            self._update_progress(answered)
+        if self.failures:
+            self.notify(
+                f"Could not read {len(self.failures)} server(s): "
+                + ", ".join(sorted(self.failures)),
+                severity="warning",
+            )
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        if event.worker.group == _FLEET_GROUP and event.state == WorkerState.ERROR:
+            self.notify(
+                f"Failed to load servers: {event.worker.error}", severity="error"
+            )
+
+    def apply_result(self, result: FleetResult) -> None:
+        if result.error is None:
+            self._host_rows[result.server_id] = self.build_host_rows(result)
+        else:
+            self._host_rows.pop(result.server_id, None)
+            self.failures[result.server_id] = result.error
+        # Through ``load_crontabs``, so search highlights are undone while
+        # the rows of a host that failed or lost jobs still exist.
+        self.load_crontabs([row for rows in self._host_rows.values() for row in rows])
+        self.refresh_bindings()
+        self.post_message(FleetHostFetched(result.server_id, result.error))
+
+    def _update_progress(self, answered: int) -> None:
+        title = f"All servers: {answered}/{len(self.servers)} answered"
+        if self.failures:
+            title += f", {len(self.failures)} failed"
+        self.border_title = title
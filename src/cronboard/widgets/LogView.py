@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import re
+from datetime import datetime
 from typing import ClassVar
 
 from rich.cells import cell_len
 from rich.style import Style
 from rich.text import Text
 
-from textual import events, on
+from textual import events, on, work
 from textual.app import ComposeResult
 from textual.binding import Binding, BindingType
 from textual.containers import Grid, Horizontal, Vertical
@@ -20,7 +21,14 @@ from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Button
 
-from cronboard.services.logging.logger import get_log_files, read_log_file
+from cronboard.services import remote
+from cronboard.services.logging.log_sources import (
+    LOG_READ_AHEAD_LINES,
+    ListLogSource,
+    LogSource,
+    open_log_source,
+)
+from cronboard.services.logging.logger import LogEntry, get_log_entries
 
 _sub_escape = re.compile("[\u0000-\u0014]").sub
 
@@ -29,11 +37,33 @@ def _process_log_line(line: str) -> str:
     return _sub_escape("", line.expandtabs())
 
 
+def _format_size(size: int) -> str:
+    if size < 1024:
+        return f"{size}B"
+    for unit in ("K", "M"):
+        size /= 1024
+        if size < 1024:
+            return f"{size:.1f}{unit}"
+    return f"{size / 1024:.1f}G"
+
+
+def _log_label(key: str, width: int, entry: LogEntry | None) -> str:
+    if entry is None:
+        return key
+    modified = datetime.fromtimestamp(entry.mtime).strftime("%Y-%m-%d %H:%M")
+    return f"{key:<{width}}  {_format_size(entry.size):>6}  {modified}"
+
+
 _LOG_LIST_SELECTION_DEBOUNCE_SEC = 0.3
+_LOG_FOLLOW_INTERVAL_SEC = 1.0
 
 
 class VirtualLogFileList(ScrollView, can_focus=True):
-    """Scrollable log file list: full list size for the scrollbar, one row rendered per screen line."""
+    """Scrollable log file list: full list size for the scrollbar, one row rendered per screen line.
+
+    With ``entries`` given, each row also shows the log's size and when it
+    was last written.
+    """
 
     ALLOW_MAXIMIZE = True
 
@@ -47,6 +77,7 @@ class VirtualLogFileList(ScrollView, can_focus=True):
         self,
         keys: list[str],
         paths: dict[str, str],
+        entries: dict[str, LogEntry] | None = None,
         *,
         name: str | None = None,
         id: str | None = None,
@@ -54,11 +85,43 @@ class VirtualLogFileList(ScrollView, can_focus=True):
         disabled: bool = False,
     ) -> None:
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
+        self._selection_emit_timer: Timer | None = None
+        self._placeholder = "No logs found"
+        self._set_logs(keys, paths, entries)
+
+    def _set_logs(
+        self,
+        keys: list[str],
+        paths: dict[str, str],
+        entries: dict[str, LogEntry] | None,
+    ) -> None:
         self._keys = keys
         self._paths = paths
-        self._line_width = max((cell_len(k) for k in keys), default=1)
+        key_width = max((cell_len(k) for k in keys), default=1)
+        entries = entries or {}
+        self._labels = [_log_label(k, key_width, entries.get(k)) for k in keys]
+        self._line_width = max((cell_len(label) for label in self._labels), default=1)
         self.selected_index = 0 if keys else -1
-        self._selection_emit_timer: Timer | None = None
+
+    def set_placeholder(self, message: str) -> None:
+        """Text shown while the list is empty, e.g. while it is loading."""
+        self._placeholder = message
+        self.refresh()
+
+    def set_logs(
+        self,
+        keys: list[str],
+        paths: dict[str, str],
+        entries: dict[str, LogEntry] | None = None,
+    ) -> None:
+        """Replace the listed logs and select the first one."""
+        self._set_logs(keys, paths, entries)
+        self._placeholder = "No logs found"
+        self._refresh_dimensions()
+        self.scroll_to(y=0.0, animate=False, immediate=True)
+        self.refresh()
+        if keys:
+            self._emit_selected_immediate()
 
     def _cancel_selection_emit_timer(self) -> None:
         if self._selection_emit_timer is not None:
@@ -167,12 +230,12 @@ class VirtualLogFileList(ScrollView, can_focus=True):
         if not self._keys:
             if row != 0:
                 return Strip.blank(width, rich_style)
-            text = Text("No logs found", no_wrap=True)
+            text = Text(self._placeholder, no_wrap=True)
             text.stylize(rich_style)
-            return Strip(text.render(self.app.console), cell_len("No logs found"))
+            return Strip(text.render(self.app.console), cell_len(self._placeholder))
         if row >= len(self._keys):
             return Strip.blank(width, rich_style)
-        label = self._keys[row]
+        label = self._labels[row]
         line_text = Text(label, no_wrap=True)
         line_text.stylize(rich_style)
         if row == self.selected_index:
@@ -183,7 +246,15 @@ class VirtualLogFileList(ScrollView, can_focus=True):
 
 
 class VirtualLogLines(ScrollView, can_focus=True):
-    """Log file body: all lines kept in memory; scrollbar reflects full height; only visible rows render."""
+    """Log file body backed by a :class:`LogSource`; only visible rows render.
+
+    Lines are read from the source as the viewport approaches the end of
+    what is loaded, :data:`LOG_READ_AHEAD_LINES` ahead of the bottom row,
+    and are decoded and sanitized only when a row is rendered.
+
+    While following, the source is polled for appended lines, and the
+    viewport stays at the bottom unless it was scrolled away from it.
+    """
 
     def __init__(
         self,
@@ -194,51 +265,146 @@ class VirtualLogLines(ScrollView, can_focus=True):
         disabled: bool = False,
     ) -> None:
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
-        self._lines: list[str] = []
-        self._max_cell_len = 1
-
-    def _compute_max_cell_len(self, lines: list[str]) -> int:
-        if not lines:
-            return 1
-        if len(lines) > 50_000:
-            head = lines[:25_000]
-            tail = lines[-25_000:]
-            max_w = max((cell_len(line) for line in head), default=1)
-            return max(max_w, max((cell_len(line) for line in tail), default=1))
-        return max((cell_len(line) for line in lines), default=1)
+        self._source: LogSource = ListLogSource([])
+        self._loading = False
+        self.following = False
+        self._follow_timer: Timer | None = None
 
     def set_content(self, lines: list[str]) -> None:
-        self._lines = [_process_log_line(line) for line in lines]
-        self._max_cell_len = self._compute_max_cell_len(self._lines)
-        self._apply_virtual_size()
-        self.scroll_to(y=0.0, animate=False, immediate=True)
-        self.refresh()
+        self.set_source(ListLogSource(lines))
 
     def set_placeholder(self, message: str) -> None:
-        self._lines = [_process_log_line(message)]
-        self._max_cell_len = self._compute_max_cell_len(self._lines)
+        self.set_source(ListLogSource([message]))
+
+    def set_source(self, source: LogSource) -> None:
+        if source is not self._source:
+            self._source.close()
+        self._source = source
+        self._loading = False
         self._apply_virtual_size()
-        self.scroll_to(y=0.0, animate=False, immediate=True)
+        if self.following:
+            self.scroll_end(animate=False)
+        else:
+            self.scroll_to(y=0.0, animate=False, immediate=True)
         self.refresh()
+        self._check_window()
+
+    def toggle_follow(self) -> bool:
+        self.following = not self.following
+        if self._follow_timer is not None:
+            self._follow_timer.stop()
+            self._follow_timer = None
+        if self.following:
+            self._follow_timer = self.set_interval(
+                _LOG_FOLLOW_INTERVAL_SEC, self._poll_follow, name="log-follow"
+            )
+            self.scroll_end(animate=False)
+        return self.following
+
+    async def _poll_follow(self) -> None:
+        source = self._source
+        if self._loading:
+            return
+        at_end = self.is_vertical_scroll_end
+        self._loading = True
+        try:
+            grown = await remote.call(source.ssh, source.follow)
+        except Exception as e:
+            if source is self._source:
+                self.notify(f"Could not follow the log: {e}", severity="error")
+            return
+        finally:
+            if source is self._source:
+                self._loading = False
+        if grown and source is self._source:
+            self._apply_virtual_size()
+            if at_end:
+                self.scroll_end(animate=False)
+            self.refresh()
+
+    def _check_window(self) -> None:
+        """Start reading more lines when the viewport nears the end of those loaded.
+
+        Lines scrolled back to after the source dropped them are read again,
+        with :data:`LOG_READ_AHEAD_LINES` on either side.
+        """
+        source = self._source
+        if self._loading:
+            return
+        top = int(self.scroll_offset.y)
+        bottom = top + self.size.height
+        if not source.has_lines(top, bottom):
+            self._loading = True
+            self._load_lines(
+                source, top - LOG_READ_AHEAD_LINES, bottom + LOG_READ_AHEAD_LINES
+            )
+            return
+        if source.complete:
+            return
+        needed = bottom + LOG_READ_AHEAD_LINES
+        if len(source) < needed or source.index_whole_file:
+            self._loading = True
+            self._read_more(source, needed)
+
+    @work(group="log-window", exit_on_error=False)
+    async def _load_lines(self, source: LogSource, start: int, end: int) -> None:
+        try:
+            await remote.call(source.ssh, source.load, start, end)
+        except Exception as e:
+            if source is self._source:
+                self.notify(f"Could not read the log: {e}", severity="error")
+            return
+        finally:
+            if source is self._source:
+                self._loading = False
+        if source is self._source:
+            self.refresh()
+            self._check_window()
+
+    @work(group="log-window", exit_on_error=False)
+    async def _read_more(self, source: LogSource, needed: int) -> None:
+        try:
+            await remote.call(source.ssh, source.read_more, needed)
+        except Exception as e:
+            if source is self._source:
+                self.notify(f"Could not read the log: {e}", severity="error")
+            return
+        finally:
+            if source is self._source:
+                self._loading = False
+        if source is self._source:
+            self._apply_virtual_size()
+            self.refresh()
+            self._check_window()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        self._check_window()
 
     def _apply_virtual_size(self) -> None:
         region_w = self.scrollable_content_region.width
-        vw = max(self._max_cell_len, region_w, 1)
-        vh = max(1, len(self._lines))
+        vw = max(self._source.max_line_length, region_w, 1)
+        vh = max(1, len(self._source))
         self.virtual_size = Size(vw, vh)
 
     def on_resize(self, event: events.Resize) -> None:
-        if self._lines:
+        if len(self._source):
             self._apply_virtual_size()
+        self._check_window()
+
+    def on_unmount(self) -> None:
+        if self._follow_timer is not None:
+            self._follow_timer.stop()
+        self._source.close()
 
     def render_line(self, y: int) -> Strip:
         scroll_x, scroll_y = self.scroll_offset
         row = scroll_y + y
         width = self.size.width
         rich_style = self.rich_style
-        if row >= len(self._lines):
+        if row >= len(self._source):
             return Strip.blank(width, rich_style)
-        raw = self._lines[row]
+        raw = _process_log_line(self._source.line(row))
         line_text = Text(raw, no_wrap=True)
         line_text.stylize(rich_style)
         strip = Strip(line_text.render(self.app.console), cell_len(raw))
@@ -255,11 +421,35 @@ class LogList(Widget):
     def __init__(self, identificator: str, ssh_client=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.identificator = identificator
-        self.log_paths = get_log_files(identificator, ssh_client)
-        self.logs = list(self.log_paths.keys())
+        self.ssh_client = ssh_client
+        self.log_entries: dict[str, LogEntry] = {}
+        self.log_paths: dict[str, str] = {}
+        self.logs: list[str] = []
 
     def compose(self):
-        yield VirtualLogFileList(self.logs, self.log_paths)
+        yield VirtualLogFileList(self.logs, self.log_paths, self.log_entries)
+
+    def on_mount(self) -> None:
+        self.query_one(VirtualLogFileList).set_placeholder("Loading logs...")
+        self._load_logs()
+
+    @work(group="log-list", exit_on_error=False)
+    async def _load_logs(self) -> None:
+        """List the job's logs off the event loop; remote listings take a round trip."""
+        file_list = self.query_one(VirtualLogFileList)
+        try:
+            entries = await remote.call(
+                self.ssh_client, get_log_entries, self.identificator, self.ssh_client
+            )
+        except Exception as e:
+            file_list.set_placeholder("No logs found")
+            self.notify(f"Could not list the logs: {e}", severity="error")
+            return
+        self.log_entries = entries
+        self.log_paths = {key: entry.path for key, entry in entries.items()}
+        self.logs = list(self.log_paths)
+        file_list.set_logs(self.logs, self.log_paths, self.log_entries)
+        self.screen.refresh_bindings()
 
 
 class LogView(Widget):
@@ -268,6 +458,7 @@ class LogView(Widget):
         Binding("h", "cursor_left", "Left"),
         Binding("j", "cursor_down", "Down"),
         Binding("k", "cursor_up", "Up"),
+        Binding("f", "toggle_follow", "Follow"),
     ]
 
     def __init__(self, identificator: str, ssh_client=None) -> None:
@@ -288,6 +479,7 @@ class LogView(Widget):
             "cursor_down",
             "cursor_left",
             "cursor_right",
+            "toggle_follow",
         ):
             return not is_empty
         return True
@@ -298,6 +490,12 @@ class LogView(Widget):
     def action_cursor_right(self) -> None:
         self.app.set_focus(self.log_output)
 
+    def action_toggle_follow(self) -> None:
+        if self.log_output.toggle_follow():
+            self.notify("Following the log; new lines appear as they are written")
+        else:
+            self.notify("Stopped following the log")
+
     def action_cursor_down(self) -> None:
         if self.log_output.has_focus:
             self.log_output.action_scroll_down()
@@ -343,12 +541,22 @@ class LogView(Widget):
                 self.app.set_focus(self._file_list())
 
     @on(LogList.LogSelected)
-    def show_log(self, event: LogList.LogSelected):
-        lines = read_log_file(event.log_path, self.ssh_client)
-        if len(lines) == 0:
-            self.log_output.set_content(["No logs found"])
+    async def show_log(self, event: LogList.LogSelected):
+        if self.ssh_client is None:
+            source = open_log_source(event.log_path, None)
+        else:
+            try:
+                source = await remote.call(
+                    self.ssh_client, open_log_source, event.log_path, self.ssh_client
+                )
+            except Exception as e:
+                self.log_output.set_placeholder("No logs found")
+                self.notify(f"Could not open the log: {e}", severity="error")
+                return
+        if source is None:
+            self.log_output.set_placeholder("No logs found")
         else:
-            self.log_output.set_content(lines)
+            self.log_output.set_source(source)
 
 
 class LogViewModal(ModalScreen[bool]):
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import heapq
+from collections import OrderedDict
+from datetime import datetime
+from typing import NamedTuple
+
+from rich.cells import cell_len
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.measure import Measurement
+from rich.text import Text
+from textual.timer import Timer
+from textual.widgets import DataTable
+
+from cronboard.services.schedule_cache import RUN_TIME_FORMAT, schedule_cache
+
+STATUS_STYLES = {
+    "Active": "#B8E7B8",
+    "Paused": "#FF6F61",
+    "Inactive": "#F6BF00",
+}
+RUN_INFO_CACHE_SIZE = 512
+# Upper bound between fire-time checks, so clock jumps or suspend are picked up.
+MAX_FIRE_TIMER_DELAY = 60.0
+
+_DEFAULT_WIDTHS = {
+    "last": cell_len(datetime(2000, 1, 1).strftime(RUN_TIME_FORMAT)),
+    "next": cell_len(datetime(2000, 1, 1).strftime(RUN_TIME_FORMAT)),
+    "status": max(cell_len(status) for status in STATUS_STYLES),
+}
+
+
+class RunInfo(NamedTuple):
+    last_run: str
+    next_run: str
+    status: str
+    next_fire: datetime | None
+
+
+def compute_run_info(expression: str, enabled: bool, now: datetime) -> RunInfo:
+    try:
+        prev_run, next_run = schedule_cache.runs_around(expression, now)
+    except ValueError as e:
+        return RunInfo(f"ERR: {e}", f"ERR: {e}", "Inactive", None)
+    if not enabled:
+        return RunInfo(prev_run.strftime(RUN_TIME_FORMAT), "Paused", "Paused", None)
+    return RunInfo(
+        prev_run.strftime(RUN_TIME_FORMAT),
+        next_run.strftime(RUN_TIME_FORMAT),
+        "Active",
+        next_run,
+    )
+
+
+class ScheduleCell:
+    """Last Run, Next Run or Status cell, computed only when its row is drawn.
+
+    Until it is bound to a :class:`ScheduleColumns` the cell computes its value
+    on every access, which keeps it usable outside of a table.
+    """
+
+    __slots__ = ("expression", "enabled", "field", "columns", "row_key")
+
+    def __init__(self, expression: str, enabled: bool, field: str) -> None:
+        self.expression = expression
+        self.enabled = enabled
+        self.field = field
+        self.columns: ScheduleColumns | None = None
+        self.row_key: str | None = None
+
+    def _info(self) -> RunInfo:
+        if self.columns is None or self.row_key is None:
+            return compute_run_info(self.expression, self.enabled, datetime.now())
+        return self.columns.resolve(self.row_key, self)
+
+    def _value(self, info: RunInfo) -> str:
+        if self.field == "last":
+            return info.last_run
+        if self.field == "next":
+            return info.next_run
+        return info.status
+
+    def text(self) -> Text:
+        value = self._value(self._info())
+        if self.field == "status":
+            return Text(value, style=STATUS_STYLES[value])
+        return Text(value)
+
+    def __str__(self) -> str:
+        return self._value(self._info())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ScheduleCell):
+            return NotImplemented
+        return (self.expression, self.enabled, self.field) == (
+            other.expression,
+            other.enabled,
+            other.field,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.expression, self.enabled, self.field))
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        yield self.text()
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        # Measuring must not compute the value, or every row would be computed
+        # when it is added; only rows already drawn report their real width.
+        info = None
+        if self.columns is not None and self.row_key is not None:
+            info = self.columns.peek(self.row_key)
+        width = (
+            cell_len(self._value(info))
+            if info is not None
+            else _DEFAULT_WIDTHS[self.field]
+        )
+        return Measurement(width, width)
+
+
+def schedule_cells(expression: str, enabled: bool) -> tuple[ScheduleCell, ...]:
+    """The Last Run, Next Run and Status cells of one job."""
+    return tuple(
+        ScheduleCell(expression, enabled, field) for field in ("last", "next", "status")
+    )
+
+
+class ScheduleColumns:
+    """Lazily computed schedule columns of a :class:`DataTable`.
+
+    Run times are computed when a row is drawn and kept in a bounded LRU keyed
+    by row key. Every computed next run goes into a min-heap, and a single timer
+    re-renders just the rows whose next run has passed, so the work per tick is
+    proportional to the jobs that fired rather than to the table size.
+    """
+
+    def __init__(self, table: DataTable, maxsize: int = RUN_INFO_CACHE_SIZE) -> None:
+        self._table = table
+        self.maxsize = maxsize
+        self.column_keys: dict[str, object] = {}
+        self._cache: OrderedDict[str, RunInfo] = OrderedDict()
+        self._fire_heap: list[tuple[datetime, str]] = []
+        self._fire_timer: Timer | None = None
+        self._arm_pending = False
+
+    def bind(self, row_key: str, row: tuple) -> None:
+        for cell in row:
+            if isinstance(cell, ScheduleCell):
+                cell.columns = self
+                cell.row_key = row_key
+
+    def peek(self, row_key: str) -> RunInfo | None:
+        return self._cache.get(row_key)
+
+    def resolve(self, row_key: str, cell: ScheduleCell) -> RunInfo:
+        info = self._cache.get(row_key)
+        if info is not None:
+            self._cache.move_to_end(row_key)
+            return info
+
+        info = compute_run_info(cell.expression, cell.enabled, datetime.now())
+        self._cache[row_key] = info
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+        if info.next_fire is not None:
+            is_earliest = not self._fire_heap or info.next_fire < self._fire_heap[0][0]
+            heapq.heappush(self._fire_heap, (info.next_fire, row_key))
+            if is_earliest:
+                self._request_arm()
+        if info.status == "Inactive":
+            # Error messages are wider than a date: grow the columns once drawn.
+            self._table.call_after_refresh(self._refresh_row, row_key, True)
+        return info
+
+    def invalidate(self, row_key: str) -> None:
+        self._cache.pop(row_key, None)
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._fire_heap = []
+        self._stop_timer()
+
+    def _stop_timer(self) -> None:
+        if self._fire_timer is not None:
+            self._fire_timer.stop()
+            self._fire_timer = None
+
+    def _request_arm(self) -> None:
+        # Values are resolved while the table renders; arm the timer afterwards.
+        if not self._arm_pending:
+            self._arm_pending = True
+            self._table.call_after_refresh(self._arm_timer)
+
+    def _arm_timer(self) -> None:
+        self._arm_pending = False
+        self._stop_timer()
+        if len(self._fire_heap) > 4 * max(len(self._cache), 64):
+            self._compact()
+        if not self._fire_heap:
+            return
+        delay = (self._fire_heap[0][0] - datetime.now()).total_seconds()
+        # Fire slightly after the minute boundary so the run counts as "last".
+        delay = min(max(delay, 0) + 0.05, MAX_FIRE_TIMER_DELAY)
+        self._fire_timer = self._table.set_timer(
+            delay, self.advance, name="cron-next-run"
+        )
+
+    def _compact(self) -> None:
+        self._fire_heap = [
+            (info.next_fire, row_key)
+            for row_key, info in self._cache.items()
+            if info.next_fire is not None
+        ]
+        heapq.heapify(self._fire_heap)
+
+    def _refresh_row(self, row_key: str, update_width: bool = False) -> None:
+        table = self._table
+        if row_key not in table.rows:
+            return
+        for field in ("last", "next"):
+            column_key = self.column_keys.get(field)
+            if column_key is not None:
+                cell = table.get_cell(row_key, column_key)
+                table.update_cell(row_key, column_key, cell, update_width=update_width)
+
+    def advance(self) -> None:
+        """Recompute the rows whose next run has passed and re-arm the timer."""
+        self._fire_timer = None
+        now = datetime.now()
+        heap = self._fire_heap
+        while heap and heap[0][0] <= now:
+            fire_time, row_key = heapq.heappop(heap)
+            info = self._cache.get(row_key)
+            # Entries of evicted, invalidated or already advanced rows are stale.
+            if info is None or info.next_fire != fire_time:
+                continue
+            self.invalidate(row_key)
+            self._refresh_row(row_key)
+        self._arm_timer()
@@ -0,0 +1,56 @@
+from cronboard.services.system_crontabs import (
+    SystemCrontabs,
+    read_local_crontabs,
+    read_remote_crontabs,
+)
+from cronboard.widgets.CronTable import CronTable
+
+_READ_ONLY_ACTIONS = (
+    "create_cronjob_keybind",
+    "edit_cronjob",
+    "delete_cronjob",
+    "pause_cronjob",
+    "view_system_crontabs",
+    "log_retention",
+    "verify_remote",
+)
+
+
+class SystemCronTable(CronTable):
+    """Read-only view of /etc/crontab, /etc/cron.d and every user crontab.
+
+    All sources are read in one load (in parallel locally, with a single
+    command remotely) and merged into one table with a Source column.
+    """
+
+    COLUMNS = (*CronTable.COLUMNS, "Source")
+
+    def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
+        if action in _READ_ONLY_ACTIONS:
+            return False
+        return super().check_action(action, parameters)
+
+    @staticmethod
+    def build_system_rows(crontabs: SystemCrontabs) -> list[tuple]:
+        rows = []
+        for source, tab in crontabs.tabs:
+            for row, job in zip(CronTable.build_rows(tab), tab):
+                label = source.label
+                if source.system and job.user:
+                    label = f"{label} ({job.user})"
+                rows.append((*row, label))
+        return rows
+
+    def load_rows(self, remote, ssh_client, crontab_user) -> tuple[None, list[tuple]]:
+        if remote and ssh_client:
+            crontabs = read_remote_crontabs(ssh_client)
+        else:
+            crontabs = read_local_crontabs()
+        if crontabs.skipped:
+            paths = ", ".join(path for path, _ in crontabs.skipped)
+            self.app.call_from_thread(
+                self.notify,
+                f"Skipped unreadable crontabs: {paths}",
+                severity="warning",
+            )
+        return None, self.build_system_rows(crontabs)
@@ -0,0 +1,41 @@
+import pytest
+from textual.app import App
+from textual.widgets import DataTable
+
+from cronboard.screens.CronBulkApply import CronBulkApply
+from cronboard.services.bulk_apply import JobDefinition
+from cronboard.services.fleet import FleetResult
+
+from .conftest import make_server
+
+
+class BulkApplyApp(App):
+    def toggle_tab_enablement(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_results_are_shown_per_host(mocker):
+    async def fake_apply(servers, _pool, _definition):
+        yield FleetResult("b", "deploy@b: deploy", None, "authentication failed", 0.4)
+        yield FleetResult("a", "deploy@a: deploy", "added", None, 1.25)
+
+    mocker.patch("cronboard.screens.CronBulkApply.apply_to_fleet", fake_apply)
+    servers = {host: make_server(host, name=f"deploy@{host}") for host in "abc"}
+    definition = JobDefinition("backup", "0 3 * * *", "/usr/bin/backup", False)
+
+    async with BulkApplyApp().run_test() as pilot:
+        screen = CronBulkApply(servers, mocker.Mock(), definition)
+        await pilot.app.push_screen(screen)
+        await pilot.app.workers.wait_for_complete()
+        await pilot.pause()
+
+        table = screen.query_one("#bulk-results", DataTable)
+        assert [str(cell) for cell in table.get_row("a")] == [
+            "deploy@a: deploy",
+            "added",
+            "1.25s",
+        ]
+        assert str(table.get_row("b")[1]) == "failed: authentication failed"
+        assert str(table.get_row("c")[1]) == "pending"
+        assert screen.failed == 1
@@ -1,6 +1,6 @@
 import pytest
 from pytest_mock import MockerFixture
-from .conftest import make_creator
+from .conftest import make_creator, wait_for_crontab_load
 from cronboard.screens.CronCreator import CronCreator
 from cronboard.app import CronBoard
 from cronboard.screens.CronCreator import CronAutoComplete
@@ -9,6 +9,7 @@ from cronboard.screens.CronCreator import CronAutoComplete
 @pytest.mark.asyncio
 async def test_open_create_cronjob_modal(app: CronBoard):
     async with app.run_test() as pilot:
+        await wait_for_crontab_load(pilot)
         await pilot.press("c")
         assert isinstance(app.screen, CronCreator)
 
@@ -44,6 +45,18 @@ def test_returns_none_when_only_comment_matches(mocker: MockerFixture):
     assert result is None
 
 
+def test_find_uses_supplied_job_index(mocker: MockerFixture):
+    job = mocker.MagicMock()
+    creator = make_creator(
+        mocker, job_index={("backup-job", "/usr/bin/backup.sh"): job}
+    )
+
+    result = creator.find_if_cronjob_exists("backup-job", "/usr/bin/backup.sh")
+
+    assert result == job
+    creator.cron.__iter__.assert_not_called()
+
+
 def test_get_search_string_no_slash(
     mocker: MockerFixture, autocomplete: CronAutoComplete
 ):
@@ -1,7 +1,12 @@
 import pytest
 from cronboard.services.messages import CronJobDeleted
 from cronboard.screens.CronDeleteConfirmation import CronDeleteConfirmation
-from .conftest import create_event, create_job_and_cron, make_remote_command
+from .conftest import (
+    create_event,
+    create_job_and_cron,
+    make_remote_command,
+    wait_for_crontab_load,
+)
 from cronboard.app import CronBoard
 from pytest_mock import MockerFixture
 
@@ -9,6 +14,7 @@ from pytest_mock import MockerFixture
 @pytest.mark.asyncio
 async def test_open_delete_cronjob_modal(app: CronBoard):
     async with app.run_test() as pilot:
+        await wait_for_crontab_load(pilot)
         await pilot.press("D")
         assert isinstance(app.screen, CronDeleteConfirmation)
 
@@ -16,6 +22,7 @@ async def test_open_delete_cronjob_modal(app: CronBoard):
 @pytest.mark.asyncio
 async def test_delete_cronjob_cancel(app: CronBoard):
     async with app.run_test() as pilot:
+        await wait_for_crontab_load(pilot)
         await pilot.press("D")
         await pilot.press("tab")
         await pilot.press("enter")
@@ -25,43 +32,47 @@ async def test_delete_cronjob_cancel(app: CronBoard):
 @pytest.mark.asyncio
 async def test_delete_cronjob_confirm(app: CronBoard):
     async with app.run_test() as pilot:
+        await wait_for_crontab_load(pilot)
         await pilot.press("D")
         await pilot.press("enter")
         assert not isinstance(app.screen, CronDeleteConfirmation)
 
 
-def test_delete_cronjob_local_write(mocker: MockerFixture):
+@pytest.mark.asyncio
+async def test_delete_cronjob_local_write(mocker: MockerFixture):
     job, cron = create_job_and_cron(mocker)
     modal = CronDeleteConfirmation(job=job, cron=cron)
     modal.dismiss = mocker.Mock()
     event = create_event("delete")
 
-    modal.on_button_pressed(event)
+    await modal.on_button_pressed(event)
 
     cron.remove.assert_called_once_with(job)
     cron.write.assert_called_once_with()
     modal.dismiss.assert_called_once_with(True)
 
 
-def test_delete_cronjob_remote_write(mocker: MockerFixture):
+@pytest.mark.asyncio
+async def test_delete_cronjob_remote_write(mocker: MockerFixture):
     job, cron = create_job_and_cron(mocker)
     _, _, ssh_client = make_remote_command(mocker)
     modal = CronDeleteConfirmation(
         job=job, cron=cron, remote=True, ssh_client=ssh_client
     )
     modal.dismiss = mocker.Mock()
-    modal.write_remote_crontab = mocker.Mock(return_value=True)
+    modal.write_remote_crontab = mocker.AsyncMock(return_value=True)
     event = create_event("delete")
 
-    modal.on_button_pressed(event)
+    await modal.on_button_pressed(event)
 
     cron.remove.assert_called_once_with(job)
     cron.write.assert_not_called()
-    modal.write_remote_crontab.assert_called_once_with()
+    modal.write_remote_crontab.assert_awaited_once_with()
     modal.dismiss.assert_called_once_with(True)
 
 
-def test_delete_cronjob_posts_cron_job_deleted_local(mocker: MockerFixture):
+@pytest.mark.asyncio
+async def test_delete_cronjob_posts_cron_job_deleted_local(mocker: MockerFixture):
     job, cron = create_job_and_cron(mocker)
     job.comment = "my-job"
     mock_app = mocker.Mock()
@@ -81,7 +92,7 @@ def test_delete_cronjob_posts_cron_job_deleted_local(mocker: MockerFixture):
     modal.dismiss = mocker.Mock()
     event = create_event("delete")
 
-    modal.on_button_pressed(event)
+    await modal.on_button_pressed(event)
 
     mock_app.post_message.assert_called_once()
     msg = mock_app.post_message.call_args[0][0]
@@ -90,7 +101,8 @@ def test_delete_cronjob_posts_cron_job_deleted_local(mocker: MockerFixture):
     assert msg.ssh_client is None
 
 
-def test_delete_cronjob_posts_cron_job_deleted_remote(mocker: MockerFixture):
+@pytest.mark.asyncio
+async def test_delete_cronjob_posts_cron_job_deleted_remote(mocker: MockerFixture):
     job, cron = create_job_and_cron(mocker)
     job.comment = "r-job"
     _, _, ssh_client = make_remote_command(mocker)
@@ -111,10 +123,10 @@ def test_delete_cronjob_posts_cron_job_deleted_remote(mocker: MockerFixture):
         job=job, cron=cron, remote=True, ssh_client=ssh_client
     )
     modal.dismiss = mocker.Mock()
-    modal.write_remote_crontab = mocker.Mock(return_value=True)
+    modal.write_remote_crontab = mocker.AsyncMock(return_value=True)
     event = create_event("delete")
 
-    modal.on_button_pressed(event)
+    await modal.on_button_pressed(event)
 
     msg = mock_app.post_message.call_args[0][0]
     assert isinstance(msg, CronJobDeleted)
@@ -122,7 +134,8 @@ def test_delete_cronjob_posts_cron_job_deleted_remote(mocker: MockerFixture):
     assert msg.ssh_client is ssh_client
 
 
-def test_write_remote_crontab(mocker: MockerFixture):
+@pytest.mark.asyncio
+async def test_write_remote_crontab(mocker: MockerFixture):
     cron, _ = create_job_and_cron(mocker)
     cron.render.return_value = "* * * * * echo hello"
     stdin, stderr, ssh_client = make_remote_command(mocker)
@@ -131,7 +144,7 @@ def test_write_remote_crontab(mocker: MockerFixture):
         cron=cron, remote=True, ssh_client=ssh_client, crontab_user="root"
     )
 
-    result = modal.write_remote_crontab()
+    result = await modal.write_remote_crontab()
 
     assert result is True
     ssh_client.exec_command.assert_called_once_with("crontab -u root -")
@@ -139,7 +152,8 @@ def test_write_remote_crontab(mocker: MockerFixture):
     stdin.channel.shutdown_write.assert_called_once_with()
 
 
-def test_write_remote_crontab_error(mocker: MockerFixture):
+@pytest.mark.asyncio
+async def test_write_remote_crontab_error(mocker: MockerFixture):
     cron, _ = create_job_and_cron(mocker)
     cron.render.return_value = "* * * * * echo hello"
     stdin, stderr, ssh_client = make_remote_command(
@@ -148,7 +162,7 @@ def test_write_remote_crontab_error(mocker: MockerFixture):
 
     modal = CronDeleteConfirmation(cron=cron, remote=True, ssh_client=ssh_client)
 
-    result = modal.write_remote_crontab()
+    result = await modal.write_remote_crontab()
 
     assert result is False
     ssh_client.exec_command.assert_called_once_with("crontab -")
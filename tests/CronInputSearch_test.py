@@ -38,3 +38,25 @@ async def test_clean_search_query(pilot: Pilot):
     await search_input(pilot)
     await pilot.press("escape")
     assert crontable._search_query == ""
+
+
+@pytest.mark.asyncio
+async def test_search_filters_while_typing(pilot: Pilot):
+    crontable = pilot.app.query_one("#local-crontable")
+    await pilot.press("/")
+    await pilot.press("t", "e", "s")
+
+    assert isinstance(pilot.app.screen, CronInputSearch)
+    assert crontable._search_query == "tes"
+    assert crontable._search_matches == [0]
+
+
+@pytest.mark.asyncio
+async def test_cancel_search_restores_previous_query(pilot: Pilot):
+    crontable = pilot.app.query_one("#local-crontable")
+    await search_input(pilot)
+    await pilot.press("/")
+    await pilot.press("t", "e", "s")
+    await pilot.press("escape")
+
+    assert crontable._search_query == "cron"
@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+
+import pytest
+from pytest_mock import MockerFixture
+
+from cronboard.screens.CronLogRetention import CronLogRetention
+from cronboard.services.logging.retention import RetentionPolicy
+from cronboard.services.remote import RemoteResult
+
+from .conftest import create_event, make_query_one
+
+_SCREEN = "cronboard.screens.CronLogRetention"
+
+
+def make_screen(mocker: MockerFixture, max_count="", max_age="", compress=""):
+    screen = CronLogRetention("etl")
+    error = mocker.Mock()
+    screen.query_one = make_query_one(
+        {
+            "#max_count": SimpleNamespace(value=max_count),
+            "#max_age_days": SimpleNamespace(value=max_age),
+            "#compress_after_days": SimpleNamespace(value=compress),
+            "#error": error,
+        }
+    )
+    screen.dismiss = mocker.Mock()
+    screen.notify = mocker.Mock()
+    return screen, error
+
+
+def test_read_policy_treats_empty_fields_as_no_limit(mocker: MockerFixture):
+    screen, _ = make_screen(mocker, max_count="20", compress="3")
+
+    assert screen.read_policy() == RetentionPolicy(20, None, 3)
+
+
+def test_read_policy_rejects_non_positive_limits(mocker: MockerFixture):
+    screen, error = make_screen(mocker, max_age="0")
+
+    assert screen.read_policy() is None
+    assert "positive" in error.update.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_save_and_clean_up_stores_the_policy_then_enforces_it(
+    mocker: MockerFixture,
+):
+    set_policy = mocker.patch(f"{_SCREEN}.set_policy")
+    enforce = mocker.patch(
+        f"{_SCREEN}.enforce_retention", return_value=RemoteResult(0, "", "")
+    )
+    screen, _ = make_screen(mocker, max_count="5")
+
+    await screen.on_button_pressed(create_event("cleanup"))
+
+    set_policy.assert_called_once_with("etl", RetentionPolicy(5), None)
+    enforce.assert_called_once_with(["etl"], None)
+    screen.dismiss.assert_called_once_with(True)
+
+
+@pytest.mark.asyncio
+async def test_failed_clean_up_reports_the_error(mocker: MockerFixture):
+    mocker.patch(f"{_SCREEN}.set_policy")
+    mocker.patch(
+        f"{_SCREEN}.enforce_retention", side_effect=EOFError("session dropped")
+    )
+    screen, error = make_screen(mocker, max_count="5")
+
+    await screen.on_button_pressed(create_event("cleanup"))
+
+    assert "session dropped" in error.update.call_args.args[0]
+    screen.dismiss.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cancel_leaves_the_policy_alone(mocker: MockerFixture):
+    set_policy = mocker.patch(f"{_SCREEN}.set_policy")
+    screen, _ = make_screen(mocker, max_count="5")
+
+    await screen.on_button_pressed(create_event("cancel"))
+
+    set_policy.assert_not_called()
+    screen.dismiss.assert_called_once_with(False)
@@ -6,6 +6,15 @@ from cronboard.screens.CronSSHModal import CronSSHModal
 from textual.containers import Grid
 
 
+def transport_inputs(compression=False, ciphers="", window="", packet=""):
+    return {
+        "#compression": SimpleNamespace(value=compression),
+        "#ciphers": SimpleNamespace(value=ciphers),
+        "#window_size": SimpleNamespace(value=window),
+        "#max_packet_size": SimpleNamespace(value=packet),
+    }
+
+
 def test_parse_host_info_defaults_port():
     hostname, port = CronSSHModal._parse_host_info("node9")
     assert hostname == "node9"
@@ -80,6 +89,7 @@ def test_on_button_pressed_add_dismisses_server_data(
             "#password": SimpleNamespace(value=" password "),
             "#crontab_user": SimpleNamespace(value=" root "),
             "#content": content,
+            **transport_inputs(),
         }
     )
     event = create_event("add")
@@ -94,6 +104,7 @@ def test_on_button_pressed_add_dismisses_server_data(
             "password": "password",
             "ssh_key": False,
             "crontab_user": "root",
+            "transport": {},
         }
     )
     content.mount.assert_not_called()
@@ -112,6 +123,7 @@ def test_on_button_pressed_add_uses_ssh_key_when_password_is_empty(
             "#password": SimpleNamespace(value=""),
             "#crontab_user": SimpleNamespace(value=""),
             "#content": content,
+            **transport_inputs(),
         }
     )
     event = create_event("add")
@@ -126,6 +138,7 @@ def test_on_button_pressed_add_uses_ssh_key_when_password_is_empty(
             "password": "",
             "ssh_key": True,
             "crontab_user": None,
+            "transport": {},
         }
     )
 
@@ -143,6 +156,7 @@ def test_on_button_pressed_does_not_duplicate_existing_error(
             "#password": SimpleNamespace(value=""),
             "#crontab_user": SimpleNamespace(value=""),
             "#content": content,
+            **transport_inputs(),
         }
     )
     event = create_event("add")
@@ -151,3 +165,70 @@ def test_on_button_pressed_does_not_duplicate_existing_error(
 
     content.mount.assert_not_called()
     modal.dismiss.assert_not_called()
+
+
+def test_on_button_pressed_add_includes_transport_options(
+    mocker: MockerFixture, modal: CronSSHModal
+):
+    modal.dismiss = mocker.Mock()
+    modal.query = mocker.Mock(return_value=[])
+    modal.query_one = make_query_one(
+        {
+            "#hostname": SimpleNamespace(value="far-away"),
+            "#username": SimpleNamespace(value="test"),
+            "#password": SimpleNamespace(value=""),
+            "#crontab_user": SimpleNamespace(value=""),
+            "#content": create_content(mocker),
+            **transport_inputs(True, "aes128-gcm@openssh.com, aes128-ctr", "8M", "32K"),
+        }
+    )
+
+    modal.on_button_pressed(create_event("add"))
+
+    assert modal.dismiss.call_args.args[0]["transport"] == {
+        "compression": True,
+        "ciphers": ["aes128-gcm@openssh.com", "aes128-ctr"],
+        "window_size": 8 * 1024 * 1024,
+        "max_packet_size": 32 * 1024,
+    }
+
+
+def test_on_button_pressed_rejects_unknown_cipher(
+    mocker: MockerFixture, modal: CronSSHModal
+):
+    modal.dismiss = mocker.Mock()
+    modal.query = mocker.Mock(return_value=[])
+    content = create_content(mocker)
+    modal.query_one = make_query_one(
+        {
+            "#hostname": SimpleNamespace(value="far-away"),
+            "#username": SimpleNamespace(value="test"),
+            "#password": SimpleNamespace(value=""),
+            "#crontab_user": SimpleNamespace(value=""),
+            "#content": content,
+            **transport_inputs(ciphers="rot13"),
+        }
+    )
+
+    modal.on_button_pressed(create_event("add"))
+
+    modal.dismiss.assert_not_called()
+    assert "rot13" in str(content.mount.call_args.args[0].render())
+
+
+def test_invalid_saved_transport_falls_back_to_defaults(mocker: MockerFixture):
+    server = {
+        "name": "far-away",
+        "host": "far-away",
+        "port": 22,
+        "username": "test",
+        "transport": {"ciphers": ["rot13"], "window_size": "8M"},
+    }
+    modal = CronSSHModal(server)
+    content = create_content(mocker)
+    modal.query_one = make_query_one({"#content": content})
+
+    modal.on_mount()
+
+    assert modal.transport.to_config() == {}
+    assert "rot13" in str(content.mount.call_args.args[0].render())
@@ -1,4 +1,18 @@
+import paramiko
+import pytest
+from crontab import CronTab
+from textual.app import App
+from textual.widgets import Tree
+
+from cronboard.screens.CronBulkApply import CronBulkApply
 from cronboard.screens.CronServers import CronServers
+from cronboard.services.bulk_apply import JobDefinition
+from cronboard.services.fleet import FleetResult
+from cronboard.services.remote import remote_executor
+from cronboard.services.ssh_pool import TransportOptions
+from cronboard.services.logging.cron_wrapper import WRAPPER_STALE
+from cronboard.services.messages import RemoteCrontabLoaded
+from cronboard.widgets.FleetCronTable import FleetCronTable
 
 
 def test_disconnect_notifies_only_current_server(mocker):
@@ -22,3 +36,227 @@ def test_disconnect_notifies_only_current_server(mocker):
     servers.notify.assert_called_once_with("Disconnected from server server-A")
     assert all(not server_info["connected"] for server_info in servers.servers.values())
     assert servers.current_server_name is None
+
+
+def make_servers(mocker, pool):
+    mocker.patch.object(CronServers, "load_servers", return_value={})
+    servers = CronServers(ssh_pool=pool)
+    servers.show_cron_table_for_server = mocker.Mock()
+    servers.save_servers = mocker.Mock()
+    servers.notify = mocker.Mock()
+    return servers
+
+
+def server_info(crontab_user):
+    return {
+        "name": f"deploy@db:{crontab_user}",
+        "host": "db",
+        "port": 22,
+        "username": "deploy",
+        "password": None,
+        "ssh_key": True,
+        "connected": False,
+        "crontab_user": crontab_user,
+    }
+
+
+def test_connect_reuses_pooled_session_across_crontab_users(mocker):
+    pool = mocker.Mock()
+    client = mocker.Mock()
+    pool.acquire.return_value = client
+    servers = make_servers(mocker, pool)
+
+    servers.connect_to_server(server_info("root"))
+    servers.connect_to_server(server_info("www"))
+
+    assert pool.acquire.call_args_list == [
+        mocker.call("db", 22, "deploy", password=None, transport=TransportOptions()),
+        mocker.call("db", 22, "deploy", password=None, transport=TransportOptions()),
+    ]
+    pool.release.assert_called_once_with(client)
+    client.close.assert_not_called()
+    assert servers.show_cron_table_for_server.call_args.args[0] is client
+    assert servers.show_cron_table_for_server.call_args.args[2] == "www"
+
+
+@pytest.mark.asyncio
+async def test_stale_wrapper_is_marked_in_tree(mocker):
+    mocker.patch.object(
+        CronServers,
+        "load_servers",
+        return_value={"deploy@db:root": server_info("root")},
+    )
+    mocker.patch(
+        "cronboard.screens.CronServers.wrapper_status", return_value=WRAPPER_STALE
+    )
+    servers = CronServers()
+
+    class ServersApp(App):
+        def compose(self):
+            yield servers
+
+    async with ServersApp().run_test() as pilot:
+        ssh_client = mocker.Mock()
+        servers.current_ssh_client = ssh_client
+        servers.current_server_id = "deploy@db:root"
+        servers.notify = mocker.Mock()
+
+        servers.post_message(RemoteCrontabLoaded(ssh_client))
+        await pilot.pause()
+
+        node = servers.query_one("#servers-tree", Tree).root.children[0]
+        assert str(node.label).endswith("(stale wrapper)")
+        servers.notify.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_all_servers_node_streams_merged_crontabs(mocker):
+    mocker.patch.object(
+        CronServers,
+        "load_servers",
+        return_value={
+            "deploy@db:root": server_info("root"),
+            "deploy@db:www": server_info("www"),
+        },
+    )
+
+    async def fake_fleet(servers, _pool):
+        yield FleetResult(
+            "deploy@db:root", "db: root", CronTab(tab="0 1 * * * ls # a\n"), None, 0.1
+        )
+        yield FleetResult("deploy@db:www", "db: www", None, "timed out after 20s", 20)
+
+    mocker.patch("cronboard.widgets.FleetCronTable.fetch_fleet", fake_fleet)
+    servers = CronServers()
+
+    class ServersApp(App):
+        def compose(self):
+            yield servers
+
+    async with ServersApp().run_test() as pilot:
+        tree = servers.query_one("#servers-tree", Tree)
+        tree.move_cursor(tree.root.children[-1])
+        servers.action_connect_server()
+        await pilot.app.workers.wait_for_complete()
+        await pilot.pause()
+
+        table = servers.fleet_table
+        assert table.row_count == 1
+        assert table.get_row_at(0)[-1] == "db: root"
+        assert table.failures == {"deploy@db:www": "timed out after 20s"}
+        assert str(tree.root.children[1].label).endswith("(unreachable)")
+        assert not str(tree.root.children[0].label).endswith("(unreachable)")
+
+
+@pytest.mark.asyncio
+async def test_bulk_apply_targets_selected_servers(mocker):
+    mocker.patch.object(
+        CronServers,
+        "load_servers",
+        return_value={
+            "deploy@db:root": server_info("root"),
+            "deploy@db:www": server_info("www"),
+        },
+    )
+    servers = CronServers()
+
+    class ServersApp(App):
+        def compose(self):
+            yield servers
+
+    async with ServersApp().run_test() as pilot:
+        tree = servers.query_one("#servers-tree", Tree)
+        tree.move_cursor(tree.root.children[1])
+        servers.action_toggle_select()
+        await pilot.pause()
+        assert str(tree.root.children[1].label).startswith("+ ")
+
+        push_screen = mocker.patch.object(pilot.app, "push_screen")
+        servers.action_bulk_apply()
+        on_defined = push_screen.call_args.args[1]
+        on_defined(JobDefinition("backup", "0 3 * * *", "/usr/bin/backup", False))
+
+        bulk = push_screen.call_args.args[0]
+        assert isinstance(bulk, CronBulkApply)
+        assert list(bulk.servers) == ["deploy@db:www"]
+
+
+@pytest.mark.asyncio
+async def test_health_check_shows_latency_and_reconnects(mocker):
+    mocker.patch.object(
+        CronServers,
+        "load_servers",
+        return_value={"deploy@db:root": server_info("root")},
+    )
+    ping = mocker.patch("cronboard.screens.CronServers.ping", return_value=0.042)
+    reconnect = mocker.patch.object(
+        remote_executor, "reconnect", mocker.AsyncMock(return_value=True)
+    )
+    servers = CronServers()
+
+    class ServersApp(App):
+        def compose(self):
+            yield servers
+
+    async with ServersApp().run_test() as pilot:
+        client = servers.current_ssh_client = mocker.Mock()
+        servers.current_server_id = "deploy@db:root"
+        servers.current_cron_table = mocker.Mock()
+        node = servers.query_one("#servers-tree", Tree).root.children[0]
+
+        await servers.check_connection()
+        assert str(node.label) == "deploy@db:root: root (42 ms)"
+        reconnect.assert_not_called()
+
+        # Half-open: the keepalive times out while the transport looks active.
+        half_open = client.get_transport.return_value
+        ping.side_effect = paramiko.SSHException("SSH session dropped")
+
+        async def reopen(ssh):
+            ssh.get_transport.return_value = mocker.Mock()
+            return True
+
+        reconnect.side_effect = reopen
+        await servers.check_connection()
+        await pilot.pause()
+        half_open.close.assert_called_once()
+        reconnect.assert_awaited_once_with(client)
+        servers.current_cron_table.action_refresh.assert_called_once()
+        assert str(node.label) == "deploy@db:root: root"
+
+        # Reporting success without opening a new transport is not a reconnect.
+        reconnect.side_effect = None
+        await servers.check_connection()
+        assert str(node.label) == "deploy@db:root: root (offline)"
+        servers.current_cron_table.action_refresh.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_fleet_search_survives_a_matched_host_failing(mocker):
+    table = FleetCronTable({"deploy@db:root": server_info("root")}, mocker.Mock())
+
+    class FleetApp(App):
+        def compose(self):
+            yield table
+
+    async with FleetApp().run_test() as pilot:
+        table.apply_result(
+            FleetResult(
+                "deploy@db:root",
+                "db: root",
+                CronTab(tab="0 1 * * * ls # backup\n"),
+                None,
+                0.1,
+            )
+        )
+        table.apply_search("backup")
+        await pilot.pause()
+
+        table.apply_result(
+            FleetResult("deploy@db:root", "db: root", None, "timed out", 20)
+        )
+        table.action_clear_search()
+        await pilot.pause()
+
+        assert table.row_count == 0
+        assert table._highlighted_cells == set()
@@ -0,0 +1,436 @@
+import heapq
+import threading
+from datetime import datetime
+
+import pytest
+from pytest_mock import MockerFixture
+from textual.app import App, ComposeResult
+
+from cronboard.services.crontab_sync import content_hash
+from cronboard.services.remote import RemoteResult
+from cronboard.widgets import ScheduleColumns as ScheduleColumns_module
+from cronboard.widgets.CronTable import CronTable
+
+from .conftest import wait_for_crontab_load
+
+_CRON_TABLE = "cronboard.widgets.CronTable"
+
+
+class CronTableHarnessApp(App):
+    def compose(self) -> ComposeResult:
+        yield CronTable(id="table")
+
+
+def make_cron(mocker: MockerFixture, *jobs):
+    cron = mocker.MagicMock()
+    cron.__iter__ = mocker.MagicMock(side_effect=lambda: iter(jobs))
+    return cron
+
+
+def make_job(mocker: MockerFixture, comment: str, command: str = "echo hi"):
+    job = mocker.MagicMock()
+    job.comment = comment
+    job.command = command
+    job.slices.render.return_value = "* * * * *"
+    job.slices.clean_render.return_value = "* * * * *"
+    job.is_enabled.return_value = True
+    return job
+
+
+@pytest.mark.asyncio
+async def test_load_applies_rows_from_worker(mocker: MockerFixture):
+    cron = make_cron(mocker, make_job(mocker, "job-a"), make_job(mocker, "job-b"))
+    mocker.patch(f"{_CRON_TABLE}.CronTab", return_value=cron)
+
+    async with CronTableHarnessApp().run_test() as pilot:
+        await wait_for_crontab_load(pilot)
+        table = pilot.app.query_one(CronTable)
+
+        assert table.row_count == 2
+        assert [row[0] for row in table._rows_data] == ["job-a", "job-b"]
+        assert table.cron is cron
+        assert table.loading is False
+
+
+@pytest.mark.asyncio
+async def test_newer_refresh_discards_stale_load(mocker: MockerFixture):
+    release_stale = threading.Event()
+    stale = make_cron(mocker, make_job(mocker, "stale"))
+    fresh = make_cron(mocker, make_job(mocker, "fresh"))
+    crons = iter([stale, fresh])
+
+    def crontab_factory(*_args, **_kwargs):
+        cron = next(crons)
+        if cron is stale:
+            release_stale.wait(timeout=5)
+        return cron
+
+    mocker.patch(f"{_CRON_TABLE}.CronTab", side_effect=crontab_factory)
+
+    async with CronTableHarnessApp().run_test() as pilot:
+        table = pilot.app.query_one(CronTable)
+        await pilot.pause()
+        assert table.loading is True
+
+        table.action_refresh()
+        await pilot.pause()
+        release_stale.set()
+        await wait_for_crontab_load(pilot)
+
+        assert [row[0] for row in table._rows_data] == ["fresh"]
+        assert table.cron is fresh
+        assert table.loading is False
+
+
+@pytest.mark.asyncio
+async def test_load_failure_notifies_and_clears_loading(mocker: MockerFixture):
+    mocker.patch(f"{_CRON_TABLE}.CronTab", side_effect=OSError("no crontab binary"))
+    notify = mocker.patch.object(CronTable, "notify")
+
+    async with CronTableHarnessApp().run_test() as pilot:
+        await wait_for_crontab_load(pilot)
+        table = pilot.app.query_one(CronTable)
+
+        assert table.loading is False
+        assert table.row_count == 0
+        assert "no crontab binary" in notify.call_args.args[0]
+
+
+def make_row(identificator: str, next_run: str = "01.01.2030 at 00:00"):
+    return (identificator, "* * * * *", "echo hi", "False", "-", next_run, "Active")
+
+
+def test_row_keys_number_duplicate_jobs():
+    rows = [make_row("a"), make_row("a"), make_row("b")]
+
+    keys = CronTable.row_keys(rows)
+
+    assert len(set(keys)) == 3
+    assert keys == CronTable.row_keys(list(rows))
+
+
+@pytest.mark.asyncio
+async def test_reload_updates_only_changed_cells(mocker: MockerFixture):
+    mocker.patch(f"{_CRON_TABLE}.CronTab", return_value=make_cron(mocker))
+
+    async with CronTableHarnessApp().run_test() as pilot:
+        await wait_for_crontab_load(pilot)
+        table = pilot.app.query_one(CronTable)
+        table.load_crontabs([make_row("a"), make_row("b"), make_row("c")])
+        table.move_cursor(row=2)
+
+        add_row = mocker.spy(table, "add_row")
+        update_cell = mocker.spy(table, "update_cell")
+        clear = mocker.spy(table, "clear")
+        table.load_crontabs(
+            [make_row("a"), make_row("b", next_run="Paused"), make_row("c")]
+        )
+
+        clear.assert_not_called()
+        add_row.assert_not_called()
+        update_cell.assert_called_once()
+        assert table.get_row_at(1)[5] == "Paused"
+        assert table.cursor_row == 2
+
+
+@pytest.mark.asyncio
+async def test_reload_removes_and_appends_rows(mocker: MockerFixture):
+    mocker.patch(f"{_CRON_TABLE}.CronTab", return_value=make_cron(mocker))
+
+    async with CronTableHarnessApp().run_test() as pilot:
+        await wait_for_crontab_load(pilot)
+        table = pilot.app.query_one(CronTable)
+        table.load_crontabs([make_row("a"), make_row("b"), make_row("c")])
+
+        clear = mocker.spy(table, "clear")
+        table.load_crontabs([make_row("a"), make_row("c"), make_row("d")])
+
+        clear.assert_not_called()
+        assert [table.get_row_at(i)[0] for i in range(table.row_count)] == [
+            "a",
+            "c",
+            "d",
+        ]
+
+
+@pytest.mark.asyncio
+async def test_reload_rebuilds_when_order_changes(mocker: MockerFixture):
+    mocker.patch(f"{_CRON_TABLE}.CronTab", return_value=make_cron(mocker))
+
+    async with CronTableHarnessApp().run_test() as pilot:
+        await wait_for_crontab_load(pilot)
+        table = pilot.app.query_one(CronTable)
+        table.load_crontabs([make_row("a"), make_row("b")])
+        table.move_cursor(row=1)
+
+        table.load_crontabs([make_row("b"), make_row("a")])
+
+        assert [table.get_row_at(i)[0] for i in range(table.row_count)] == ["b", "a"]
+        assert table.cursor_row == 0
+
+
+@pytest.mark.asyncio
+async def test_fire_timer_updates_only_rows_that_fired(mocker: MockerFixture):
+    cron = make_cron(
+        mocker,
+        make_job(mocker, "every-minute"),
+        make_job(mocker, "yearly"),
+    )
+    cron_jobs = list(cron)
+    cron_jobs[1].slices.clean_render.return_value = "0 0 1 1 *"
+    mocker.patch(f"{_CRON_TABLE}.CronTab", return_value=cron)
+
+    async with CronTableHarnessApp().run_test() as pilot:
+        await wait_for_crontab_load(pilot)
+        table = pilot.app.query_one(CronTable)
+        columns = table._schedule_columns
+        assert len(columns._fire_heap) == 2
+        assert columns._fire_timer is not None
+
+        fired_key = table._row_keys[0]
+        columns._cache[fired_key] = columns._cache[fired_key]._replace(
+            next_fire=datetime(2000, 1, 1)
+        )
+        columns._fire_heap = [
+            (datetime(2000, 1, 1), key) if key == fired_key else (when, key)
+            for when, key in columns._fire_heap
+        ]
+        heapq.heapify(columns._fire_heap)
+        update_cell = mocker.spy(table, "update_cell")
+
+        columns.advance()
+        await pilot.pause()
+
+        assert {c.args[0] for c in update_cell.call_args_list} == {fired_key}
+        assert update_cell.call_count == 2
+        assert columns._fire_heap[0][0] > datetime.now()
+        assert len(columns._fire_heap) == 2
+
+
+@pytest.mark.asyncio
+async def test_paused_jobs_are_not_scheduled(mocker: MockerFixture):
+    paused = make_job(mocker, "paused")
+    paused.is_enabled.return_value = False
+    mocker.patch(f"{_CRON_TABLE}.CronTab", return_value=make_cron(mocker, paused))
+
+    async with CronTableHarnessApp().run_test() as pilot:
+        await wait_for_crontab_load(pilot)
+        table = pilot.app.query_one(CronTable)
+
+        assert str(table.get_row_at(0)[5]) == "Paused"
+        assert table._schedule_columns._fire_heap == []
+        assert table._schedule_columns._fire_timer is None
+
+
+@pytest.mark.asyncio
+async def test_schedule_columns_computed_only_for_drawn_rows(mocker: MockerFixture):
+    jobs = [make_job(mocker, f"job-{i}") for i in range(2000)]
+    mocker.patch(f"{_CRON_TABLE}.CronTab", return_value=make_cron(mocker, *jobs))
+    compute = mocker.spy(ScheduleColumns_module, "compute_run_info")
+
+    async with CronTableHarnessApp().run_test(size=(120, 30)) as pilot:
+        await wait_for_crontab_load(pilot)
+        table = pilot.app.query_one(CronTable)
+
+        assert table.row_count == 2000
+        assert 0 < compute.call_count < 50
+        assert len(table._schedule_columns._cache) == compute.call_count
+
+
+@pytest.mark.asyncio
+async def test_row_actions_resolve_jobs_through_index(mocker: MockerFixture):
+    wrapped = make_job(
+        mocker,
+        "job-1",
+        "/bin/bash /tmp/cron-wrapper.sh job-1 cronboard1:ZWNobyBoZWxsbw==",
+    )
+    plain = make_job(mocker, "job-2", "ls -la")
+    cron = make_cron(mocker, wrapped, plain)
+    mocker.patch(f"{_CRON_TABLE}.CronTab", return_value=cron)
+
+    async with CronTableHarnessApp().run_test() as pilot:
+        await wait_for_crontab_load(pilot)
+        table = pilot.app.query_one(CronTable)
+        cron.__iter__.reset_mock()
+
+        assert table.find_if_cronjob_exists("job-1", "echo hello") is wrapped
+        assert table.find_if_cronjob_exists("job-2", "ls -la") is plain
+        assert table.find_if_cronjob_exists("job-2", "echo hello") is None
+        cron.__iter__.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_edit_passes_stored_wrapped_command(mocker: MockerFixture):
+    wrapped_cmd = "/usr/bin/bash /tmp/cron-wrapper.sh job-1 cronboard1:ZWNobyBoZWxsbw=="
+    mocker.patch(
+        f"{_CRON_TABLE}.CronTab",
+        return_value=make_cron(mocker, make_job(mocker, "job-1", wrapped_cmd)),
+    )
+
+    async with CronTableHarnessApp().run_test() as pilot:
+        await wait_for_crontab_load(pilot)
+        table = pilot.app.query_one(CronTable)
+        edit = mocker.patch.object(table, "action_edit_cronjob_keybind")
+
+        table.action_edit_cronjob()
+
+        edit.assert_called_once_with("job-1", "* * * * *", wrapped_cmd)
+
+
+@pytest.mark.asyncio
+async def test_row_actions_work_while_search_highlights_cells(mocker: MockerFixture):
+    job = make_job(mocker, "job-1", "echo job")
+    mocker.patch(f"{_CRON_TABLE}.CronTab", return_value=make_cron(mocker, job))
+
+    async with CronTableHarnessApp().run_test() as pilot:
+        await wait_for_crontab_load(pilot)
+        table = pilot.app.query_one(CronTable)
+        table.apply_search("job", notify=False)
+        assert not isinstance(table.get_row_at(0)[0], str)
+        edit = mocker.patch.object(table, "action_edit_cronjob_keybind")
+        delete = mocker.patch.object(table, "action_delete_cronjob_keybind")
+
+        await table.action_pause_cronjob()
+        table.apply_search("job", notify=False)
+        table.action_edit_cronjob()
+        table.action_delete_cronjob()
+
+        job.enable.assert_called_once_with(False)
+        edit.assert_called_once_with("job-1", "* * * * *", "echo job")
+        delete.assert_called_once_with(job)
+
+
+@pytest.mark.asyncio
+async def test_log_actions_pass_plain_identifier_during_search(mocker: MockerFixture):
+    mocker.patch(
+        f"{_CRON_TABLE}.CronTab",
+        return_value=make_cron(mocker, make_job(mocker, "job-1")),
+    )
+    log_view = mocker.patch(f"{_CRON_TABLE}.LogViewModal")
+    retention = mocker.patch(f"{_CRON_TABLE}.CronLogRetention")
+
+    async with CronTableHarnessApp().run_test() as pilot:
+        await wait_for_crontab_load(pilot)
+        table = pilot.app.query_one(CronTable)
+        mocker.patch.object(pilot.app, "push_screen")
+        table.apply_search("job", notify=False)
+
+        table.action_view_logs()
+        table.action_log_retention()
+
+        assert log_view.call_args.kwargs["identificator"] == "job-1"
+        assert type(log_view.call_args.kwargs["identificator"]) is str
+        assert type(retention.call_args.kwargs["identificator"]) is str
+
+
+@pytest.mark.asyncio
+async def test_search_touches_only_highlighted_cells(mocker: MockerFixture):
+    mocker.patch(f"{_CRON_TABLE}.CronTab", return_value=make_cron(mocker))
+
+    async with CronTableHarnessApp().run_test() as pilot:
+        await wait_for_crontab_load(pilot)
+        table = pilot.app.query_one(CronTable)
+        table.load_crontabs([make_row(f"job-{i}") for i in range(20)] + [make_row("x")])
+
+        update_cell = mocker.spy(table, "update_cell")
+        table.apply_search("job-1", notify=False)
+
+        assert table._search_matches == [1] + list(range(10, 20))
+        assert update_cell.call_count == 11
+        assert len(table._highlighted_cells) == 11
+
+        update_cell.reset_mock()
+        table.apply_search("job-12", notify=False)
+
+        # ten cells restored, one re-highlighted
+        assert update_cell.call_count == 11
+        assert table._highlighted_cells == {(table._row_keys[12], 0)}
+
+        update_cell.reset_mock()
+        table.action_clear_search()
+
+        assert update_cell.call_count == 1
+        assert table.get_row_at(12)[0] == "job-12"
+        assert table._highlighted_cells == set()
+
+
+class RemoteCronTableHarnessApp(App):
+    def __init__(self, ssh_client):
+        super().__init__()
+        self.ssh_client = ssh_client
+
+    def compose(self) -> ComposeResult:
+        yield CronTable(
+            remote=True, ssh_client=self.ssh_client, crontab_user="root", id="table"
+        )
+
+
+def patch_probe(mocker: MockerFixture, crontab: str):
+    probe = mocker.Mock(crontab=crontab, crontab_status=0)
+    return mocker.patch(f"{_CRON_TABLE}.probe_host", return_value=probe)
+
+
+@pytest.mark.asyncio
+async def test_successful_remote_write_is_not_fetched_again(mocker: MockerFixture):
+    probe = patch_probe(mocker, "* * * * * echo a # job-a\n")
+    write = mocker.patch(
+        "cronboard.services.remote.write_stdin_sync",
+        return_value=RemoteResult(0, "", ""),
+    )
+    ssh = mocker.Mock()
+
+    async with RemoteCronTableHarnessApp(ssh).run_test() as pilot:
+        await wait_for_crontab_load(pilot)
+        table = pilot.app.query_one(CronTable)
+        table.ssh_cron.new(command="echo b", comment="job-b").setall("0 1 * * *")
+
+        assert await table.write_remote_crontab()
+        table.reload_after_write()
+        await wait_for_crontab_load(pilot)
+
+        assert probe.call_count == 1
+        assert write.call_args.args[2] == table.ssh_cron.render()
+        assert [row[0] for row in table._rows_data] == ["job-a", "job-b"]
+
+
+@pytest.mark.asyncio
+async def test_failed_remote_write_falls_back_to_fetch(mocker: MockerFixture):
+    probe = patch_probe(mocker, "* * * * * echo a # job-a\n")
+    mocker.patch(
+        "cronboard.services.remote.write_stdin_sync",
+        return_value=RemoteResult(1, "", "crontab: bad minute"),
+    )
+
+    async with RemoteCronTableHarnessApp(mocker.Mock()).run_test() as pilot:
+        await wait_for_crontab_load(pilot)
+        table = pilot.app.query_one(CronTable)
+        table.ssh_cron.new(command="echo b", comment="job-b").setall("0 1 * * *")
+
+        assert not await table.write_remote_crontab()
+        table.reload_after_write()
+        await wait_for_crontab_load(pilot)
+
+        assert probe.call_count == 2
+        assert [row[0] for row in table._rows_data] == ["job-a"]
+
+
+@pytest.mark.asyncio
+async def test_verify_reloads_only_when_remote_hash_differs(mocker: MockerFixture):
+    content = "* * * * * echo a # job-a\n"
+    probe = patch_probe(mocker, content)
+    remote_hash = mocker.patch(
+        f"{_CRON_TABLE}.fetch_remote_hash", return_value=content_hash(content)
+    )
+
+    async with RemoteCronTableHarnessApp(mocker.Mock()).run_test() as pilot:
+        await wait_for_crontab_load(pilot)
+        table = pilot.app.query_one(CronTable)
+
+        await table.action_verify_remote(quiet=True)
+        await wait_for_crontab_load(pilot)
+        assert probe.call_count == 1
+
+        remote_hash.return_value = content_hash("0 0 * * * echo changed\n")
+        await table.action_verify_remote(quiet=True)
+        await wait_for_crontab_load(pilot)
+        assert probe.call_count == 2
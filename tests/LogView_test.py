@@ -1,13 +1,21 @@
+from datetime import datetime
+
 import pytest
 from pytest_mock import MockerFixture
 from textual.app import App, ComposeResult
 
+from cronboard.services.logging.logger import LogEntry
+from cronboard.services.logging.log_sources import ListLogSource, LogSource
 from cronboard.widgets.LogView import LogView, VirtualLogFileList, VirtualLogLines
 
 
 _LOG_VIEW = "cronboard.widgets.LogView"
 
 
+def log_entries(paths: dict[str, str]) -> dict[str, LogEntry]:
+    return {key: LogEntry(path, 2048, 1760781600.0) for key, path in paths.items()}
+
+
 class LogViewHarnessApp(App):
     tab_disabled = False
 
@@ -21,24 +29,26 @@ class LogViewHarnessApp(App):
 @pytest.fixture
 def log_paths_two(mocker: MockerFixture):
     return mocker.patch(
-        f"{_LOG_VIEW}.get_log_files",
-        return_value={
-            "log_a": "/logs/a.log",
-            "log_b": "/logs/b.log",
-        },
+        f"{_LOG_VIEW}.get_log_entries",
+        return_value=log_entries(
+            {
+                "log_a": "/logs/a.log",
+                "log_b": "/logs/b.log",
+            }
+        ),
     )
 
 
 @pytest.fixture
 def read_log_mock(mocker: MockerFixture):
     return mocker.patch(
-        f"{_LOG_VIEW}.read_log_file",
-        side_effect=lambda path, _ssh: [f"CONTENT:{path}\n"],
+        f"{_LOG_VIEW}.open_log_source",
+        side_effect=lambda path, _ssh: ListLogSource([f"CONTENT:{path}\n"]),
     )
 
 
 def test_check_action_disables_cursor_bindings_when_no_logs(mocker: MockerFixture):
-    mocker.patch(f"{_LOG_VIEW}.get_log_files", return_value={})
+    mocker.patch(f"{_LOG_VIEW}.get_log_entries", return_value={})
     view = LogView(identificator="job")
 
     assert view.check_action("cursor_down", ()) is False
@@ -47,17 +57,50 @@ def test_check_action_disables_cursor_bindings_when_no_logs(mocker: MockerFixtur
     assert view.check_action("cursor_right", ()) is False
 
 
-def test_check_action_enables_cursor_bindings_when_logs_exist(mocker: MockerFixture):
+@pytest.mark.asyncio
+async def test_check_action_enables_cursor_bindings_once_logs_are_listed(
+    mocker: MockerFixture, read_log_mock
+):
     mocker.patch(
-        f"{_LOG_VIEW}.get_log_files",
-        return_value={"one": "/logs/one.log"},
+        f"{_LOG_VIEW}.get_log_entries",
+        return_value=log_entries({"one": "/logs/one.log"}),
     )
-    view = LogView(identificator="job")
+    async with LogViewHarnessApp().run_test(size=(100, 40)) as pilot:
+        await pilot.app.workers.wait_for_complete()
+        await pilot.pause()
+        view = pilot.app.query_one(LogView)
 
-    assert view.check_action("cursor_down", ()) is True
-    assert view.check_action("cursor_up", ()) is True
-    assert view.check_action("cursor_left", ()) is True
-    assert view.check_action("cursor_right", ()) is True
+        assert view.check_action("cursor_down", ()) is True
+        assert view.check_action("cursor_up", ()) is True
+        assert view.check_action("cursor_left", ()) is True
+        assert view.check_action("cursor_right", ()) is True
+        assert read_log_mock.call_args.args[0] == "/logs/one.log"
+
+
+@pytest.mark.asyncio
+async def test_logs_are_listed_off_the_event_loop(mocker: MockerFixture, read_log_mock):
+    ssh = mocker.Mock()
+    get_log_entries = mocker.patch(
+        f"{_LOG_VIEW}.get_log_entries",
+        return_value=log_entries({"one": "/logs/one.log"}),
+    )
+
+    async def inline_call(_ssh, fn, *args):
+        return fn(*args)
+
+    call = mocker.patch(f"{_LOG_VIEW}.remote.call", side_effect=inline_call)
+
+    class RemoteHarnessApp(LogViewHarnessApp):
+        def compose(self) -> ComposeResult:
+            yield LogView(identificator="test-job", ssh_client=ssh)
+
+    async with RemoteHarnessApp().run_test(size=(100, 40)) as pilot:
+        await pilot.app.workers.wait_for_complete()
+        await pilot.pause()
+
+        assert pilot.app.query_one(LogView).log_list.logs == ["one"]
+
+    call.assert_any_await(ssh, get_log_entries, "test-job", ssh)
 
 
 @pytest.mark.asyncio
@@ -85,8 +128,8 @@ async def test_rapid_cursor_keys_debounce_log_reads(
     read_log_mock,
 ):
     mocker.patch(
-        f"{_LOG_VIEW}.get_log_files",
-        return_value={f"log{i}": f"/logs/{i}.log" for i in range(5)},
+        f"{_LOG_VIEW}.get_log_entries",
+        return_value=log_entries({f"log{i}": f"/logs/{i}.log" for i in range(5)}),
     )
     async with LogViewHarnessApp().run_test(size=(100, 40)) as pilot:
         await pilot.pause()
@@ -180,3 +223,198 @@ async def test_h_focuses_list_from_log_pane(
         await pilot.pause()
 
         assert pilot.app.focused is pilot.app.query_one(VirtualLogFileList)
+
+
+class GrowingLogSource(LogSource):
+    """A log of ``total`` lines that only hands them out as they are read."""
+
+    def __init__(self, total: int) -> None:
+        super().__init__()
+        self.total = total
+        self.requests: list[int] = []
+
+    def read_more(self, upto: int) -> int:
+        self.requests.append(upto)
+        self._lines = [f"line {i}" for i in range(min(upto, self.total))]
+        self.complete = len(self._lines) == self.total
+        return len(self._lines)
+
+
+class LogLinesHarnessApp(App):
+    def compose(self) -> ComposeResult:
+        yield VirtualLogLines()
+
+
+@pytest.mark.asyncio
+async def test_log_lines_read_only_the_window_plus_read_ahead(mocker: MockerFixture):
+    mocker.patch(f"{_LOG_VIEW}.LOG_READ_AHEAD_LINES", 50)
+    source = GrowingLogSource(total=10_000)
+
+    async with LogLinesHarnessApp().run_test(size=(80, 20)) as pilot:
+        lines = pilot.app.query_one(VirtualLogLines)
+        lines.set_source(source)
+        await pilot.pause()
+
+        assert len(source) == 70
+        assert lines.virtual_size.height == 70
+
+        lines.scroll_end(animate=False, immediate=True)
+        await pilot.pause()
+
+        # One more window's worth, not the whole file.
+        assert 70 < len(source) < 200
+        assert not source.complete
+
+
+@pytest.mark.asyncio
+async def test_remote_log_is_opened_through_the_ssh_client(
+    mocker: MockerFixture, log_paths_two
+):
+    ssh = mocker.Mock()
+    open_source = mocker.patch(
+        f"{_LOG_VIEW}.open_log_source", return_value=ListLogSource(["remote line"])
+    )
+
+    class RemoteHarnessApp(LogViewHarnessApp):
+        def compose(self) -> ComposeResult:
+            yield LogView(identificator="test-job", ssh_client=ssh)
+
+    async with RemoteHarnessApp().run_test(size=(100, 40)) as pilot:
+        await pilot.pause()
+
+    open_source.assert_called_with("/logs/a.log", ssh)
+
+
+@pytest.mark.asyncio
+async def test_remote_log_that_fails_to_open_shows_a_placeholder(
+    mocker: MockerFixture, log_paths_two
+):
+    ssh = mocker.Mock()
+    mocker.patch(
+        f"{_LOG_VIEW}.open_log_source", side_effect=EOFError("session dropped")
+    )
+    notify = mocker.patch.object(LogView, "notify")
+    placeholder = mocker.spy(VirtualLogLines, "set_placeholder")
+
+    class RemoteHarnessApp(LogViewHarnessApp):
+        def compose(self) -> ComposeResult:
+            yield LogView(identificator="test-job", ssh_client=ssh)
+
+    async with RemoteHarnessApp().run_test(size=(100, 40)) as pilot:
+        await pilot.pause()
+
+    assert "session dropped" in notify.call_args.args[0]
+    assert placeholder.call_args.args[1] == "No logs found"
+
+
+class WindowedLogSource(GrowingLogSource):
+    """Keeps only the last ``window`` lines it read, like a remote log does."""
+
+    def __init__(self, total: int, window: int) -> None:
+        super().__init__(total)
+        self.window = window
+        self.start = 0
+        self.loads: list[tuple[int, int]] = []
+
+    def __len__(self) -> int:
+        return self.start + len(self._lines)
+
+    def line(self, index: int) -> str:
+        return (
+            self._lines[index - self.start] if self.has_lines(index, index + 1) else ""
+        )
+
+    def read_more(self, upto: int) -> int:
+        end = min(upto, self.total)
+        self.start = max(end - self.window, 0)
+        self._lines = [f"line {i}" for i in range(self.start, end)]
+        self.complete = end == self.total
+        return end
+
+    def has_lines(self, start: int, end: int) -> bool:
+        return start >= min(end, len(self)) or (
+            self.start <= start and end <= len(self)
+        )
+
+    def load(self, start: int, end: int) -> None:
+        self.loads.append((start, end))
+        self.start = max(start, 0)
+        self._lines = [f"line {i}" for i in range(self.start, min(end, len(self)))]
+
+
+@pytest.mark.asyncio
+async def test_log_lines_read_again_when_scrolled_back_out_of_the_window(
+    mocker: MockerFixture,
+):
+    mocker.patch(f"{_LOG_VIEW}.LOG_READ_AHEAD_LINES", 50)
+    source = WindowedLogSource(total=10_000, window=100)
+
+    async with LogLinesHarnessApp().run_test(size=(80, 20)) as pilot:
+        lines = pilot.app.query_one(VirtualLogLines)
+        lines.set_source(source)
+        await pilot.pause()
+        lines.scroll_to(y=500, animate=False, immediate=True)
+        await pilot.app.workers.wait_for_complete()
+        await pilot.pause()
+        assert not source.has_lines(0, 20)
+
+        lines.scroll_home(animate=False, immediate=True)
+        await pilot.app.workers.wait_for_complete()
+        await pilot.pause()
+
+        assert source.loads[-1] == (-50, 70)
+        assert source.line(0) == "line 0"
+
+
+class AppendingLogSource(ListLogSource):
+    """A finished log that gains a line every time it is followed."""
+
+    def follow(self) -> bool:
+        self._lines.append(f"appended {len(self._lines)}")
+        return True
+
+
+@pytest.mark.asyncio
+async def test_follow_appends_new_lines_and_keeps_the_bottom_in_view(
+    mocker: MockerFixture, log_paths_two
+):
+    mocker.patch(f"{_LOG_VIEW}._LOG_FOLLOW_INTERVAL_SEC", 0.05)
+    source = AppendingLogSource([f"line {i}" for i in range(100)])
+    mocker.patch(f"{_LOG_VIEW}.open_log_source", return_value=source)
+
+    async with LogViewHarnessApp().run_test(size=(100, 40)) as pilot:
+        await pilot.pause()
+        lines = pilot.app.query_one(VirtualLogLines)
+        assert lines.scroll_offset.y == 0
+
+        await pilot.press("f")
+        await pilot.pause(0.3)
+        assert lines.following
+
+        # Compare sizes once following stopped, so no line lands in between.
+        await pilot.press("f")
+        await pilot.pause()
+        followed = len(source)
+        await pilot.pause(0.2)
+
+        assert not lines.following
+        assert len(source) == followed > 100
+        assert lines.virtual_size.height == len(source)
+        assert lines.is_vertical_scroll_end
+
+
+def test_log_file_list_shows_size_and_modification_time():
+    entries = {
+        "job_1": LogEntry("/logs/job_1.log", 512, 1760781600.0),
+        "job_10": LogEntry("/logs/job_10.log", 3 * 1024 * 1024, 1760781600.0),
+    }
+    file_list = VirtualLogFileList(
+        list(entries), {k: e.path for k, e in entries.items()}, entries
+    )
+
+    first, second = file_list._labels
+    assert first.startswith("job_1    ") and "  512B  " in first
+    assert second.startswith("job_10  ") and "  3.0M  " in second
+    assert first.endswith(
+        datetime.fromtimestamp(1760781600.0).strftime("%Y-%m-%d %H:%M")
+    )
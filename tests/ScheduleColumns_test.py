@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from cronboard.widgets.ScheduleColumns import (
+    ScheduleCell,
+    compute_run_info,
+    schedule_cells,
+)
+
+
+def test_compute_run_info_active_job():
+    info = compute_run_info("0 12 * * *", True, datetime(2030, 1, 1, 8, 0))
+
+    assert info.last_run == "31.12.2029 at 12:00"
+    assert info.next_run == "01.01.2030 at 12:00"
+    assert info.status == "Active"
+    assert info.next_fire == datetime(2030, 1, 1, 12, 0)
+
+
+def test_compute_run_info_paused_job_has_no_fire_time():
+    info = compute_run_info("0 12 * * *", False, datetime(2030, 1, 1, 8, 0))
+
+    assert info.next_run == "Paused"
+    assert info.status == "Paused"
+    assert info.next_fire is None
+
+
+def test_compute_run_info_invalid_expression():
+    info = compute_run_info("not a schedule", True, datetime(2030, 1, 1))
+
+    assert info.status == "Inactive"
+    assert info.last_run.startswith("ERR: ")
+    assert info.next_fire is None
+
+
+def test_unbound_cells_compute_on_access():
+    last, next_run, status = schedule_cells("* * * * *", False)
+
+    assert str(next_run) == "Paused"
+    assert status.text().plain == "Paused"
+    assert last == ScheduleCell("* * * * *", False, "last")
+    assert last != next_run
@@ -0,0 +1,55 @@
+import pytest
+from pytest_mock import MockerFixture
+from textual.app import App, ComposeResult
+
+from cronboard.services.system_crontabs import (
+    SystemCrontabs,
+    parse_crontab,
+    source_for_path,
+)
+from cronboard.widgets.SystemCronTable import SystemCronTable
+
+from .conftest import wait_for_crontab_load
+
+_SYSTEM_TABLE = "cronboard.widgets.SystemCronTable"
+
+
+class SystemTableHarnessApp(App):
+    def compose(self) -> ComposeResult:
+        yield SystemCronTable(id="table")
+
+
+def make_crontabs() -> SystemCrontabs:
+    system = source_for_path("/etc/cron.d/php")
+    user = source_for_path("/var/spool/cron/crontabs/alice")
+    return SystemCrontabs(
+        [
+            (system, parse_crontab(system, "0 * * * * www-data php cron.php\n")),
+            (user, parse_crontab(user, "0 1 * * * echo nightly # nightly\n")),
+        ],
+        [("/var/spool/cron/crontabs/root", "Permission denied")],
+    )
+
+
+def test_build_system_rows_adds_source_column():
+    rows = SystemCronTable.build_system_rows(make_crontabs())
+
+    assert [row[2] for row in rows] == ["php cron.php", "echo nightly"]
+    assert [row[-1] for row in rows] == ["cron.d/php (www-data)", "user:alice"]
+
+
+@pytest.mark.asyncio
+async def test_loads_merged_sources_read_only(mocker: MockerFixture):
+    mocker.patch(f"{_SYSTEM_TABLE}.read_local_crontabs", return_value=make_crontabs())
+    notify = mocker.patch.object(SystemCronTable, "notify")
+
+    async with SystemTableHarnessApp().run_test() as pilot:
+        await wait_for_crontab_load(pilot)
+        table = pilot.app.query_one(SystemCronTable)
+
+        assert table.row_count == 2
+        assert str(table.columns[table._column_keys[-1]].label) == "Source"
+        assert "/var/spool/cron/crontabs/root" in notify.call_args.args[0]
+        for action in ("edit_cronjob", "delete_cronjob", "pause_cronjob"):
+            assert table.check_action(action, ()) is False
+        assert table.check_action("cron_search", ()) is True
@@ -1,6 +1,8 @@
 import pytest
 from cronboard.app import CronBoard
+from cronboard.screens.CronSystemView import CronSystemView
 from cronboard.services.messages import CronJobDeleted
+from cronboard.services.system_crontabs import SystemCrontabs
 from pytest_mock import MockerFixture
 from textual.widgets import Tree
 
@@ -49,3 +51,22 @@ async def test_app_deletes_logs_on_cron_job_deleted_message(
         await pilot.pause()
 
     mock_delete.assert_called_once_with("job-x", None)
+
+
+@pytest.mark.asyncio
+async def test_system_crontabs_open_and_close(mocker: MockerFixture, app: CronBoard):
+    mocker.patch(
+        "cronboard.widgets.SystemCronTable.read_local_crontabs",
+        return_value=SystemCrontabs([], []),
+    )
+
+    async with app.run_test() as pilot:
+        await pilot.press("S")
+        await pilot.pause()
+        assert isinstance(app.screen, CronSystemView)
+        assert app.tab_disabled is True
+
+        await pilot.click("#close")
+        await pilot.pause()
+        assert not isinstance(app.screen, CronSystemView)
+        assert app.tab_disabled is False
@@ -0,0 +1,53 @@
+import pytest
+from crontab import CronTab
+from pytest_mock import MockerFixture
+
+from cronboard.services import bulk_apply
+from cronboard.services.bulk_apply import ADDED, UPDATED, JobDefinition, apply_job
+from cronboard.services.remote import RemoteResult
+
+BACKUP = JobDefinition("backup", "0 3 * * *", "/usr/bin/backup", False)
+
+
+def patch_host(mocker: MockerFixture, crontab: str, result=RemoteResult(0, "", "")):
+    mocker.patch.object(bulk_apply, "read_crontab", return_value=CronTab(tab=crontab))
+    return mocker.patch.object(bulk_apply, "write_stdin_sync", return_value=result)
+
+
+def test_apply_job_adds_missing_job(mocker: MockerFixture):
+    write = patch_host(mocker, "* * * * * ls # other\n")
+
+    assert apply_job(mocker.Mock(), "root", BACKUP, timeout=5) == ADDED
+
+    command, content, timeout = write.call_args.args[1:]
+    assert timeout == 5
+    assert command == "crontab -u root -"
+    assert "* * * * * ls # other" in content
+    assert "0 3 * * * /usr/bin/backup # backup" in content
+
+
+def test_apply_job_updates_job_with_same_id(mocker: MockerFixture):
+    write = patch_host(mocker, "5 * * * * /old/backup # backup\n")
+
+    assert apply_job(mocker.Mock(), None, BACKUP) == UPDATED
+
+    content = write.call_args.args[2]
+    assert content.strip() == "0 3 * * * /usr/bin/backup # backup"
+
+
+def test_apply_job_wraps_command_on_the_host(mocker: MockerFixture):
+    write = patch_host(mocker, "")
+    wrap = mocker.patch.object(bulk_apply, "wrap_command", return_value="wrapped")
+    ssh = mocker.Mock()
+
+    apply_job(ssh, None, BACKUP._replace(log_enabled=True))
+
+    wrap.assert_called_once_with("/usr/bin/backup", "backup", ssh)
+    assert "0 3 * * * wrapped # backup" in write.call_args.args[2]
+
+
+def test_apply_job_raises_when_write_fails(mocker: MockerFixture):
+    patch_host(mocker, "", RemoteResult(1, "", "crontab: bad minute"))
+
+    with pytest.raises(RuntimeError, match="bad minute"):
+        apply_job(mocker.Mock(), None, BACKUP)
@@ -24,6 +24,8 @@ def app(mocker: MockerFixture):
     fake_job.comment = "test-job"
     fake_job.command = "echo hello"
     fake_job.render.return_value = "* * * * * echo hello"
+    fake_job.slices.render.return_value = "* * * * *"
+    fake_job.slices.clean_render.return_value = "* * * * *"
 
     fake_cron = mocker.MagicMock()
     fake_cron.__iter__ = mocker.MagicMock(side_effect=lambda: iter([fake_job]))
@@ -39,9 +41,16 @@ def autocomplete():
     yield CronAutoComplete.__new__(CronAutoComplete)
 
 
+async def wait_for_crontab_load(pilot: Pilot) -> None:
+    """Let background crontab loads finish and their results reach the table."""
+    await pilot.app.workers.wait_for_complete()
+    await pilot.pause()
+
+
 @pytest_asyncio.fixture
 async def pilot(app: CronBoard) -> AsyncIterator[Pilot]:
     async with app.run_test() as pilot_impl:
+        await wait_for_crontab_load(pilot_impl)
         yield pilot_impl
 
 
@@ -171,7 +180,7 @@ def ssh_mock_install_remote_put_fail_exec(mocker: MockerFixture):
 
     def exec_command(cmd):
         stdout, stderr = mock_ssh_exec_streams(mocker, stderr=b"")
-        if cmd == "echo $HOME":
+        if cmd == "echo ~":
             stdout.read.return_value = b"/remote/home/user\n"
         elif "test -f" in cmd:
             stdout.read.return_value = b"MISSING\n"
@@ -208,3 +217,27 @@ def mock_wrapper_installed(mocker: MockerFixture):
     return mocker.patch.object(
         mod, "install_wrapper", return_value="/tmp/cron-wrapper.sh"
     )
+
+
+class FakeClock:
+    """A ``time.monotonic`` stand-in that only moves when ``now`` is set."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_server(host: str, **extra) -> dict:
+    """A saved server entry for ``host``, as loaded from servers.toml."""
+    return {
+        "name": host,
+        "host": host,
+        "port": 22,
+        "username": "deploy",
+        "password": None,
+        "ssh_key": True,
+        "crontab_user": None,
+        **extra,
+    }
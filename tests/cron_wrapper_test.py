@@ -1,6 +1,7 @@
 import base64
 import shlex
 import stat
+import subprocess
 from pathlib import Path
 
 import paramiko
@@ -10,6 +11,7 @@ import cronboard.services.logging.cron_wrapper as mod
 
 from .conftest import (
     home_dir_under_tmp,
+    mock_ssh_exec_streams,
     patch_config_dir,
     ssh_mock_exec_raises,
     ssh_mock_exec_return,
@@ -172,6 +174,97 @@ def test_install_wrapper_remote_executes_expected_commands_and_returns_remote_pa
     sftp.close.assert_called_once_with()
 
 
+def make_wrapper_source(mocker: MockerFixture, tmp_path, content=b"#!/bin/sh\n"):
+    wrapper_source = tmp_path / "cron-wrapper.sh"
+    wrapper_source.write_bytes(content)
+    mocker.patch.object(mod, "WRAPPER_SOURCE", wrapper_source)
+    return wrapper_source
+
+
+def test_install_wrapper_local_skips_identical_copy(mocker: MockerFixture, tmp_path):
+    patch_config_dir(mocker, home_dir_under_tmp(tmp_path))
+    make_wrapper_source(mocker, tmp_path)
+    mod.install_wrapper_local()
+    write = mocker.spy(Path, "chmod")
+
+    mod.install_wrapper_local()
+
+    write.assert_not_called()
+    assert mod.wrapper_status() == mod.WRAPPER_CURRENT
+
+
+def test_install_wrapper_local_replaces_stale_copy(mocker: MockerFixture, tmp_path):
+    patch_config_dir(mocker, home_dir_under_tmp(tmp_path))
+    make_wrapper_source(mocker, tmp_path, b"#!/bin/sh\necho old\n")
+    installed = Path(mod.install_wrapper_local())
+    new_source = make_wrapper_source(mocker, tmp_path, b"#!/bin/sh\necho new\n")
+
+    assert mod.wrapper_status() == mod.WRAPPER_STALE
+    mod.install_wrapper_local()
+
+    assert installed.read_bytes() == new_source.read_bytes()
+    assert mod.wrapper_status() == mod.WRAPPER_CURRENT
+
+
+def test_wrapper_status_missing_locally(mocker: MockerFixture, tmp_path):
+    patch_config_dir(mocker, home_dir_under_tmp(tmp_path))
+
+    assert mod.wrapper_status() == mod.WRAPPER_MISSING
+
+
+def test_install_wrapper_remote_skips_upload_when_checksum_matches(
+    mocker: MockerFixture, tmp_path
+):
+    make_wrapper_source(mocker, tmp_path)
+    ssh = mocker.Mock()
+
+    def exec_command(cmd):
+        stdout, stderr = mock_ssh_exec_streams(mocker)
+        if cmd == "echo ~":
+            stdout.read.return_value = b"/home/u\n"
+        elif "sha256sum" in cmd:
+            stdout.read.return_value = f"{mod.wrapper_checksum()}\n".encode()
+        return (None, stdout, stderr)
+
+    ssh.exec_command.side_effect = exec_command
+
+    assert mod.wrapper_status(ssh) == mod.WRAPPER_CURRENT
+    assert (
+        mod.install_wrapper_remote(ssh) == "/home/u/.config/cronboard/cron-wrapper.sh"
+    )
+    assert (
+        mod.install_wrapper_remote(ssh) == "/home/u/.config/cronboard/cron-wrapper.sh"
+    )
+
+    ssh.open_sftp.assert_not_called()
+    assert ssh.exec_command.call_count == 2
+
+
+def test_install_wrapper_remote_records_uploaded_checksum(
+    mocker: MockerFixture, tmp_path
+):
+    make_wrapper_source(mocker, tmp_path)
+    ssh = ssh_mock_exec_return(mocker, stdout=b"/home/u\n")
+
+    mod.install_wrapper_remote(ssh)
+    ssh.open_sftp.assert_called_once()
+    ssh.exec_command.reset_mock()
+
+    assert mod.wrapper_status(ssh) == mod.WRAPPER_CURRENT
+    ssh.exec_command.assert_not_called()
+
+
+def test_remote_checksum_command_reports_executable_files_only(tmp_path):
+    script = tmp_path / "wrapper.sh"
+    script.write_text("#!/bin/sh\n")
+    command = mod.remote_checksum_command(str(script))
+
+    assert subprocess.run(["sh", "-c", command], capture_output=True).stdout == b""
+    script.chmod(0o755)
+    output = subprocess.run(["sh", "-c", command], capture_output=True, text=True)
+    assert output.stdout.strip() == mod.file_checksum(script)
+
+
 def test_install_wrapper_remote_closes_sftp_even_if_put_raises(mocker: MockerFixture):
     ssh = ssh_mock_install_remote_put_fail_exec(mocker)
 
@@ -334,3 +427,55 @@ def test_command_without_wrapper_extra_spaces(mock_bash):
 
     assert res == "echo hello"
 
+
+def test_render_wrapped_command_does_not_touch_host(mocker: MockerFixture):
+    install = mocker.patch.object(mod, "install_wrapper")
+    which = mocker.patch.object(mod.shutil, "which")
+
+    res = mod.render_wrapped_command(
+        "echo hello", "job-1", "/home/u/.config/cronboard/cron-wrapper.sh", "/bin/bash"
+    )
+
+    assert res == (
+        "/bin/bash /home/u/.config/cronboard/cron-wrapper.sh job-1 "
+        "cronboard1:ZWNobyBoZWxsbw=="
+    )
+    install.assert_not_called()
+    which.assert_not_called()
+
+
+def test_render_wrapped_command_keeps_already_wrapped_command():
+    cmd = "/bin/bash /tmp/cron-wrapper.sh job-1 cronboard1:ZWNobyBoZWxsbw=="
+
+    assert mod.render_wrapped_command(cmd, "job-1", "/tmp/x.sh", "/bin/bash") == cmd
+
+
+def test_wrap_command_remote_renders_with_host_facts(mocker: MockerFixture):
+    ssh = mocker.Mock()
+    mocker.patch.object(
+        mod, "install_wrapper", return_value="/r/.config/cronboard/cron-wrapper.sh"
+    )
+    mocker.patch.object(mod, "get_remote_bash_path", return_value="/usr/bin/bash")
+
+    res = mod.wrap_command("echo hello", "job-1", ssh)
+
+    assert res == (
+        "/usr/bin/bash /r/.config/cronboard/cron-wrapper.sh job-1 "
+        "cronboard1:ZWNobyBoZWxsbw=="
+    )
+    mod.install_wrapper.assert_called_once_with(ssh)
+
+
+def test_unwrap_command_matches_separate_helpers():
+    for cmd in (
+        "echo hello",
+        "/bin/bash /tmp/cron-wrapper.sh job-1 cronboard1:ZWNobyBoZWxsbw==",
+        "/bin/bash /tmp/cron-wrapper.sh job-1 echo hello world",
+        "/bin/bash /tmp/not-wrapper.sh job-1 echo hello",
+        "/bin/bash /tmp/cron-wrapper.sh '' echo hello",
+        "/bin/bash /tmp/cron-wrapper.sh job-1 'unterminated",
+    ):
+        assert mod.unwrap_command(cmd) == (
+            mod.command_without_wrapper(cmd),
+            mod.has_wrapper(cmd),
+        )
@@ -0,0 +1,43 @@
+from pytest_mock import MockerFixture
+
+from cronboard.services.crontab_sync import (
+    CrontabHashes,
+    content_hash,
+    fetch_remote_hash,
+    remote_hash_command,
+)
+
+from .conftest import ssh_mock_exec_return
+
+
+def test_content_hash_ignores_trailing_newlines():
+    assert content_hash("* * * * * ls\n") == content_hash("* * * * * ls\n\n")
+    assert content_hash("* * * * * ls\n") == content_hash("* * * * * ls")
+    assert content_hash("") == content_hash("\n")
+    assert content_hash("* * * * * ls\n") != content_hash("* * * * * ls -l\n")
+
+
+def test_remote_hash_command_quotes_crontab_user():
+    assert "crontab -l" in remote_hash_command()
+    assert "crontab -u 'o'\"'\"'neil' -l" in remote_hash_command("o'neil")
+
+
+def test_fetch_remote_hash_reads_digest(mocker: MockerFixture):
+    ssh = ssh_mock_exec_return(mocker, stdout=b"ab12\n")
+    assert fetch_remote_hash(ssh, "root") == "ab12"
+    ssh.exec_command.assert_called_once_with(remote_hash_command("root"))
+
+    assert fetch_remote_hash(ssh_mock_exec_return(mocker, stdout=b"")) is None
+
+
+def test_hashes_are_kept_per_host_and_crontab_user(mocker: MockerFixture):
+    hashes = CrontabHashes()
+    ssh, other = mocker.Mock(), mocker.Mock()
+    hashes.record(ssh, "root", "* * * * * ls\n")
+
+    assert hashes.matches(ssh, "root", "* * * * * ls")
+    assert not hashes.matches(ssh, "www", "* * * * * ls")
+    assert not hashes.matches(other, "root", "* * * * * ls")
+
+    hashes.forget(ssh, "root")
+    assert hashes.get(ssh, "root") is None
@@ -0,0 +1,92 @@
+import time
+
+import paramiko
+import pytest
+from pytest_mock import MockerFixture
+
+from cronboard.services import fleet
+from cronboard.services.fleet import fetch_fleet, fetch_server_crontab
+from cronboard.services.ssh_pool import TransportOptions
+
+from .conftest import make_server
+
+
+@pytest.mark.asyncio
+async def test_results_stream_as_hosts_answer(mocker: MockerFixture):
+    delays = {"slow": 0.3, "fast": 0.0}
+
+    def fake_fetch(_pool, server_info, _timeout):
+        time.sleep(delays[server_info["host"]])
+        return fleet.CronTab(tab="* * * * * ls\n")
+
+    mocker.patch.object(fleet, "fetch_server_crontab", side_effect=fake_fetch)
+    servers = {"deploy@slow:": make_server("slow"), "deploy@fast:": make_server("fast")}
+
+    results = [r async for r in fetch_fleet(servers, mocker.Mock(), timeout=5)]
+
+    assert [r.server_id for r in results] == ["deploy@fast:", "deploy@slow:"]
+    assert all(r.error is None for r in results)
+    assert results[0].label == "fast: deploy"
+
+
+@pytest.mark.asyncio
+async def test_failures_and_timeouts_are_reported_per_host(mocker: MockerFixture):
+    def fake_fetch(_pool, server_info, _timeout):
+        if server_info["host"] == "locked":
+            raise paramiko.AuthenticationException()
+        if server_info["host"] == "hung":
+            # What paramiko raises once the connect or a read hits the timeout.
+            raise TimeoutError("timed out")
+        return fleet.CronTab(tab="")
+
+    mocker.patch.object(fleet, "fetch_server_crontab", side_effect=fake_fetch)
+    servers = {host: make_server(host) for host in ("locked", "hung", "ok")}
+
+    results = {
+        r.server_id: r async for r in fetch_fleet(servers, mocker.Mock(), timeout=0.1)
+    }
+
+    assert results["locked"].error == "authentication failed"
+    assert results["hung"].error == "timed out after 0.1s"
+    assert results["ok"].error is None and results["ok"].value is not None
+
+
+@pytest.mark.asyncio
+async def test_hosts_queued_behind_slow_ones_still_run(mocker: MockerFixture):
+    def fake_fetch(_pool, _server_info, _timeout):
+        time.sleep(0.1)
+        return fleet.CronTab(tab="")
+
+    mocker.patch.object(fleet, "fetch_server_crontab", side_effect=fake_fetch)
+    servers = {host: make_server(host) for host in ("a", "b", "c")}
+
+    results = [
+        r
+        async for r in fetch_fleet(servers, mocker.Mock(), concurrency=1, timeout=0.15)
+    ]
+
+    assert all(r.error is None for r in results)
+    # Each host's time starts when it does, not when it was queued.
+    assert all(r.elapsed < 0.15 for r in results)
+
+
+def test_fetch_server_crontab_releases_session_on_error(mocker: MockerFixture):
+    pool = mocker.Mock()
+    mocker.patch.object(fleet, "probe_host", side_effect=OSError("reset"))
+
+    with pytest.raises(OSError):
+        fetch_server_crontab(
+            pool,
+            make_server("db", crontab_user="root", transport={"compression": True}),
+            timeout=3,
+        )
+
+    pool.acquire.assert_called_once_with(
+        "db",
+        22,
+        "deploy",
+        password=None,
+        timeout=3,
+        transport=TransportOptions(compression=True),
+    )
+    pool.release.assert_called_once_with(pool.acquire.return_value)
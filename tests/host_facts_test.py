@@ -0,0 +1,80 @@
+import gc
+
+from pytest_mock import MockerFixture
+
+import cronboard.services.logging.cron_wrapper as cron_wrapper
+from cronboard.services.host_facts import HostFactCache
+
+from .conftest import FakeClock, ssh_mock_exec_sequence
+
+
+def test_facts_expire_after_ttl(mocker: MockerFixture):
+    clock = FakeClock()
+    cache = HostFactCache(ttl=10, clock=clock)
+    ssh = mocker.Mock()
+    cache.update(ssh, home="/home/u")
+
+    clock.now = 9
+    assert cache.get(ssh, "home") == "/home/u"
+    clock.now = 10
+    assert cache.get(ssh, "home") is None
+
+
+def test_cached_fetches_once_and_retries_failures(mocker: MockerFixture):
+    cache = HostFactCache()
+    ssh = mocker.Mock()
+    fetch = mocker.Mock(side_effect=[None, "/bin/bash"])
+
+    assert cache.cached(ssh, "bash_path", fetch) is None
+    assert cache.cached(ssh, "bash_path", fetch) == "/bin/bash"
+    assert cache.cached(ssh, "bash_path", fetch) == "/bin/bash"
+    assert fetch.call_count == 2
+
+
+def test_cached_keeps_false_results(mocker: MockerFixture):
+    cache = HostFactCache()
+    ssh = mocker.Mock()
+    fetch = mocker.Mock(return_value=False)
+
+    cache.cached(ssh, "wrapper_installed", fetch)
+    assert cache.cached(ssh, "wrapper_installed", fetch) is False
+    fetch.assert_called_once()
+
+
+def test_invalidate_single_fact_or_host(mocker: MockerFixture):
+    cache = HostFactCache()
+    a, b = mocker.Mock(), mocker.Mock()
+    cache.update(a, home="/a", bash_path="/bin/bash")
+    cache.update(b, home="/b")
+
+    cache.invalidate(a, "home")
+    assert cache.get(a, "home") is None
+    assert cache.get(a, "bash_path") == "/bin/bash"
+
+    cache.invalidate(a)
+    assert cache.get(a, "bash_path") is None
+    assert cache.get(b, "home") == "/b"
+
+
+def test_facts_are_dropped_with_the_connection(mocker: MockerFixture):
+    cache = HostFactCache()
+    ssh = mocker.Mock()
+    cache.update(ssh, home="/home/u")
+
+    del ssh
+    gc.collect()
+
+    assert len(cache._facts) == 0
+
+
+def test_remote_home_is_fetched_once_per_connection(mocker: MockerFixture):
+    ssh = ssh_mock_exec_sequence(
+        mocker, [(b"/home/user\n", b""), (b"/usr/bin/bash\n", b"")]
+    )
+
+    assert cron_wrapper.get_remote_home(ssh) == "/home/user"
+    assert cron_wrapper.get_remote_home(ssh) == "/home/user"
+    assert cron_wrapper.get_remote_bash_path(ssh) == "/usr/bin/bash"
+    assert cron_wrapper.get_remote_bash_path(ssh) == "/usr/bin/bash"
+
+    assert ssh.exec_command.call_count == 2
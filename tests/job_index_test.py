@@ -0,0 +1,51 @@
+from pytest_mock import MockerFixture
+
+from cronboard.services.job_index import build_job_index, job_key
+
+_WRAPPED = "/bin/bash /tmp/cron-wrapper.sh job-1 cronboard1:ZWNobyBoZWxsbw=="
+
+
+def make_job(mocker: MockerFixture, comment: str, command: str):
+    job = mocker.MagicMock()
+    job.comment = comment
+    job.command = command
+    return job
+
+
+def test_job_key_normalizes_wrapped_command():
+    assert job_key("job-1", _WRAPPED) == job_key("job-1", "echo hello")
+
+
+def test_job_key_treats_missing_comment_as_empty():
+    assert job_key(None, "echo hello") == ("", "echo hello")
+
+
+def test_build_job_index_resolves_wrapped_and_plain_commands(mocker: MockerFixture):
+    wrapped = make_job(mocker, "job-1", _WRAPPED)
+    plain = make_job(mocker, "job-2", "ls -la")
+
+    index = build_job_index([wrapped, plain])
+
+    assert index[job_key("job-1", "echo hello")] is wrapped
+    assert index[job_key("job-1", _WRAPPED)] is wrapped
+    assert index[job_key("job-2", "ls -la")] is plain
+    assert job_key("job-2", "echo hello") not in index
+
+
+def test_build_job_index_keeps_first_duplicate(mocker: MockerFixture):
+    first = make_job(mocker, "dup", "echo hi")
+    second = make_job(mocker, "dup", "echo hi")
+
+    index = build_job_index([first, second])
+
+    assert index[job_key("dup", "echo hi")] is first
+
+
+def test_build_job_index_uses_precomputed_commands(mocker: MockerFixture):
+    job = make_job(mocker, "job-1", _WRAPPED)
+    parse = mocker.patch("cronboard.services.job_index.command_without_wrapper")
+
+    index = build_job_index([job], ["echo hello"])
+
+    parse.assert_not_called()
+    assert index[("job-1", "echo hello")] is job
@@ -0,0 +1,230 @@
+import gzip
+from types import SimpleNamespace
+
+import pytest
+from pytest_mock import MockerFixture
+
+from cronboard.services.logging.log_sources import (
+    LOG_READ_CHUNK,
+    GzipLogSource,
+    MmapLogSource,
+    RemoteLogSource,
+    open_log_source,
+)
+
+_LOG_SOURCES = "cronboard.services.logging.log_sources"
+
+
+def remote_file(mocker: MockerFixture, content: bytes | bytearray):
+    """An SSH client whose SFTP file serves ``content`` through ``readv``.
+
+    Pass a ``bytearray`` to append to the file while it is being read.
+    """
+    ssh = mocker.Mock()
+    handle = ssh.open_sftp.return_value.open.return_value
+    handle.stat.side_effect = lambda: SimpleNamespace(st_size=len(content))
+    handle.readv.side_effect = lambda chunks: [
+        content[offset : offset + length] for offset, length in chunks
+    ]
+    return ssh, handle
+
+
+def test_remote_source_reads_only_the_ranges_it_needs(mocker: MockerFixture):
+    content = b"".join(f"line {i}\n".encode() for i in range(1000))
+    ssh, handle = remote_file(mocker, content)
+    source = RemoteLogSource(ssh, "/logs/job.log", chunk_size=64)
+
+    assert source.read_more(5) >= 5
+
+    assert handle.readv.call_args_list[0].args[0] == [(0, 64)]
+    assert source.offset < len(content)
+    assert source.line(0) == "line 0"
+    assert not source.complete
+
+
+def test_remote_source_joins_lines_split_across_ranges(mocker: MockerFixture):
+    ssh, _ = remote_file(mocker, b"first line\nsecond line\nno newline")
+    source = RemoteLogSource(ssh, "/logs/job.log", chunk_size=7)
+
+    source.read_more(100)
+
+    assert source.lines(0, len(source)) == ["first line", "second line", "no newline"]
+    assert source.complete
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_ranged_sources_keep_a_bounded_window_of_lines(
+    mocker: MockerFixture, compressed: bool
+):
+    content = b"".join(f"line {i}\n".encode() for i in range(500))
+    ssh, _ = remote_file(mocker, gzip.compress(content) if compressed else content)
+    path = "/logs/job.log.gz" if compressed else "/logs/job.log"
+    source = RemoteLogSource(ssh, path, chunk_size=64, window_lines=50)
+
+    source.read_more(1000)
+
+    assert len(source) == 500
+    assert len(source._lines) == 50
+    assert source.line(499) == "line 499"
+    assert not source.has_lines(0, 10)
+    assert source.line(0) == ""
+
+    source.load(10, 20)
+
+    assert source.has_lines(10, 20)
+    assert source.lines(10, 12) == ["line 10", "line 11"]
+    assert not source.has_lines(499, 500)
+
+
+def test_remote_source_reopens_after_a_failed_read(mocker: MockerFixture):
+    ssh, handle = remote_file(mocker, b"a\nb\n")
+    readv = handle.readv.side_effect
+    handle.readv.side_effect = [EOFError("link down"), readv([(0, 4)])]
+    source = RemoteLogSource(ssh, "/logs/job.log")
+
+    with pytest.raises(EOFError):
+        source.read_more(1)
+    source.read_more(1)
+
+    assert ssh.open_sftp.call_count == 2
+    assert source.line(1) == "b"
+
+
+def test_open_log_source_returns_none_for_missing_remote_file(mocker: MockerFixture):
+    ssh = mocker.Mock()
+    ssh.open_sftp.return_value.open.side_effect = FileNotFoundError("no such file")
+
+    assert open_log_source("/logs/missing.log", ssh) is None
+
+
+def test_mmap_source_indexes_in_batches_and_decodes_on_demand(
+    mocker: MockerFixture, tmp_path
+):
+    mocker.patch(f"{_LOG_SOURCES}.LOG_INDEX_BATCH_LINES", 10)
+    log = tmp_path / "job_1.log"
+    log.write_bytes(b"".join(f"line {i}\n".encode() for i in range(25)) + b"tail")
+
+    source = open_log_source(str(log))
+
+    assert isinstance(source, MmapLogSource)
+    assert len(source) == 0
+    assert source.read_more(1) == 10
+    assert not source.complete
+    assert source.read_more(1) == 20
+    source.read_more(1)
+    assert source.complete
+    assert len(source) == 26
+    assert source.line(3) == "line 3\n"
+    assert source.line(25) == "tail"
+    assert source.max_line_length == len("line 10\n")
+    source.close()
+
+
+def test_open_log_source_skips_missing_and_empty_local_files(tmp_path):
+    empty = tmp_path / "job_1.log"
+    empty.touch()
+
+    assert open_log_source(str(empty)) is None
+    assert open_log_source(str(tmp_path / "missing.log")) is None
+
+
+def test_remote_follow_reads_only_appended_bytes(mocker: MockerFixture):
+    content = bytearray(b"one\ntw")
+    ssh, handle = remote_file(mocker, content)
+    source = RemoteLogSource(ssh, "/logs/job.log")
+    source.read_more(100)
+    assert source.lines(0, len(source)) == ["one", "tw"]
+
+    content.extend(b"o\nthree\n")
+
+    assert source.follow()
+    assert handle.readv.call_args.args[0] == [(6, 8)]
+    assert source.lines(0, len(source)) == ["one", "two", "three"]
+    assert not source.follow()
+
+
+def test_remote_follow_jumps_to_the_tail_of_a_large_backlog(mocker: MockerFixture):
+    content = b"".join(f"line {i:07}\n".encode() for i in range(200_000))
+    ssh, _ = remote_file(mocker, content)
+    source = RemoteLogSource(ssh, "/logs/job.log", chunk_size=1024)
+    source.read_more(1)
+
+    assert source.follow()
+
+    assert source.offset == len(content)
+    # The first chunk, the marker and the last LOG_READ_CHUNK bytes only.
+    assert len(source) < 2 * LOG_READ_CHUNK // len(b"line 0000000\n")
+    assert source.line(len(source) - 1) == "line 0199999"
+    source.load(0, 200)
+    assert any("bytes skipped" in line for line in source.lines(0, 200))
+    assert source.line(0) == "line 0000000"
+
+
+def test_remote_follow_starts_over_after_truncation(mocker: MockerFixture):
+    content = bytearray(b"old line\nanother\n")
+    ssh, _ = remote_file(mocker, content)
+    source = RemoteLogSource(ssh, "/logs/job.log")
+    source.read_more(100)
+
+    content[:] = b"new\n"
+
+    assert source.follow()
+    assert source.lines(0, len(source)) == ["new"]
+
+
+def test_mmap_follow_indexes_appended_lines(tmp_path):
+    log = tmp_path / "job_1.log"
+    log.write_bytes(b"one\ntw")
+    source = open_log_source(str(log))
+    source.read_more(1)
+    assert len(source) == 2
+
+    with open(log, "ab") as f:
+        f.write(b"o\nthree\n")
+
+    assert source.follow()
+    assert source.lines(0, len(source)) == ["one\n", "two\n", "three\n"]
+    assert not source.follow()
+    source.close()
+
+
+def test_mmap_follow_reports_a_last_line_that_grew(tmp_path):
+    log = tmp_path / "job_1.log"
+    log.write_bytes(b"one\nprogress 10%")
+    source = open_log_source(str(log))
+    source.read_more(1)
+
+    with open(log, "ab") as f:
+        f.write(b" 20%")
+
+    assert source.follow()
+    assert source.line(1) == "progress 10% 20%"
+    source.close()
+
+
+def test_compressed_logs_are_inflated_as_they_are_read(tmp_path):
+    log = tmp_path / "job_1.log.gz"
+    lines = [f"line {i}" for i in range(5000)]
+    # Two gzip members, as left behind by appending to a compressed log.
+    log.write_bytes(
+        gzip.compress("\n".join(lines[:10]).encode() + b"\n")
+        + gzip.compress("\n".join(lines[10:]).encode() + b"\n")
+    )
+
+    source = open_log_source(str(log))
+
+    assert isinstance(source, GzipLogSource)
+    source.read_more(len(lines) + 1)
+    assert source.complete
+    assert source.lines(0, len(source)) == lines
+    assert not source.follow()
+    source.close()
+
+
+def test_remote_compressed_logs_are_inflated_too(mocker: MockerFixture):
+    ssh, _ = remote_file(mocker, gzip.compress(b"one\ntwo\n"))
+    source = RemoteLogSource(ssh, "/logs/job_1.log.gz", chunk_size=8)
+
+    source.read_more(10)
+
+    assert source.lines(0, len(source)) == ["one", "two"]
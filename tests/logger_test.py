@@ -1,18 +1,21 @@
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 from pytest_mock import MockerFixture
 
 from cronboard.services.logging.logger import (
+    LogEntry,
     delete_logs_for_identificator,
+    get_log_entries,
     get_log_files,
-    read_log_file,
 )
 
-from .conftest import ssh_mock_exec_return, ssh_mock_exec_sequence
+from .conftest import ssh_mock_exec_sequence
 
 _LOGGER = "cronboard.services.logging.logger"
 _FAKE_HOME = Path("/fake/home")
+_REMOTE_LOGS = "/home/test/.config/cronboard/logs"
 
 
 def _patch_local_log_discovery(
@@ -27,39 +30,39 @@ def _patch_local_log_discovery(
     mocker.patch(f"{_LOGGER}.LOG_DIR", mock_log_dir)
 
 
-def _patch_logger_path_and_instance(
-    mocker: MockerFixture,
-    *,
-    exists: bool,
-) -> None:
-    mock_cls = mocker.patch(f"{_LOGGER}.Path")
-    fake_path = mocker.Mock()
-    fake_path.exists.return_value = exists
-    mock_cls.return_value = fake_path
-
-
 def test_get_log_files_returns_empty_when_dir_missing(mocker: MockerFixture):
     _patch_local_log_discovery(mocker, dir_exists=False)
 
     assert get_log_files("app1", ssh=None) == {}
 
 
-def test_get_log_files_returns_dict(mocker: MockerFixture):
-    fake_file1 = _FAKE_HOME / ".config/cronboard/logs/app1_log1.log"
-    fake_file2 = _FAKE_HOME / ".config/cronboard/logs/app1_log2.log"
-
-    _patch_local_log_discovery(
-        mocker,
-        dir_exists=True,
-        glob_paths=[fake_file1, fake_file2],
-    )
+def test_get_log_files_returns_dict(mocker: MockerFixture, tmp_path: Path):
+    log_dir = tmp_path / ".config/cronboard/logs"
+    log_dir.mkdir(parents=True)
+    mocker.patch(f"{_LOGGER}.LOG_DIR", log_dir)
+    for name in (
+        "app1_2026-01-02_00-00-00.log",
+        "app1_2026-01-01_00-00-00.log",
+        "app2_2026-01-01_00-00-00.log",
+    ):
+        (log_dir / name).write_text("x", encoding="utf-8")
 
     assert get_log_files("app1", ssh=None) == {
-        "app1_log1": str(fake_file1),
-        "app1_log2": str(fake_file2),
+        "app1_2026-01-01_00-00-00": str(log_dir / "app1_2026-01-01_00-00-00.log"),
+        "app1_2026-01-02_00-00-00": str(log_dir / "app1_2026-01-02_00-00-00.log"),
     }
 
 
+def test_get_log_entries_include_size_and_mtime(mocker: MockerFixture, tmp_path: Path):
+    mocker.patch(f"{_LOGGER}.LOG_DIR", tmp_path)
+    log = tmp_path / "app1_2026-01-01_00-00-00.log"
+    log.write_text("twelve bytes", encoding="utf-8")
+
+    entry = get_log_entries("app1", ssh=None)["app1_2026-01-01_00-00-00"]
+
+    assert entry == LogEntry(str(log), 12, log.stat().st_mtime)
+
+
 def test_get_log_files_returns_empty_dict_when_no_log_files_match_glob(
     mocker: MockerFixture,
 ):
@@ -81,20 +84,20 @@ def test_get_log_files_ssh_returns_empty_when_remote_home_unavailable(
     ("ls_read", "expected"),
     [
         (
-            b"""app1_a.log
-app1_b.log
-app2_c.log
-random.txt
+            b"""120 1760781600.5 app1_2026-01-02_00-00-00.log
+64 1760695200.0 app1_2026-01-01_00-00-00.log
 """,
             {
-                "app1_a": "/home/test/.config/cronboard/logs/app1_a.log",
-                "app1_b": "/home/test/.config/cronboard/logs/app1_b.log",
+                "app1_2026-01-01_00-00-00": (
+                    f"{_REMOTE_LOGS}/app1_2026-01-01_00-00-00.log"
+                ),
+                "app1_2026-01-02_00-00-00": (
+                    f"{_REMOTE_LOGS}/app1_2026-01-02_00-00-00.log"
+                ),
             },
         ),
         (
-            b"""other.log
-file.txt
-""",
+            b"",
             {},
         ),
     ],
@@ -106,78 +109,53 @@ def test_get_log_files_ssh(mocker: MockerFixture, ls_read: bytes, expected: dict
         [(b"/home/test\n", b""), (ls_read, b"")],
     )
 
-    assert get_log_files("app1", ssh=ssh) == expected
-
-
-def test_read_log_file_returns_no_logs_when_missing(mocker: MockerFixture):
-    _patch_logger_path_and_instance(mocker, exists=False)
-
-    assert read_log_file("/fake/path.log", ssh=None) == []
+    result = get_log_files("app1", ssh=ssh)
 
-
-def test_read_log_file_returns_lines(mocker: MockerFixture):
-    _patch_logger_path_and_instance(mocker, exists=True)
-
-    mock_open = mocker.mock_open(read_data="line1\nline2\nline3\n")
-    mocker.patch("builtins.open", mock_open)
-
-    assert read_log_file("/fake/path.log", ssh=None) == [
-        "line1\n",
-        "line2\n",
-        "line3\n",
-    ]
+    assert result == expected
+    assert list(result) == sorted(expected)
 
 
-@pytest.mark.parametrize(
-    ("stdout_read", "stderr_read", "remote_path", "expected"),
-    [
-        (
-            b"line1\nline2\n",
-            b"",
-            "/remote/log.log",
-            ["line1\n", "line2\n"],
-        ),
-        (
-            b"",
-            b"some error",
-            "/remote/missing.log",
-            [],
-        ),
-    ],
-    ids=["success", "missing"],
-)
-def test_read_log_file_ssh(
-    mocker: MockerFixture,
-    stdout_read: bytes,
-    stderr_read: bytes,
-    remote_path: str,
-    expected: list[str],
-):
-    ssh = ssh_mock_exec_return(
+def test_get_log_entries_ssh_filters_on_the_host(mocker: MockerFixture):
+    ssh = ssh_mock_exec_sequence(
         mocker,
-        stdout=stdout_read,
-        stderr=stderr_read,
+        [
+            (b"/home/test\n", b""),
+            (b"120 1760781600.5 app1_2026-01-02_00-00-00.log\n", b""),
+        ],
     )
 
-    assert read_log_file(remote_path, ssh=ssh) == expected
+    entries = get_log_entries("app1", ssh=ssh)
 
-
-def test_read_log_file_ssh_empty_stdout_and_stderr(mocker: MockerFixture):
-    ssh = ssh_mock_exec_return(mocker, stdout=b"", stderr=b"")
-
-    assert read_log_file("/remote/empty.log", ssh=ssh) == []
+    find_cmd = ssh.exec_command.call_args_list[1].args[0]
+    assert "-name 'app1_[0-9][0-9][0-9][0-9]-" in find_cmd
+    assert entries == {
+        "app1_2026-01-02_00-00-00": LogEntry(
+            f"{_REMOTE_LOGS}/app1_2026-01-02_00-00-00.log", 120, 1760781600.5
+        )
+    }
 
 
-def test_read_log_file_ssh_returns_empty_when_stderr_has_noise(
-    mocker: MockerFixture,
-):
-    ssh = ssh_mock_exec_return(
+def test_get_log_entries_ssh_falls_back_to_sftp(mocker: MockerFixture):
+    ssh = ssh_mock_exec_sequence(
         mocker,
-        stdout=b"line\n",
-        stderr=b"warning: cat wrote to stderr\n",
+        [(b"/home/test\n", b""), (b"", b"find: unrecognized: -printf\n")],
     )
+    ssh.open_sftp.return_value = mocker.MagicMock()
+    sftp = ssh.open_sftp.return_value.__enter__.return_value
+    sftp.listdir_attr.return_value = [
+        SimpleNamespace(
+            filename="app1_2026-01-01_00-00-00.log", st_size=10, st_mtime=1760695200
+        ),
+        SimpleNamespace(
+            filename="app2_2026-01-01_00-00-00.log", st_size=20, st_mtime=1760695200
+        ),
+    ]
 
-    assert read_log_file("/remote/log.log", ssh=ssh) == []
+    assert get_log_entries("app1", ssh=ssh) == {
+        "app1_2026-01-01_00-00-00": LogEntry(
+            f"{_REMOTE_LOGS}/app1_2026-01-01_00-00-00.log", 10, 1760695200.0
+        )
+    }
 
 
 def test_delete_logs_for_identificator_local_removes_matching_files(
@@ -186,9 +164,9 @@ def test_delete_logs_for_identificator_local_removes_matching_files(
     log_dir = tmp_path / ".config/cronboard/logs"
     log_dir.mkdir(parents=True)
     mocker.patch(f"{_LOGGER}.LOG_DIR", log_dir)
-    keep = log_dir / "other_job_a.log"
-    remove1 = log_dir / "job1_a.log"
-    remove2 = log_dir / "job1_b.log"
+    keep = log_dir / "other_job_2026-01-01_00-00-00.log"
+    remove1 = log_dir / "job1_2026-01-01_00-00-00.log"
+    remove2 = log_dir / "job1_2026-01-02_00-00-00.log"
     for p in (keep, remove1, remove2):
         p.write_text("x", encoding="utf-8")
 
@@ -215,7 +193,11 @@ def test_delete_logs_for_identificator_remote_runs_rm(
         mocker,
         [
             (b"/home/test\n", b""),
-            (b"app1_a.log\napp1_b.log\n", b""),
+            (
+                b"1 1760695200.0 app1_2026-01-01_00-00-00.log\n"
+                b"1 1760695200.0 app1_2026-01-02_00-00-00.log\n",
+                b"",
+            ),
             (b"", b""),
         ],
     )
@@ -225,5 +207,46 @@ def test_delete_logs_for_identificator_remote_runs_rm(
     assert ssh.exec_command.call_count == 3
     rm_cmd = ssh.exec_command.call_args_list[2][0][0]
     assert rm_cmd.startswith("rm -f -- ")
-    assert "/home/test/.config/cronboard/logs/app1_a.log" in rm_cmd
-    assert "/home/test/.config/cronboard/logs/app1_b.log" in rm_cmd
+    assert f"{_REMOTE_LOGS}/app1_2026-01-01_00-00-00.log" in rm_cmd
+    assert f"{_REMOTE_LOGS}/app1_2026-01-02_00-00-00.log" in rm_cmd
+
+
+def test_get_log_entries_include_compressed_logs(mocker: MockerFixture, tmp_path: Path):
+    mocker.patch(f"{_LOGGER}.LOG_DIR", tmp_path)
+    for name in (
+        "app1_2026-01-01_00-00-00.log.gz",
+        "app1_2026-01-02_00-00-00.log",
+        "app1_2026-01-02_00-00-00.log.out",
+        "app10_2026-01-01_00-00-00.log",
+    ):
+        (tmp_path / name).write_text("x", encoding="utf-8")
+
+    assert get_log_files("app1", ssh=None) == {
+        "app1_2026-01-01_00-00-00": str(tmp_path / "app1_2026-01-01_00-00-00.log.gz"),
+        "app1_2026-01-02_00-00-00": str(tmp_path / "app1_2026-01-02_00-00-00.log"),
+    }
+
+
+def test_logs_of_a_job_whose_id_extends_another_are_kept_apart(
+    mocker: MockerFixture, tmp_path: Path
+):
+    mocker.patch(f"{_LOGGER}.LOG_DIR", tmp_path)
+    for name in (
+        "backup_2026-01-01_00-00-00.log",
+        "backup_daily_2026-01-01_00-00-00.log",
+        "backup_daily_2026-01-02_00-00-00.log.gz",
+    ):
+        (tmp_path / name).write_text("x", encoding="utf-8")
+
+    assert list(get_log_files("backup", ssh=None)) == ["backup_2026-01-01_00-00-00"]
+    assert list(get_log_files("backup_daily", ssh=None)) == [
+        "backup_daily_2026-01-01_00-00-00",
+        "backup_daily_2026-01-02_00-00-00",
+    ]
+
+    delete_logs_for_identificator("backup", ssh=None)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "backup_daily_2026-01-01_00-00-00.log",
+        "backup_daily_2026-01-02_00-00-00.log.gz",
+    ]
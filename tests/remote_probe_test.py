@@ -0,0 +1,100 @@
+import subprocess
+
+import pytest
+from pytest_mock import MockerFixture
+
+from cronboard.services.host_facts import host_facts
+from cronboard.services.logging import cron_wrapper
+from cronboard.services.remote_probe import (
+    build_probe_script,
+    parse_probe_output,
+    probe_host,
+)
+from cronboard.widgets.CronTable import CronTable
+
+PROBE_OUTPUT = (
+    "@cronboard-home\n/home/deploy\n"
+    "@cronboard-bash\n/usr/bin/bash\n"
+    "@cronboard-wrapper\nOK\n" + "ab" * 32 + "\n"
+    "@cronboard-crontab 0\n"
+    "# backup\n0 1 * * * /usr/bin/backup\n@cronboard-home"
+)
+
+
+def make_ssh(mocker: MockerFixture, output: str):
+    ssh = mocker.MagicMock()
+    stdout = mocker.MagicMock()
+    stdout.read.return_value = output.encode()
+    ssh.exec_command.return_value = (None, stdout, mocker.MagicMock())
+    return ssh
+
+
+def test_parse_probe_output():
+    probe = parse_probe_output(PROBE_OUTPUT)
+
+    assert probe.home == "/home/deploy"
+    assert probe.bash_path == "/usr/bin/bash"
+    assert probe.wrapper_installed is True
+    assert probe.wrapper_checksum == "ab" * 32
+    assert probe.crontab_status == 0
+    # Crontab content is taken verbatim, even lines looking like headers.
+    assert probe.crontab == "# backup\n0 1 * * * /usr/bin/backup\n@cronboard-home\n"
+
+
+def test_parse_probe_output_without_crontab():
+    probe = parse_probe_output(
+        "@cronboard-home\n/root\n@cronboard-bash\n@cronboard-wrapper\nMISSING\n"
+        "@cronboard-crontab 1\n"
+    )
+
+    assert probe.bash_path == "/bin/bash"
+    assert probe.wrapper_installed is False
+    assert probe.wrapper_checksum == ""
+    assert probe.crontab_status == 1
+    assert probe.crontab == ""
+
+
+def test_parse_probe_output_rejects_truncated_output():
+    with pytest.raises(ValueError):
+        parse_probe_output("@cronboard-home\n/root\n")
+
+
+def test_probe_script_runs_in_posix_shell(tmp_path):
+    output = subprocess.run(
+        ["sh", "-c", build_probe_script()],
+        capture_output=True,
+        text=True,
+        env={"HOME": str(tmp_path), "PATH": "/usr/bin:/bin"},
+    ).stdout
+
+    probe = parse_probe_output(output)
+
+    assert probe.home == str(tmp_path)
+    assert probe.wrapper_installed is False
+    assert "logs" not in build_probe_script()
+
+
+def test_probe_script_quotes_crontab_user():
+    assert "crontab -u 'www data' -l" in build_probe_script("www data")
+
+
+def test_probe_answers_later_lookups_without_round_trips(mocker: MockerFixture):
+    ssh = make_ssh(mocker, PROBE_OUTPUT)
+
+    probe_host(ssh, "deploy")
+    ssh.exec_command.reset_mock()
+
+    assert host_facts.get(ssh, "home") == "/home/deploy"
+    assert cron_wrapper.get_remote_home(ssh) == "/home/deploy"
+    assert cron_wrapper.get_remote_bash_path(ssh) == "/usr/bin/bash"
+    assert cron_wrapper.is_wrapper_installed_remote(ssh) is True
+    ssh.exec_command.assert_not_called()
+
+
+def test_fetch_remote_crontab_is_a_single_round_trip(mocker: MockerFixture):
+    ssh = make_ssh(mocker, PROBE_OUTPUT)
+
+    cron = CronTable.fetch_remote_crontab(ssh, "deploy")
+
+    ssh.exec_command.assert_called_once()
+    assert [job.command for job in cron] == ["/usr/bin/backup"]
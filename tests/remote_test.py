@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from pytest_mock import MockerFixture
+
+from cronboard.services import remote
+from cronboard.services.remote import RemoteExecutor, crontab_write_command, run_sync
+
+from .conftest import make_remote_command, ssh_mock_exec_return
+
+
+def test_crontab_write_command_targets_user():
+    assert crontab_write_command() == "crontab -"
+    assert crontab_write_command("alice") == "crontab -u alice -"
+    assert crontab_write_command("www data") == "crontab -u 'www data' -"
+
+
+def test_run_sync_returns_output_and_status(mocker: MockerFixture):
+    ssh = ssh_mock_exec_return(mocker, stdout=b"hello\n", stderr=b"")
+    _, stdout, _ = ssh.exec_command.return_value
+    stdout.channel.recv_exit_status.return_value = 0
+
+    result = run_sync(ssh, "echo hello")
+
+    assert result.ok
+    assert result.stdout == "hello\n"
+    ssh.exec_command.assert_called_once_with("echo hello")
+
+
+@pytest.mark.asyncio
+async def test_write_stdin_sends_data_and_reports_errors(mocker: MockerFixture):
+    stdin, _, ssh = make_remote_command(
+        mocker, stderr_output=b"bad minute\n", exit_status=1
+    )
+
+    result = await remote.write_stdin(ssh, "crontab -", "* * * * * ls\n")
+
+    stdin.write.assert_called_once_with("* * * * * ls\n")
+    stdin.channel.shutdown_write.assert_called_once()
+    assert not result.ok
+    assert result.stderr == "bad minute"
+
+
+@pytest.mark.asyncio
+async def test_calls_overlap_across_hosts_but_not_beyond_host_limit(
+    mocker: MockerFixture,
+):
+    executor = RemoteExecutor(max_workers=8, max_per_host=1)
+    host_a, host_b = mocker.Mock(), mocker.Mock()
+    active: dict[int, int] = {}
+    peak: dict[int, int] = {}
+    lock = threading.Lock()
+
+    def slow(ssh):
+        with lock:
+            active[id(ssh)] = active.get(id(ssh), 0) + 1
+            peak[id(ssh)] = max(peak.get(id(ssh), 0), active[id(ssh)])
+        time.sleep(0.05)
+        with lock:
+            active[id(ssh)] -= 1
+
+    started = time.monotonic()
+    await asyncio.gather(
+        *(executor.call(ssh, slow, ssh) for ssh in (host_a, host_a, host_b, host_b))
+    )
+    elapsed = time.monotonic() - started
+    executor.shutdown()
+
+    assert peak == {id(host_a): 1, id(host_b): 1}
+    # Two hosts in parallel, two calls each in sequence: about 0.1s, not 0.2s.
+    assert elapsed < 0.18
+
+
+class DroppableSSH:
+    """Stands in for an SSH client whose link can drop and come back."""
+
+    def __init__(self):
+        self.connected = True
+        self.reconnects = 0
+
+    def get_transport(self):
+        return self
+
+    def is_active(self):
+        return self.connected
+
+    def reconnect(self):
+        time.sleep(0.05)
+        self.reconnects += 1
+        self.connected = True
+
+
+@pytest.mark.asyncio
+async def test_calls_on_a_dropped_session_are_replayed_after_reconnect():
+    ssh = DroppableSSH()
+    executor = RemoteExecutor(reconnector=DroppableSSH.reconnect, backoff=(0.0,))
+    attempts = []
+
+    def command(name):
+        attempts.append(name)
+        if not ssh.connected:
+            raise EOFError("link down")
+        return name
+
+    ssh.connected = False
+    results = await asyncio.gather(
+        executor.call(ssh, command, "a"), executor.call(ssh, command, "b")
+    )
+    executor.shutdown()
+
+    assert results == ["a", "b"]
+    assert ssh.reconnects == 1
+    assert attempts.count("a") == 2 and attempts.count("b") == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_on_a_live_session_are_not_retried(mocker: MockerFixture):
+    ssh = DroppableSSH()
+    reconnector = mocker.Mock()
+    executor = RemoteExecutor(reconnector=reconnector, backoff=(0.0,))
+
+    with pytest.raises(ValueError):
+        await executor.call(ssh, mocker.Mock(side_effect=ValueError("bad")))
+    executor.shutdown()
+
+    reconnector.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_gives_up_after_backoff(mocker: MockerFixture):
+    ssh = DroppableSSH()
+    ssh.connected = False
+    reconnector = mocker.Mock(side_effect=OSError("no route to host"))
+    executor = RemoteExecutor(reconnector=reconnector, backoff=(0.0, 0.0, 0.0))
+
+    assert not await executor.reconnect(ssh)
+    executor.shutdown()
+
+    assert reconnector.call_count == 3
@@ -0,0 +1,142 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from cronboard.config import WRAPPER_SOURCE
+from cronboard.services.logging.retention import (
+    RetentionPolicy,
+    enforce_retention,
+    load_policies,
+    parse_policies,
+    policy_for,
+    render_policies,
+    set_policy,
+)
+
+from .conftest import ssh_mock_exec_return
+
+_RETENTION = "cronboard.services.logging.retention"
+_DAY = 24 * 60 * 60
+
+
+@pytest.fixture
+def retention_file(mocker: MockerFixture, tmp_path: Path) -> Path:
+    path = tmp_path / "retention.conf"
+    mocker.patch(f"{_RETENTION}.RETENTION_FILE", path)
+    return path
+
+
+def test_policies_round_trip_through_the_file_format():
+    policies = {
+        "backup": RetentionPolicy(200, 90, 7),
+        "*": RetentionPolicy(max_age_days=30),
+        "cleared": RetentionPolicy(),
+    }
+
+    text = render_policies(policies)
+
+    assert "* - 30 -\n" in text
+    assert "cleared" not in text
+    assert parse_policies(text + "broken line\nbad -1 2 3\n") == {
+        "backup": RetentionPolicy(200, 90, 7),
+        "*": RetentionPolicy(max_age_days=30),
+    }
+
+
+def test_policy_for_falls_back_to_the_default_line():
+    policies = {"*": RetentionPolicy(max_count=10), "etl": RetentionPolicy(5)}
+
+    assert policy_for(policies, "etl") == RetentionPolicy(5)
+    assert policy_for(policies, "other") == RetentionPolicy(max_count=10)
+    assert policy_for({}, "other").is_empty
+
+
+def test_set_policy_adds_and_removes_a_job_line(retention_file: Path):
+    set_policy("etl", RetentionPolicy(5, None, 2))
+    assert load_policies() == {"etl": RetentionPolicy(5, None, 2)}
+
+    set_policy("etl", RetentionPolicy())
+    assert load_policies() == {}
+    assert retention_file.read_text().startswith("#")
+
+
+def test_enforce_retention_runs_the_wrapper_maintenance_mode(
+    mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    retention_file = tmp_path / "retention.conf"
+    mocker.patch(f"{_RETENTION}.RETENTION_FILE", retention_file)
+    mocker.patch(f"{_RETENTION}.install_wrapper", return_value=str(WRAPPER_SOURCE))
+    monkeypatch.setenv("CRONBOARD_LOG_DIR", str(log_dir))
+    monkeypatch.setenv("CRONBOARD_RETENTION_FILE", str(retention_file))
+    now = time.time()
+    for age in range(1, 6):
+        log = log_dir / f"etl_2026-01-0{6 - age}_00-00-00.log"
+        log.write_text(f"run {age} days ago\n")
+        os.utime(log, (now - age * _DAY - 60, now - age * _DAY - 60))
+    other = log_dir / "other_2026-01-01_00-00-00.log"
+    other.write_text("untouched\n")
+    set_policy(
+        "etl", RetentionPolicy(max_count=3, max_age_days=4, compress_after_days=2)
+    )
+
+    result = enforce_retention(["etl", "other"])
+
+    assert result.ok
+    assert sorted(p.name for p in log_dir.iterdir()) == [
+        "etl_2026-01-03_00-00-00.log.gz",
+        "etl_2026-01-04_00-00-00.log.gz",
+        "etl_2026-01-05_00-00-00.log",
+        "other_2026-01-01_00-00-00.log",
+    ]
+
+
+def test_enforce_retention_leaves_jobs_whose_id_extends_the_job_alone(
+    mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    retention_file = tmp_path / "retention.conf"
+    mocker.patch(f"{_RETENTION}.RETENTION_FILE", retention_file)
+    mocker.patch(f"{_RETENTION}.install_wrapper", return_value=str(WRAPPER_SOURCE))
+    monkeypatch.setenv("CRONBOARD_LOG_DIR", str(log_dir))
+    monkeypatch.setenv("CRONBOARD_RETENTION_FILE", str(retention_file))
+    old = time.time() - 10 * _DAY
+    for job in ("backup", "backup_daily", "back*"):
+        for day in (1, 2):
+            log = log_dir / f"{job}_2026-01-0{day}_00-00-00.log"
+            log.write_text("run\n")
+            os.utime(log, (old + day * 60, old + day * 60))
+    set_policy("backup", RetentionPolicy(max_count=1, compress_after_days=1))
+    set_policy("back*", RetentionPolicy(max_age_days=1))
+
+    result = enforce_retention(["backup", "back*"])
+
+    assert result.ok
+    assert sorted(p.name for p in log_dir.iterdir()) == [
+        "backup_2026-01-02_00-00-00.log.gz",
+        "backup_daily_2026-01-01_00-00-00.log",
+        "backup_daily_2026-01-02_00-00-00.log",
+    ]
+
+
+def test_enforce_retention_remote_runs_the_installed_wrapper(mocker: MockerFixture):
+    mocker.patch(
+        f"{_RETENTION}.install_wrapper",
+        return_value="/home/test/.config/cronboard/cron-wrapper.sh",
+    )
+    mocker.patch(f"{_RETENTION}.get_remote_bash_path", return_value="/bin/bash")
+    ssh = ssh_mock_exec_return(mocker)
+    _, stdout, _ = ssh.exec_command.return_value
+    stdout.channel.recv_exit_status.return_value = 0
+
+    result = enforce_retention(["etl job"], ssh)
+
+    assert result.ok
+    ssh.exec_command.assert_called_once_with(
+        "/bin/bash /home/test/.config/cronboard/cron-wrapper.sh --retention 'etl job'"
+    )
@@ -0,0 +1,61 @@
+from datetime import datetime
+
+import pytest
+from pytest_mock import MockerFixture
+
+import cronboard.services.schedule_cache as mod
+from cronboard.services.schedule_cache import ScheduleCache
+
+_NOW = datetime(2030, 1, 1, 12, 2)
+
+
+def test_runs_around_returns_prev_and_next():
+    cache = ScheduleCache()
+
+    prev_run, next_run = cache.runs_around("*/5 * * * *", _NOW)
+
+    assert prev_run == datetime(2030, 1, 1, 12, 0)
+    assert next_run == datetime(2030, 1, 1, 12, 5)
+
+
+def test_next_and_prev_run_do_not_advance_shared_schedule():
+    cache = ScheduleCache()
+
+    assert cache.next_run("0 * * * *", _NOW) == datetime(2030, 1, 1, 13, 0)
+    assert cache.next_run("0 * * * *", _NOW) == datetime(2030, 1, 1, 13, 0)
+    assert cache.prev_run("0 * * * *", _NOW) == datetime(2030, 1, 1, 12, 0)
+
+
+def test_expression_is_parsed_once(mocker: MockerFixture):
+    cache = ScheduleCache()
+    compile_spy = mocker.spy(mod, "croniter")
+
+    for _ in range(50):
+        cache.runs_around("*/5 * * * *", _NOW)
+    cache.runs_around("0 0 * * *", _NOW)
+
+    assert compile_spy.call_count == 2
+    assert cache.misses == 2
+    assert cache.hits == 49
+
+
+def test_least_recently_used_expression_is_evicted():
+    cache = ScheduleCache(maxsize=2)
+
+    cache.validate("1 * * * *")
+    cache.validate("2 * * * *")
+    cache.validate("1 * * * *")
+    cache.validate("3 * * * *")
+
+    assert len(cache) == 2
+    assert "1 * * * *" in cache._schedules
+    assert "2 * * * *" not in cache._schedules
+
+
+def test_invalid_expression_raises_value_error_and_is_not_cached():
+    cache = ScheduleCache()
+
+    with pytest.raises(ValueError):
+        cache.validate("61 * * * *")
+
+    assert len(cache) == 0
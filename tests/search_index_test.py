@@ -0,0 +1,66 @@
+from cronboard.services.search_index import RowSearchIndex
+
+
+def make_rows():
+    return [
+        ("Backup-DB", "0 2 * * *", "pg_dump prod", "True"),
+        ("rotate", "*/5 * * * *", "logrotate /etc/app", "False"),
+        ("report", "0 8 * * 1", "python report.py", "False"),
+    ]
+
+
+def test_search_is_case_insensitive_across_fields():
+    index = RowSearchIndex(make_rows())
+
+    assert index.search("BACKUP") == [0]
+    assert index.search("*/5") == [1]
+    assert index.search("report") == [2]
+    assert index.search("o") == [0, 1, 2]
+
+
+def test_search_ignores_columns_outside_search_fields():
+    index = RowSearchIndex(make_rows())
+
+    assert index.search("true") == []
+
+
+def test_query_does_not_match_across_field_boundary():
+    index = RowSearchIndex(make_rows())
+
+    assert index.search("db0") == []
+
+
+def test_extended_query_only_rechecks_previous_matches():
+    index = RowSearchIndex(make_rows())
+    assert index.search("r") == [0, 1, 2]
+    index.search("ro")
+
+    index._haystacks[2] = "ro-but-not-rechecked"
+    assert index.search("rot") == [1]
+
+
+def test_trigram_index_narrows_large_tables():
+    rows = [(f"job-{i}", "* * * * *", f"echo {i}") for i in range(50)]
+    index = RowSearchIndex(rows, trigram_threshold=10)
+
+    assert index.search("b-4") == [4] + list(range(40, 50))
+    assert index._trigrams is not None
+    assert index.search("zzz") == []
+
+
+def test_trigram_search_matches_linear_scan():
+    rows = [(f"job-{i}", f"{i % 7} * * * *", f"run --n {i * 13}") for i in range(200)]
+    indexed = RowSearchIndex(rows, trigram_threshold=1)
+    linear = RowSearchIndex(rows, trigram_threshold=10_000)
+
+    for query in ("job-1", "run --n 1", "3 * *", "n 26", "-19"):
+        indexed._last_query = linear._last_query = ""
+        assert indexed.search(query) == linear.search(query)
+
+
+def test_empty_query_resets_narrowing():
+    index = RowSearchIndex(make_rows())
+    index.search("backup")
+
+    assert index.search("") == []
+    assert index.search("r") == [0, 1, 2]
@@ -0,0 +1,250 @@
+import threading
+import time
+
+import paramiko
+import pytest
+from pytest_mock import MockerFixture
+
+from cronboard.services.ssh_pool import (
+    SSHSessionPool,
+    TransportOptions,
+    parse_size,
+    ping,
+    session_key,
+)
+
+from .conftest import FakeClock
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def factory(mocker: MockerFixture):
+    def make_client():
+        client = mocker.MagicMock(spec=paramiko.SSHClient)
+        client.get_transport.return_value.is_active.return_value = True
+        return client
+
+    return mocker.MagicMock(side_effect=make_client)
+
+
+def make_pool(factory, clock, **kwargs):
+    return SSHSessionPool(client_factory=factory, clock=clock, **kwargs)
+
+
+def test_same_host_and_user_share_one_session(factory, clock):
+    pool = make_pool(factory, clock)
+
+    first = pool.acquire("db", "22", "deploy")
+    second = pool.acquire("db", 22, "deploy")
+
+    assert first is second
+    factory.assert_called_once()
+    first.connect.assert_called_once_with(hostname="db", port=22, username="deploy")
+
+
+def test_switching_back_reuses_released_session(factory, clock):
+    pool = make_pool(factory, clock)
+    a = pool.acquire("a", 22, "u", password="secret")
+    pool.release(a)
+    b = pool.acquire("b", 22, "u")
+    pool.release(b)
+
+    assert pool.acquire("a", 22, "u") is a
+    assert factory.call_count == 2
+    a.close.assert_not_called()
+
+
+def test_idle_sessions_expire_after_ttl(factory, clock):
+    pool = make_pool(factory, clock, idle_ttl=10)
+    held = pool.acquire("held", 22, "u")
+    idle = pool.acquire("idle", 22, "u")
+    pool.release(idle)
+
+    clock.now = 11
+    pool.prune()
+
+    idle.close.assert_called_once()
+    held.close.assert_not_called()
+    assert session_key("idle", 22, "u") not in pool
+    assert session_key("held", 22, "u") in pool
+
+
+def test_cap_evicts_least_recently_released_idle_session(factory, clock):
+    pool = make_pool(factory, clock, max_sessions=2)
+    old = pool.acquire("old", 22, "u")
+    pool.release(old)
+    clock.now = 1
+    newer = pool.acquire("newer", 22, "u")
+    pool.release(newer)
+
+    pool.acquire("third", 22, "u")
+
+    old.close.assert_called_once()
+    newer.close.assert_not_called()
+    assert len(pool) == 2
+
+
+def test_dead_session_is_replaced(factory, clock):
+    pool = make_pool(factory, clock)
+    dead = pool.acquire("a", 22, "u")
+    pool.release(dead)
+    dead.get_transport.return_value.is_active.return_value = False
+
+    fresh = pool.acquire("a", 22, "u")
+
+    assert fresh is not dead
+    dead.close.assert_called_once()
+
+
+def test_failed_connect_closes_client_and_is_not_pooled(factory, clock):
+    pool = make_pool(factory, clock)
+    client = factory.side_effect()
+    client.connect.side_effect = paramiko.AuthenticationException()
+    factory.side_effect = None
+    factory.return_value = client
+
+    with pytest.raises(paramiko.AuthenticationException):
+        pool.acquire("a", 22, "u", password="wrong")
+
+    client.close.assert_called_once()
+    assert len(pool) == 0
+
+
+def test_discard_and_close_all(factory, clock):
+    pool = make_pool(factory, clock)
+    a = pool.acquire("a", 22, "u")
+    b = pool.acquire("b", 22, "u")
+
+    pool.discard(a)
+    a.close.assert_called_once()
+    assert len(pool) == 1
+
+    pool.close_all()
+    b.close.assert_called_once()
+    assert len(pool) == 0
+
+
+def test_connect_timeout_is_passed_to_new_sessions(factory, clock):
+    pool = make_pool(factory, clock)
+
+    client = pool.acquire("db", 22, "deploy", timeout=5)
+
+    client.connect.assert_called_once_with(
+        hostname="db",
+        port=22,
+        username="deploy",
+        timeout=5,
+        banner_timeout=5,
+        auth_timeout=5,
+        channel_timeout=5,
+    )
+
+
+def test_new_sessions_send_keepalives(factory, clock):
+    pool = make_pool(factory, clock, keepalive=15)
+
+    client = pool.acquire("db", 22, "deploy")
+
+    client.get_transport.return_value.set_keepalive.assert_called_once_with(15)
+
+
+def test_reconnect_reopens_the_same_client(factory, clock):
+    pool = make_pool(factory, clock)
+    client = pool.acquire("db", 22, "deploy", password="secret")
+    client.connect.reset_mock()
+
+    pool.reconnect(client, timeout=3)
+
+    client.close.assert_called_once()
+    client.connect.assert_called_once_with(
+        hostname="db",
+        port=22,
+        username="deploy",
+        password="secret",
+        timeout=3,
+        banner_timeout=3,
+        auth_timeout=3,
+        channel_timeout=3,
+    )
+    assert pool.acquire("db", 22, "deploy") is client
+    factory.assert_called_once()
+
+
+def test_reconnect_refuses_clients_outside_the_pool(factory, clock, mocker):
+    pool = make_pool(factory, clock)
+
+    with pytest.raises(paramiko.SSHException):
+        pool.reconnect(mocker.Mock())
+
+
+def test_ping_fails_on_closed_transport(mocker: MockerFixture):
+    client = mocker.Mock()
+    client.get_transport.return_value.is_active.return_value = False
+
+    with pytest.raises(paramiko.SSHException):
+        ping(client)
+
+    client.get_transport.return_value.is_active.return_value = True
+    assert ping(client) >= 0
+
+
+def test_ping_closes_a_half_open_transport_after_timeout(mocker: MockerFixture):
+    closed = threading.Event()
+    transport = mocker.Mock()
+    transport.is_active.side_effect = lambda: not closed.is_set()
+    transport.close.side_effect = closed.set
+    # Like paramiko, the wait for the answer ends once the transport closes.
+    transport.global_request.side_effect = lambda *args, **kwargs: closed.wait(5)
+    client = mocker.Mock()
+    client.get_transport.return_value = transport
+
+    started = time.monotonic()
+    with pytest.raises(paramiko.SSHException):
+        ping(client, timeout=0.05)
+
+    assert time.monotonic() - started < 1
+    transport.close.assert_called_once()
+
+
+def test_parse_size_accepts_units():
+    assert parse_size("32768") == 32768
+    assert parse_size("32K") == 32 * 1024
+    assert parse_size("8mb") == 8 * 1024**2
+    with pytest.raises(ValueError):
+        parse_size("lots")
+
+
+def test_transport_options_round_trip_config():
+    config = {"compression": True, "ciphers": ["aes256-ctr"], "window_size": "4M"}
+    options = TransportOptions.from_config(config)
+
+    assert options.window_size == 4 * 1024**2
+    assert options.to_config() == {
+        "compression": True,
+        "ciphers": ["aes256-ctr"],
+        "window_size": 4 * 1024**2,
+    }
+    assert TransportOptions.from_config(None).to_config() == {}
+    with pytest.raises(ValueError):
+        TransportOptions(window_size=10)
+
+
+def test_transport_options_are_applied_on_connect(factory, clock, mocker):
+    pool = make_pool(factory, clock)
+    options = TransportOptions(
+        compression=True, ciphers=("aes256-gcm@openssh.com",), window_size=8 * 1024**2
+    )
+
+    client = pool.acquire("far", 22, "u", transport=options)
+
+    kwargs = client.connect.call_args.kwargs
+    assert kwargs["compress"] is True
+    transport = kwargs["transport_factory"](mocker.Mock(), disabled_algorithms=None)
+    assert transport.default_window_size == 8 * 1024**2
+    assert transport.get_security_options().ciphers[0] == "aes256-gcm@openssh.com"
+    # Other options mean another session, even for the same host and user.
+    assert pool.acquire("far", 22, "u") is not client
@@ -0,0 +1,126 @@
+import base64
+import subprocess
+
+import pytest
+from pytest_mock import MockerFixture
+
+from cronboard.services import system_crontabs as mod
+from cronboard.services.system_crontabs import (
+    CrontabFileCache,
+    build_remote_script,
+    parse_remote_listing,
+    read_local_crontabs,
+    read_remote_crontabs,
+    source_for_path,
+)
+
+SYSTEM_TAB = "*/5 * * * * root /usr/bin/backup # backup\n"
+USER_TAB = "0 1 * * * echo nightly # nightly\n"
+
+
+@pytest.fixture
+def cron_dirs(tmp_path, monkeypatch):
+    etc = tmp_path / "etc"
+    cron_d = etc / "cron.d"
+    spool = tmp_path / "spool"
+    cron_d.mkdir(parents=True)
+    spool.mkdir()
+    (etc / "crontab").write_text(SYSTEM_TAB)
+    (cron_d / "php").write_text("0 * * * * www-data php cron.php\n")
+    (cron_d / "php.dpkg-old").write_text("0 * * * * root old\n")
+    (spool / "alice").write_text(USER_TAB)
+
+    monkeypatch.setattr(mod, "SYSTEM_CRONTAB", str(etc / "crontab"))
+    monkeypatch.setattr(mod, "CRON_D_DIR", str(cron_d))
+    monkeypatch.setattr(mod, "USER_SPOOL_DIRS", (str(spool), str(tmp_path / "none")))
+    return tmp_path
+
+
+def test_source_for_path_labels():
+    assert source_for_path("/etc/crontab") == ("/etc/crontab", "/etc/crontab", True)
+    assert source_for_path("/etc/cron.d/php").label == "cron.d/php"
+    assert source_for_path("/var/spool/cron/crontabs/bob") == (
+        "user:bob",
+        "/var/spool/cron/crontabs/bob",
+        False,
+    )
+
+
+def test_read_local_crontabs_merges_all_sources(cron_dirs):
+    result = read_local_crontabs(CrontabFileCache())
+
+    assert [source.label for source, _ in result.tabs] == [
+        str(cron_dirs / "etc" / "crontab"),
+        "cron.d/php",
+        "user:alice",
+    ]
+    system_job = next(iter(result.tabs[0][1]))
+    assert system_job.user == "root"
+    assert system_job.command == "/usr/bin/backup"
+    user_job = next(iter(result.tabs[2][1]))
+    assert user_job.command == "echo nightly"
+    assert result.skipped == []
+
+
+def test_read_local_crontabs_reuses_unchanged_files(cron_dirs, mocker: MockerFixture):
+    cache = CrontabFileCache()
+    read_local_crontabs(cache)
+    parse = mocker.spy(mod, "parse_crontab")
+
+    read_local_crontabs(cache)
+    parse.assert_not_called()
+
+    (cron_dirs / "spool" / "alice").write_text(USER_TAB + "0 2 * * * echo more\n")
+    read_local_crontabs(cache)
+    assert parse.call_count == 1
+
+
+def test_read_local_crontabs_forgets_deleted_files(cron_dirs):
+    cache = CrontabFileCache()
+    read_local_crontabs(cache)
+    (cron_dirs / "spool" / "alice").unlink()
+
+    result = read_local_crontabs(cache)
+
+    assert len(result.tabs) == 2
+    assert len(cache) == 2
+
+
+def test_remote_script_sends_only_changed_files(cron_dirs):
+    cache = CrontabFileCache()
+    first = subprocess.run(
+        ["sh", "-c", build_remote_script({})], capture_output=True, text=True
+    ).stdout
+    parse_remote_listing(first, "host", cache)
+
+    second = subprocess.run(
+        ["sh", "-c", build_remote_script(cache.stamps("host"))],
+        capture_output=True,
+        text=True,
+    ).stdout
+    result = parse_remote_listing(second, "host", cache)
+
+    assert first.count("\n+") + first.startswith("+") == 3
+    assert all(line.startswith("=") for line in second.splitlines())
+    assert [source.label for source, _ in result.tabs][1:] == [
+        "cron.d/php",
+        "user:alice",
+    ]
+
+
+def test_read_remote_crontabs_single_round_trip(mocker: MockerFixture):
+    ssh = mocker.MagicMock()
+    ssh.get_transport.return_value.getpeername.return_value = ("10.0.0.1", 22)
+    encoded = base64.b64encode(SYSTEM_TAB.encode()).decode()
+    stdout = mocker.MagicMock()
+    stdout.read.return_value = (
+        f"+1700000000.42 /etc/crontab\n{encoded}\n!/var/spool/cron/crontabs/root\n"
+    ).encode()
+    ssh.exec_command.return_value = (None, stdout, None)
+
+    result = read_remote_crontabs(ssh, CrontabFileCache())
+
+    ssh.exec_command.assert_called_once()
+    assert result.tabs[0][0].label == "/etc/crontab"
+    assert next(iter(result.tabs[0][1])).user == "root"
+    assert result.skipped == [("/var/spool/cron/crontabs/root", "Permission denied")]